@@ -0,0 +1,66 @@
+# If installing as a package comment out the modification to sys.path:
+import sys
+import os
+# Ensure the src/ directory is in the import path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+# Imports
+import argparse
+import shutil
+import tempfile
+from renderer import *
+
+DEFAULT_MODEL = os.path.join(os.path.dirname(__file__), "..", "tests", "test_data", "test_model.glb")
+
+def benchmark_engines(model_path: str, frames: int, resolution: int, samples: int) -> list:
+    """Render the same orbit path with every engine tier.
+    
+    Args:
+        model_path: Path to the 3D model file
+        frames: Number of frames in the orbit path
+        resolution: Output resolution in pixels
+        samples: Samples per frame (Cycles and EEVEE)
+        
+    Returns:
+        list: (requested engine, engine used, seconds per frame) for each tier
+    """
+    results = []
+    for engine in RenderEngine:
+        output_dir = tempfile.mkdtemp(prefix=f"bench_engine_{engine.value}_")
+        renderer = ModelRenderer(
+            render_config=RenderConfig(
+                resolution=resolution, samples=samples, device="CPU", engine=engine
+            ),
+            lighting_config=LightingConfig(light_setup=LightSetup.OVERHEAD, light_type=LightType.SUN),
+            camera_config=CameraConfig(
+                distance=20,
+                camera_path_type=CameraPathType.ORBIT,
+                camera_density=frames
+            )
+        )
+        try:
+            renderer.render(model_path, output_dir)
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+        stats = renderer.get_render_stats()
+        latency = stats['render_time'] / max(stats['successful_renders'], 1)
+        results.append((engine.value, stats['engine'], latency))
+    return results
+
+# --- Execution ---
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-frame latency of the render engine tiers.")
+    parser.add_argument("model_path", type=str, nargs="?", default=DEFAULT_MODEL,
+                        help="Path to the 3D model file (default: tests/test_data/test_model.glb).")
+    parser.add_argument("--frames", type=int, default=8, help="Number of frames in the orbit path.")
+    parser.add_argument("--resolution", type=int, default=256, help="Output resolution in pixels.")
+    parser.add_argument("--samples", type=int, default=64, help="Samples per frame.")
+    args = parser.parse_args()
+
+    results = benchmark_engines(args.model_path, args.frames, args.resolution, args.samples)
+
+    print(f"{'engine':>10} {'used':>10} {'s/frame':>10}")
+    for engine, used, latency in results:
+        print(f"{engine:>10} {used:>10} {latency:>10.3f}")
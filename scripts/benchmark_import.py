@@ -0,0 +1,93 @@
+# If installing as a package comment out the modification to sys.path:
+import sys
+import os
+# Ensure the src/ directory is in the import path
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Imports
+import argparse
+import resource
+import statistics
+import subprocess
+
+def import_time(module: str) -> dict:
+    """Import a module in a fresh interpreter under ``python -X importtime``.
+
+    Args:
+        module: Dotted name of the module to import
+
+    Returns:
+        dict: Total import time in ms, per-module self times in ms, and
+            whether Blender (bpy) was loaded
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         f"import sys, {module}; print('bpy' in sys.modules)"],
+        capture_output=True, text=True, env=env, check=True
+    )
+    self_times = {}
+    total = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        self_times[name.strip()] = int(self_us) / 1000
+        if name.strip() == module:
+            total = int(cumulative_us) / 1000
+    return {
+        'total_ms': total,
+        'self_ms': self_times,
+        'bpy_loaded': result.stdout.strip().endswith("True"),
+    }
+
+def benchmark_import(module: str, runs: int) -> dict:
+    """Time the import of a module over several fresh interpreters.
+
+    Args:
+        module: Dotted name of the module to import
+        runs: Number of interpreters to start
+
+    Returns:
+        dict: Median and best total import time, the slowest modules of the
+            last run, whether bpy was loaded and the peak child memory in MB
+    """
+    results = [import_time(module) for _ in range(runs)]
+    totals = [r['total_ms'] for r in results]
+    slowest = sorted(results[-1]['self_ms'].items(), key=lambda item: -item[1])[:10]
+    return {
+        'median_ms': statistics.median(totals),
+        'best_ms': min(totals),
+        'slowest': slowest,
+        'bpy_loaded': any(r['bpy_loaded'] for r in results),
+        # Linux reports kilobytes
+        'peak_memory_mb': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+# --- Execution ---
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the startup time of importing the path-planning layer."
+    )
+    parser.add_argument("module", nargs="?", default="renderer.camera", help="Module to import.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters.")
+    parser.add_argument(
+        "--max-ms", type=float, default=None,
+        help="Fail (exit code 1) if the median import time exceeds this."
+    )
+    args = parser.parse_args()
+
+    result = benchmark_import(args.module, args.runs)
+    print(f"import {args.module}: median {result['median_ms']:.1f} ms, best {result['best_ms']:.1f} ms")
+    print(f"bpy loaded: {result['bpy_loaded']}, peak memory: {result['peak_memory_mb']:.0f} MB")
+    print(f"{'self (ms)':>10}  module")
+    for name, self_ms in result['slowest']:
+        print(f"{self_ms:>10.1f}  {name}")
+
+    if result['bpy_loaded']:
+        print(f"FAIL: importing {args.module} loads bpy")
+        sys.exit(1)
+    if args.max_ms is not None and result['median_ms'] > args.max_ms:
+        print(f"FAIL: median import time exceeds {args.max_ms:.0f} ms")
+        sys.exit(1)
@@ -0,0 +1,62 @@
+# If installing as a package comment out the modification to sys.path:
+import sys
+import os
+# Ensure the src/ directory is in the import path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+# Imports
+import argparse
+import shutil
+import tempfile
+from renderer import *
+
+def benchmark_workers(model_path: str, max_workers: int, camera_density: int) -> list:
+    """Render the same orbit path with 1..max_workers processes.
+    
+    Args:
+        model_path: Path to the 3D model file
+        max_workers: Largest number of worker processes to try (doubling from 1)
+        camera_density: Number of frames in the orbit path
+        
+    Returns:
+        list: (workers, render_time, frames per second) for each run
+    """
+    results = []
+    workers = 1
+    while workers <= max_workers:
+        output_dir = tempfile.mkdtemp(prefix=f"bench_workers_{workers}_")
+        renderer = ModelRenderer(
+            render_config=RenderConfig(resolution=256, samples=64, device="CPU", workers=workers),
+            lighting_config=LightingConfig(light_setup=LightSetup.OVERHEAD, light_type=LightType.SUN),
+            camera_config=CameraConfig(
+                distance=20,
+                camera_path_type=CameraPathType.ORBIT,
+                camera_density=camera_density
+            )
+        )
+        try:
+            renderer.render(model_path, output_dir)
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+        stats = renderer.get_render_stats()
+        fps = stats['successful_renders'] / stats['render_time']
+        results.append((workers, stats['render_time'], fps))
+        workers *= 2
+    return results
+
+# --- Execution ---
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark render throughput against worker count.")
+    parser.add_argument("model_path", type=str, help="Path to the 3D model file (e.g., .glb, .usdc).")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count(), help="Largest worker count to try.")
+    parser.add_argument("--frames", type=int, default=32, help="Number of frames in the orbit path.")
+    args = parser.parse_args()
+
+    results = benchmark_workers(args.model_path, args.max_workers, args.frames)
+
+    baseline_fps = results[0][2]
+    print(f"{'workers':>8} {'time (s)':>10} {'frames/s':>10} {'speedup':>8}")
+    for workers, render_time, fps in results:
+        print(f"{workers:>8} {render_time:>10.2f} {fps:>10.2f} {fps / baseline_fps:>8.2f}")
@@ -1,13 +1,24 @@
 # src/renderer/__init__.py
-"""3D Model Renderer package for generating multi-angle views."""
+"""3D Model Renderer package for generating multi-angle views.
+
+Configs, camera paths and bpy-free utilities import without Blender. 
+ModelRenderer, and with it bpy, is only imported on first access, so that 
+planning and validation jobs do not pay Blender's startup time and memory.
+"""
 
 # Set up centralized logging
 from renderer.utils.logger import logger  
 logger.debug("Initializing PyBlenderRender package")
 
 # Import common modules
-from renderer.model_renderer import ModelRenderer
-from renderer.config.render_config import RenderConfig, Background
+from renderer.config.render_config import (
+    RenderConfig,
+    Background,
+    BorderMode,
+    OutputFormat,
+    RenderEngine,
+    RenderPass
+)
 from renderer.config.lighting_config import LightingConfig, LightType, LightSetup
 from renderer.config.camera_config import CameraConfig, CameraPathType, SphereCoverage
 from renderer.config.blend_config import BlendFileConfig
@@ -16,10 +27,14 @@ from renderer.utils.coordinates import SphericalCoordinate
 __all__ = [
     'ModelRenderer',
     'RenderConfig',
+    'RenderEngine',
+    'RenderPass',
     'LightingConfig',
     'CameraConfig',
     'BlendFileConfig',
     'Background',
+    'BorderMode',
+    'OutputFormat',
     'SphereCoverage',
     'LightType',
     'LightSetup',
@@ -27,3 +42,11 @@ __all__ = [
     'SphericalCoordinate',
     'logger'
 ]
+
+def __getattr__(name):
+    """Import ModelRenderer (and bpy) on first access."""
+    if name == "ModelRenderer":
+        from renderer.model_renderer import ModelRenderer
+        globals()["ModelRenderer"] = ModelRenderer
+        return ModelRenderer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,15 @@
 # src/renderer/camera/__init__.py
 from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
+from renderer.camera.dedup import DeduplicatedPathGenerator, ViewIndex
+from renderer.camera.planned import PlannedPathGenerator
 from renderer.camera.registry import camera_registry
 from renderer.camera.paths import (
+    AdaptivePathGenerator,
+    CoveragePathGenerator,
     CubePathGenerator,
+    CustomPathGenerator,
+    IcospherePathGenerator,
     OrbitPathGenerator,
     SpiralPhiPathGenerator,
     PoleRotationPathGenerator,
@@ -11,12 +18,20 @@ from renderer.camera.paths import (
 )
 
 __all__ = [
+    'AdaptivePathGenerator',
     'camera_registry',
+    'CameraPath',
     'CameraPathGenerator',
+    'CoveragePathGenerator',
+    'DeduplicatedPathGenerator',
     'CubePathGenerator',
+    'CustomPathGenerator',
+    'IcospherePathGenerator',
     'OrbitPathGenerator',
+    'PlannedPathGenerator',
     'SpiralPhiPathGenerator',
     'PoleRotationPathGenerator',
     'SpiralLinearPathGenerator',
-    'SpiralPhasedPathGenerator'
+    'SpiralPhasedPathGenerator',
+    'ViewIndex'
 ]
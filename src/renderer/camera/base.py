@@ -1,11 +1,15 @@
 # src/renderer/camera/base.py
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator
 from renderer.utils.logger import logger
-from renderer.utils.coordinates import SphericalCoordinate
+from renderer.camera.path import CameraPath
 
 class CameraPathGenerator(ABC):
     """Abstract base class for all camera path generators."""
+
+    # Whether paths are planned from the model in the scene, not the config alone
+    plans_from_scene = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -13,7 +17,29 @@ class CameraPathGenerator(ABC):
         pass
        
     @abstractmethod
-    def generate_positions(self, camera_config) -> List[SphericalCoordinate]:
-        """Generate a list of camera positions based on the configuration."""
+    def generate_positions(self, camera_config) -> CameraPath:
+        """Generate the camera positions based on the configuration."""
         pass
 
+    @property
+    def stats(self) -> dict:
+        """Return statistics of the last generated path for the render stats."""
+        return {}
+
+    def count(self, camera_config) -> int:
+        """Return the number of camera positions for the configuration.
+
+        Generators with a closed-form count override this to skip generation.
+        """
+        return len(self.generate_positions(camera_config))
+
+    def iter_chunks(self, camera_config, chunk_size: int) -> Iterator[CameraPath]:
+        """Yield the camera positions in consecutive pieces of at most chunk_size.
+
+        The default slices generate_positions(); generators of very long or
+        file-backed paths override this to avoid building the whole path.
+        """
+        positions = self.generate_positions(camera_config)
+        for start in range(0, len(positions), chunk_size):
+            yield positions[start:start + chunk_size]
+
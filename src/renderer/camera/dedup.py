@@ -0,0 +1,166 @@
+# src/renderer/camera/dedup.py
+"""Drop camera views that would render almost the same image as an earlier one.
+
+Paths that sweep azimuth near the poles (pole_rotation, spiral_lin) and
+paths joined from several sources place many views a fraction of a degree
+apart. Two views are duplicates when their viewing directions are within
+the tolerance of each other and, unless roll is ignored, so are their image
+up axes (which differ by the in-plane rotation between the two images).
+
+Kept views are found with a uniform grid over unit view directions: cells
+are as wide as the chord of the tolerance, so every direction within the
+tolerance of a view lies in that view's cell or one of its 26 neighbours.
+Views are visited in path order and the first of each group of duplicates
+is kept, so the result does not depend on how the path is chunked.
+"""
+
+import math
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
+from renderer.utils.logger import logger
+
+# Views deduplicated at a time by generate_positions() and count()
+CHUNK_SIZE = 4096
+
+# Offsets of a grid cell's neighbourhood, itself included
+_NEIGHBOURS = np.array(
+    [(i, j, k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)], dtype=np.int64
+)
+
+class ViewIndex:
+    """Spatial hash of kept view directions and up axes.
+
+    Args:
+        tolerance: Largest angle in degrees between duplicate views
+        ignore_roll: Treat views that differ only by in-plane rotation as
+            duplicates
+    """
+
+    def __init__(self, tolerance: float, ignore_roll: bool = False):
+        self.tolerance = tolerance
+        self.ignore_roll = ignore_roll
+        self._min_dot = math.cos(math.radians(tolerance))
+        self._cell = 2 * math.sin(math.radians(tolerance) / 2)  # Chord length
+        self._cells: Dict[tuple, List[int]] = {}
+        self._directions: List[np.ndarray] = []
+        self._ups: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._directions)
+
+    def add(self, path: CameraPath) -> np.ndarray:
+        """Add the views of path that duplicate no view added before.
+
+        Returns:
+            np.ndarray: Boolean mask of the views that were kept
+        """
+        return self.match(path) < 0
+
+    def match(self, path: CameraPath) -> np.ndarray:
+        """Match the views of path against the views added before, adding the
+        views that match none.
+
+        Returns:
+            np.ndarray: For each view, the position (in order of addition) of
+                the kept view it duplicates, or -1 if it was added
+        """
+        rotations = path.rotation_matrices()
+        directions = rotations[:, :, 2]  # Camera Z axis, pointing away from the model
+        ups = rotations[:, :, 1]
+        cells = np.floor(directions / self._cell).astype(np.int64)
+        matches = np.full(len(path), -1, dtype=np.int64)
+        for i in range(len(path)):
+            matches[i] = self._find(cells[i], directions[i], ups[i])
+            if matches[i] < 0:
+                self._cells.setdefault(tuple(cells[i].tolist()), []).append(len(self._directions))
+                self._directions.append(directions[i])
+                self._ups.append(ups[i])
+        return matches
+
+    def _find(self, cell: np.ndarray, direction: np.ndarray, up: np.ndarray) -> int:
+        """Return a kept view within the tolerance of a view, or -1."""
+        for neighbour in (cell + _NEIGHBOURS).tolist():
+            for k in self._cells.get(tuple(neighbour), ()):
+                if np.dot(self._directions[k], direction) >= self._min_dot and (
+                    self.ignore_roll or np.dot(self._ups[k], up) >= self._min_dot
+                ):
+                    return k
+        return -1
+
+class DeduplicatedPathGenerator(CameraPathGenerator):
+    """Wraps any generator and drops its near-duplicate views.
+
+    Args:
+        generator: Generator whose path is deduplicated
+        tolerance: Largest angle in degrees between duplicate views
+        ignore_roll: Treat views that differ only by in-plane rotation as
+            duplicates
+    """
+
+    def __init__(self, generator: CameraPathGenerator, tolerance: float, ignore_roll: bool = False):
+        self.generator = generator
+        self.tolerance = tolerance
+        self.ignore_roll = ignore_roll
+        self._counted = None  # (camera_config, kept views)
+        self._dedup_stats = {}
+
+    @property
+    def name(self) -> str:
+        """Return the name of the wrapped camera path type."""
+        return self.generator.name
+
+    @property
+    def stats(self) -> dict:
+        """Return the wrapped generator's statistics and the renders saved."""
+        return {**self.generator.stats, **self._dedup_stats}
+
+    def generate_positions(self, camera_config) -> CameraPath:
+        """Generate the wrapped path without its near-duplicate views."""
+        return CameraPath.concatenate(
+            self._iter_unique(self.generator.iter_chunks(camera_config, CHUNK_SIZE))
+        )
+
+    def count(self, camera_config) -> int:
+        """Return the number of views left after deduplication.
+
+        The path is deduplicated once per configuration to count it.
+        """
+        if self._counted is None or self._counted[0] != camera_config:
+            total = sum(len(chunk) for chunk in self.iter_chunks(camera_config, CHUNK_SIZE))
+            self._counted = (camera_config, total)
+        return self._counted[1]
+
+    def iter_chunks(self, camera_config, chunk_size: int) -> Iterator[CameraPath]:
+        """Yield the wrapped path's chunks without their near-duplicate views.
+
+        Chunks shrink by the views dropped from them; empty chunks are skipped.
+        """
+        return self._iter_unique(self.generator.iter_chunks(camera_config, chunk_size))
+
+    def _iter_unique(self, chunks: Iterator[CameraPath]) -> Iterator[CameraPath]:
+        """Filter chunks through one index and record the renders saved."""
+        index = ViewIndex(self.tolerance, self.ignore_roll)
+        input_views = 0
+        for chunk in chunks:
+            input_views += len(chunk)
+            unique = chunk[index.add(chunk)]
+            if len(unique):
+                yield unique
+
+        self._dedup_stats = {
+            'deduplication': {
+                'tolerance': self.tolerance,
+                'ignore_roll': self.ignore_roll,
+                'input_views': input_views,
+                'kept_views': len(index),
+                'renders_saved': input_views - len(index),
+            }
+        }
+        logger.info(
+            f"Deduplicated camera path: kept {len(index)} of {input_views} views "
+            f"within {self.tolerance}°"
+        )
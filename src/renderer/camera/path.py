@@ -0,0 +1,232 @@
+# src/renderer/camera/path.py
+"""Camera paths as NumPy columns instead of lists of SphericalCoordinate.
+
+A CameraPath stores radius, azimuth, elevation and roll as four float64
+arrays (32 bytes per view), so generators can build paths of
+millions of views with array math, and camera poses for a whole path are
+computed in one batch. It still behaves like the list of SphericalCoordinate
+the generators used to return: len(), iteration, indexing and == work the
+same way.
+
+Poses match ModelRenderer's original per-frame mathutils code: the camera
+sits at the spherical coordinate, its -Z axis tracks the origin with its Y
+axis up (Vector.to_track_quat('-Z', 'Y')), and is then rolled about its own
+Z axis.
+"""
+
+from typing import Iterable, Iterator, List, Union, overload
+
+import numpy as np
+
+from renderer.utils.coordinates import SphericalCoordinate
+
+COLUMNS = ("radius", "azimuth", "elevation", "roll")
+
+# Horizontal extent of a unit view direction below which a view is treated as
+# (numerically) vertical; about 0.1 degrees from a pole
+NEAR_POLE = 2e-3
+
+class CameraPath:
+    """Structure-of-arrays camera path.
+
+    Args:
+        radius: Distance of each view from the origin
+        azimuth: Azimuth of each view in degrees
+        elevation: Elevation of each view in degrees
+        roll: Roll of each view in degrees
+
+    Scalars are broadcast to the length of the other columns.
+    """
+
+    __slots__ = COLUMNS
+
+    def __init__(self, radius, azimuth, elevation, roll=0.0):
+        columns = np.broadcast_arrays(
+            *(np.asarray(c, dtype=np.float64) for c in (radius, azimuth, elevation, roll))
+        )
+        for name, column in zip(COLUMNS, columns):
+            column = np.array(column, ndmin=1)  # Own, writable copies
+            if column.ndim != 1:
+                raise ValueError("Camera path columns must be one-dimensional")
+            setattr(self, name, column)
+
+    @classmethod
+    def from_coordinates(cls, coords: Iterable[SphericalCoordinate]) -> "CameraPath":
+        """Build a path from SphericalCoordinate instances."""
+        values = np.array(
+            [(c.radius, c.azimuth, c.elevation, c.roll) for c in coords], dtype=np.float64
+        ).reshape(-1, 4)
+        return cls(*values.T)
+
+    @classmethod
+    def concatenate(cls, paths: Iterable["CameraPath"]) -> "CameraPath":
+        """Join paths end to end."""
+        paths = list(paths)
+        if not paths:
+            return cls([], [], [], [])
+        return cls(*(np.concatenate([getattr(p, name) for p in paths]) for name in COLUMNS))
+
+    def __len__(self) -> int:
+        return len(self.radius)
+
+    @overload
+    def __getitem__(self, index: int) -> SphericalCoordinate: ...
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray, List[int]]) -> "CameraPath": ...
+
+    def __getitem__(self, index):
+        """Return one view as a SphericalCoordinate, or a sub-path for a slice,
+        boolean mask or index array."""
+        if isinstance(index, (int, np.integer)):
+            return SphericalCoordinate(
+                *(float(getattr(self, name)[index]) for name in COLUMNS)
+            )
+        return CameraPath(*(getattr(self, name)[index] for name in COLUMNS))
+
+    def __iter__(self) -> Iterator[SphericalCoordinate]:
+        for values in zip(*(getattr(self, name).tolist() for name in COLUMNS)):
+            yield SphericalCoordinate(*values)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CameraPath):
+            return len(self) == len(other) and all(
+                np.array_equal(getattr(self, name), getattr(other, name)) for name in COLUMNS
+            )
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CameraPath({len(self)} views)"
+
+    def to_list(self) -> List[SphericalCoordinate]:
+        """Return the views as a list of SphericalCoordinate."""
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the columns."""
+        return sum(getattr(self, name).nbytes for name in COLUMNS)
+
+    def locations(self) -> np.ndarray:
+        """Return the (N, 3) world-space camera locations (Z up)."""
+        azimuth = np.radians(self.azimuth)
+        elevation = np.radians(self.elevation)
+        horizontal = self.radius * np.cos(elevation)
+        return np.stack([
+            horizontal * np.sin(azimuth),
+            horizontal * np.cos(azimuth),
+            self.radius * np.sin(elevation),
+        ], axis=1)
+
+    def rotation_matrices(self) -> np.ndarray:
+        """Return the (N, 3, 3) camera rotations, rolled about the view axis."""
+        track = _track_quaternions(self.locations())
+        rotation = _quaternion_matrices(track)
+        roll = np.radians(self.roll)
+        cos, sin = np.cos(roll), np.sin(roll)
+        roll_matrices = np.zeros((len(self), 3, 3))
+        roll_matrices[:, 0, 0] = cos
+        roll_matrices[:, 0, 1] = -sin
+        roll_matrices[:, 1, 0] = sin
+        roll_matrices[:, 1, 1] = cos
+        roll_matrices[:, 2, 2] = 1.0
+        return rotation @ roll_matrices  # Roll about the camera's local Z axis
+
+    def rotations(self) -> np.ndarray:
+        """Return the (N, 3) camera rotations as XYZ Euler angles in radians."""
+        return _matrix_to_euler_xyz(self.rotation_matrices())
+
+    def matrices(self) -> np.ndarray:
+        """Return the (N, 4, 4) camera world matrices."""
+        matrices = np.zeros((len(self), 4, 4))
+        matrices[:, :3, :3] = self.rotation_matrices()
+        matrices[:, :3, 3] = self.locations()
+        matrices[:, 3, 3] = 1.0
+        return matrices
+
+def _track_quaternions(locations: np.ndarray) -> np.ndarray:
+    """Return (N, 4) wxyz quaternions pointing -Z from each location at the
+    origin with Y up, as Vector.to_track_quat('-Z', 'Y') computes them."""
+    length = np.linalg.norm(locations, axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Tracking -Z towards the origin is tracking +Z along the location
+        tvec = np.where(length > 0, locations / length, 0.0)
+
+    # Rotate Z onto tvec about the axis Z x tvec; the axis of the parallel
+    # and antiparallel cases is zero, as in Blender
+    axis = np.stack([-tvec[:, 1], tvec[:, 0], np.zeros(len(tvec))], axis=1)
+    axis_length = np.linalg.norm(axis, axis=1, keepdims=True)
+    axis = np.divide(axis, axis_length, out=np.zeros_like(axis), where=axis_length > 1e-35)
+    half_angle = np.arccos(np.clip(tvec[:, 2], -1.0, 1.0)) / 2
+    quat = np.concatenate([np.cos(half_angle)[:, None], axis * np.sin(half_angle)[:, None]], axis=1)
+
+    # Then turn about tvec so that the local Y axis points up
+    world_z = _quaternion_matrices(quat)[:, 2, :]  # World Z of the local axes
+    up_angle = -0.5 * np.arctan2(world_z[:, 0], world_z[:, 1])
+    up = np.concatenate(
+        [np.cos(up_angle)[:, None], tvec * np.sin(up_angle)[:, None]], axis=1
+    )
+    quat = _quaternion_multiply(up, quat)
+
+    # Within a few hundredths of a degree of a pole, Blender's single precision
+    # result depends on rounding rather than on the view; compute those few
+    # views with mathutils itself when it is available
+    near_pole = np.flatnonzero(np.hypot(tvec[:, 0], tvec[:, 1]) < NEAR_POLE)
+    if len(near_pole):
+        try:
+            from mathutils import Vector
+        except ImportError:
+            pass
+        else:
+            for i in near_pole:
+                quat[i] = (-Vector(locations[i]).normalized()).to_track_quat('-Z', 'Y')
+    quat[length[:, 0] == 0] = (1.0, 0.0, 0.0, 0.0)
+    return quat
+
+def _quaternion_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Return the Hamilton products a * b of (N, 4) wxyz quaternions."""
+    aw, ax, ay, az = a.T
+    bw, bx, by, bz = b.T
+    return np.stack([
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by + ay * bw + az * bx - ax * bz,
+        aw * bz + az * bw + ax * by - ay * bx,
+    ], axis=1)
+
+def _quaternion_matrices(quat: np.ndarray) -> np.ndarray:
+    """Return the (N, 3, 3) rotation matrices of (N, 4) wxyz quaternions.
+
+    Like Blender's quat_to_mat3, unnormalized quaternions are not rescaled.
+    """
+    w, x, y, z = quat.T
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)], axis=1),
+        np.stack([2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)], axis=1),
+        np.stack([2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)], axis=1),
+    ], axis=1)
+
+def _matrix_to_euler_xyz(matrices: np.ndarray) -> np.ndarray:
+    """Return (N, 3) XYZ Euler angles of rotation matrices, choosing the
+    smaller of the two solutions like Blender's Matrix.to_euler('XYZ')."""
+    m = matrices
+    cy = np.hypot(m[:, 0, 0], m[:, 1, 0])
+    first = np.stack([
+        np.arctan2(m[:, 2, 1], m[:, 2, 2]),
+        np.arctan2(-m[:, 2, 0], cy),
+        np.arctan2(m[:, 1, 0], m[:, 0, 0]),
+    ], axis=1)
+    second = np.stack([
+        np.arctan2(-m[:, 2, 1], -m[:, 2, 2]),
+        np.arctan2(-m[:, 2, 0], -cy),
+        np.arctan2(-m[:, 1, 0], -m[:, 0, 0]),
+    ], axis=1)
+    gimbal = np.stack([
+        np.arctan2(-m[:, 1, 2], m[:, 1, 1]),
+        np.arctan2(-m[:, 2, 0], cy),
+        np.zeros(len(m)),
+    ], axis=1)
+    use_second = np.abs(first).sum(axis=1) > np.abs(second).sum(axis=1)
+    euler = np.where(use_second[:, None], second, first)
+    return np.where((cy > 16 * np.finfo(np.float32).eps)[:, None], euler, gimbal)
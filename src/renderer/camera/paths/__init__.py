@@ -1,7 +1,11 @@
 # src/renderer/camera/paths/__init__.py
 """Camera path generators for different camera movement patterns."""
 
+from renderer.camera.paths.adaptive import AdaptivePathGenerator
+from renderer.camera.paths.coverage import CoveragePathGenerator
 from renderer.camera.paths.cube import CubePathGenerator
+from renderer.camera.paths.custom import CustomPathGenerator
+from renderer.camera.paths.icosphere import IcospherePathGenerator
 from renderer.camera.paths.orbit import OrbitPathGenerator
 from renderer.camera.paths.pole_rotation import PoleRotationPathGenerator
 from renderer.camera.paths.spiral_phi import SpiralPhiPathGenerator
@@ -9,7 +13,11 @@ from renderer.camera.paths.spiral_linear import SpiralLinearPathGenerator
 from renderer.camera.paths.spiral_phased import SpiralPhasedPathGenerator
 
 __all__ = [
+    'AdaptivePathGenerator',
+    'CoveragePathGenerator',
     'CubePathGenerator',
+    'CustomPathGenerator',
+    'IcospherePathGenerator',
     'OrbitPathGenerator',
     'PoleRotationPathGenerator',
     'SpiralPhiPathGenerator',
@@ -0,0 +1,218 @@
+"""Camera path generator that adds views where the model's appearance changes fast.
+
+Uniform paths spend as many renders on directions from which the model looks
+the same as on directions where it changes quickly (thin parts swinging into
+view, specular highlights, silhouettes of concave shapes). This generator
+starts from a coarse icosphere (see renderer.camera.paths.icosphere), renders
+every view as a small, cheap probe image and measures the RMS difference
+between the probes of neighbouring views, i.e. the ends of each edge of the
+icosphere's triangles. It then repeatedly bisects the edge with the largest
+difference, probing the new view and comparing it with its new neighbours,
+until every difference is below the threshold, the view budget is spent or
+the remaining edges are shorter than MIN_EDGE_ANGLE.
+
+Views are returned coarse views first, then in the order they were added, so
+any prefix of the refinement is itself a useful path. Probes are rendered by
+a callback that the renderer sets (AdaptivePathGenerator.probe), after the
+model, camera and lights are in the scene.
+"""
+
+import heapq
+import math
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
+from renderer.camera.paths.icosphere import directions_to_path, icosphere_mesh
+from renderer.config.camera_config import CameraConfig, SphereCoverage
+from renderer.utils.autotune import image_rmse
+from renderer.utils.logger import logger
+
+# Cycles samples per probe image (fewer if the render uses fewer)
+PROBE_SAMPLES = 16
+
+# Edges shorter than this angle in degrees are not split
+MIN_EDGE_ANGLE = 1.0
+
+def _edge(a: int, b: int) -> Tuple[int, int]:
+    """Return the key of the edge between two vertices."""
+    return (a, b) if a < b else (b, a)
+
+def _face_edges(face: Tuple[int, int, int]) -> List[Tuple[int, int]]:
+    """Return the keys of a triangle's three edges."""
+    a, b, c = face
+    return [_edge(a, b), _edge(b, c), _edge(c, a)]
+
+def refine_views(
+    directions: np.ndarray,
+    faces: np.ndarray,
+    render: Callable[[np.ndarray], List[np.ndarray]],
+    threshold: float,
+    budget: int,
+    min_angle: float = MIN_EDGE_ANGLE
+) -> Tuple[np.ndarray, float]:
+    """Bisect the edges between views whose images differ most.
+
+    Splitting an edge splits both triangles beside it, joining the new view
+    to their opposite corners, so the mesh stays conforming and refinement
+    fills in regions of the sphere rather than lines along the coarse edges.
+    As in longest-edge bisection, a triangle beside the chosen edge that has
+    a longer edge is split along that edge first, which keeps triangles from
+    degenerating into slivers.
+
+    Args:
+        directions: (N, 3) unit view directions of the coarse views
+        faces: (F, 3) triangles of neighbouring coarse views
+        render: Returns the probe images of (M, 3) view directions
+        threshold: RMS image difference above which an edge is split
+        budget: Largest number of views, coarse views included
+        min_angle: Edges shorter than this angle in degrees are not split
+
+    Returns:
+        The (N + added, 3) directions, coarse views first and added views in
+        the order they were added, and the largest difference left between
+        neighbouring views (0 without faces)
+    """
+    directions = list(directions)
+    images = list(render(np.asarray(directions)))
+    faces = [tuple(face) for face in np.asarray(faces, dtype=np.int64).tolist()]
+    edge_faces: Dict[Tuple[int, int], Set[int]] = {}
+    for k, face in enumerate(faces):
+        for edge in _face_edges(face):
+            edge_faces.setdefault(edge, set()).add(k)
+    heap = [(-image_rmse(images[a], images[b]), a, b) for a, b in edge_faces]
+    heapq.heapify(heap)
+
+    def add_edge(a: int, b: int, face: int) -> None:
+        """Record a triangle beside an edge, queueing the edge if it is new."""
+        edge = _edge(a, b)
+        if edge not in edge_faces:
+            heapq.heappush(heap, (-image_rmse(images[a], images[b]), *edge))
+        edge_faces.setdefault(edge, set()).add(face)
+
+    def cosine(edge: Tuple[int, int]) -> float:
+        """Cosine of the angle an edge spans; longer edges have lower cosines."""
+        return float(np.dot(directions[edge[0]], directions[edge[1]]))
+
+    def longest_edge(edge: Tuple[int, int]) -> Tuple[int, int]:
+        """Follow longer edges of the triangles beside an edge to a longest one."""
+        while True:
+            longer = min(
+                (other for k in edge_faces[edge] for other in _face_edges(faces[k])), key=cosine
+            )
+            if cosine(longer) >= cosine(edge):
+                return edge
+            edge = longer
+
+    max_dot = math.cos(math.radians(min_angle))
+    short = []  # Differences of edges too short to split
+    while heap and len(directions) < budget and -heap[0][0] > threshold:
+        difference, a, b = heapq.heappop(heap)
+        if (a, b) not in edge_faces:
+            continue  # Split as the longest edge of a neighbouring triangle
+        if cosine((a, b)) > max_dot:
+            short.append(-difference)
+            continue
+        longest = longest_edge((a, b))
+        if longest != (a, b):
+            heapq.heappush(heap, (difference, a, b))
+            a, b = longest
+        midpoint = directions[a] + directions[b]
+        midpoint /= np.linalg.norm(midpoint)
+        directions.append(midpoint)
+        images.append(render(midpoint[None])[0])
+        m = len(directions) - 1
+        for k in edge_faces.pop((a, b)):
+            # Rotate the face to (x, y, c) with x-y the split edge, keeping its winding
+            face = faces[k]
+            turn = next(i for i in range(3) if {face[i], face[(i + 1) % 3]} == {a, b})
+            x, y, c = face[turn:] + face[:turn]
+            faces[k] = (x, m, c)
+            faces.append((m, y, c))
+            edge_faces[_edge(y, c)].discard(k)
+            add_edge(y, c, len(faces) - 1)
+            add_edge(x, m, k)
+            add_edge(m, c, k)
+            add_edge(m, c, len(faces) - 1)
+            add_edge(m, y, len(faces) - 1)
+
+    remaining = [-difference for difference, a, b in heap if (a, b) in edge_faces]
+    return np.asarray(directions), float(max(remaining + short, default=0.0))
+
+class AdaptivePathGenerator(CameraPathGenerator):
+    """Generates views refined where neighbouring probe images differ.
+
+    Attributes:
+        probe: Callback rendering low-resolution images of a CameraPath, set
+            by the renderer before a path is generated
+    """
+
+    plans_from_scene = True
+
+    def __init__(self):
+        self.probe: Optional[Callable[[CameraPath], List[np.ndarray]]] = None
+        self._config = None
+        self._path = None
+        self._stats = {}
+
+    @property
+    def name(self) -> str:
+        """Return the unique name of the camera path type."""
+        return "adaptive"
+
+    @property
+    def stats(self) -> dict:
+        """Return the refinement of the last generated path."""
+        return self._stats
+
+    def generate_positions(self, camera_config: CameraConfig) -> CameraPath:
+        """Refine icosphere level camera_config.refine_level by probe images.
+
+        Edges are split while the RMS difference of their views' probes
+        (camera_config.refine_resolution pixels across, on a [0, 1] scale)
+        exceeds camera_config.refine_threshold, up to camera_config.refine_budget
+        views. With SphereCoverage.HALF only coarse views at or above the
+        equator are used, and every added view lies between two of them.
+        The plan is kept for repeated calls with the same config.
+
+        Returns:
+            CameraPath: Coarse views, then added views in the order they were added
+        """
+        if self._path is not None and self._config == camera_config:
+            return self._path
+        if self.probe is None:
+            raise RuntimeError("The adaptive camera path needs a probe renderer")
+
+        start_time = time.time()
+        vertices, faces = icosphere_mesh(camera_config.refine_level)
+        if camera_config.sphere_coverage == SphereCoverage.HALF:
+            keep = vertices[:, 2] >= -1e-9
+            faces = (np.cumsum(keep) - 1)[faces[keep[faces].all(axis=1)]]
+            vertices = vertices[keep]
+
+        def render(directions: np.ndarray) -> List[np.ndarray]:
+            return self.probe(directions_to_path(directions, camera_config))
+
+        directions, max_difference = refine_views(
+            vertices, faces, render, camera_config.refine_threshold, camera_config.refine_budget
+        )
+        self._config = camera_config
+        self._path = directions_to_path(directions, camera_config)
+        self._stats = {
+            'refinement': {
+                'coarse_views': len(vertices),
+                'added_views': len(directions) - len(vertices),
+                'refine_threshold': camera_config.refine_threshold,
+                'refine_budget': camera_config.refine_budget,
+                'max_difference': max_difference,
+                'planning_time': time.time() - start_time,
+            }
+        }
+        logger.info(
+            f"Adaptive path: {len(directions) - len(vertices)} views added to "
+            f"{len(vertices)} coarse views; largest neighbour difference {max_difference:.4f}"
+        )
+        return self._path
@@ -0,0 +1,227 @@
+"""Camera path generator that picks the fewest views covering the model's surface.
+
+Fixed-geometry paths place views without looking at the model, so dense
+paths are rendered to be safe. This generator samples points on the imported
+model's surface, tests which of them each view of a dense candidate set
+(a golden-ratio spiral) can see by casting rays against a BVH of the scene's
+meshes, and then greedily picks the view that sees the most surface not yet
+seen until the coverage target is met (next-best-view planning).
+
+Views are returned in the order they were picked, so any prefix of the path
+is itself a good small path. Blender (bpy, mathutils) is only imported when a
+path is generated, after the model has been imported into the scene.
+"""
+
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
+from renderer.camera.paths.spiral_phi import SpiralPhiPathGenerator
+from renderer.config.camera_config import CameraConfig
+from renderer.utils.logger import logger
+
+# Seed of the surface sampling, so that parallel workers plan the same path
+SAMPLE_SEED = 0
+
+# Offset of ray origins from the surface, as a fraction of the model's size
+RAY_OFFSET = 1e-4
+
+def greedy_cover(visibility: np.ndarray, target: float) -> Tuple[List[int], float]:
+    """Pick views until they see a target fraction of the visible samples.
+
+    Args:
+        visibility: (views, samples) boolean matrix of which views see which
+            surface samples
+        target: Fraction of the samples seen by any view to cover
+
+    Returns:
+        The picked view indices in pick order, and the fraction of the
+        samples seen by any view that they cover
+    """
+    reachable = visibility.any(axis=0)
+    num_reachable = int(reachable.sum())
+    if num_reachable == 0:
+        return [], 0.0
+
+    covered = np.zeros(visibility.shape[1], dtype=bool)
+    picked = []
+    while covered.sum() < target * num_reachable:
+        gains = (visibility & ~covered).sum(axis=1)
+        best = int(np.argmax(gains))  # Ties go to the earlier (higher) view
+        if gains[best] == 0:
+            break
+        picked.append(best)
+        covered |= visibility[best]
+    return picked, float(covered.sum() / num_reachable)
+
+def sample_surface(scene, count: int, seed: int = SAMPLE_SEED) -> Tuple[np.ndarray, np.ndarray, list, list]:
+    """Sample points uniformly by area on the scene's visible meshes.
+
+    Args:
+        scene: Blender scene holding the imported model
+        count: Number of points to sample
+        seed: Seed of the random generator
+
+    Returns:
+        (count, 3) world-space points, their (count, 3) unit normals, and the
+        world-space vertices and triangles of all meshes (for a BVH)
+    """
+    import bpy
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    vertices, triangles = [], []
+    offset = 0
+    for obj in scene.objects:
+        if obj.type != 'MESH' or not obj.visible_get():
+            continue
+        evaluated = obj.evaluated_get(depsgraph)
+        mesh = evaluated.to_mesh()
+        try:
+            mesh.calc_loop_triangles()
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+            mesh.vertices.foreach_get("co", coords)
+            tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int64)
+            mesh.loop_triangles.foreach_get("vertices", tris)
+        finally:
+            evaluated.to_mesh_clear()
+        matrix = np.array(obj.matrix_world)
+        coords = coords.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        vertices.append(coords)
+        triangles.append(tris.reshape(-1, 3) + offset)
+        offset += len(coords)
+
+    if not vertices:
+        return np.empty((0, 3)), np.empty((0, 3)), [], []
+    vertices = np.concatenate(vertices)
+    triangles = np.concatenate(triangles)
+    corners = vertices[triangles]
+    cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    doubled_area = np.linalg.norm(cross, axis=1)
+    keep = doubled_area > 0
+    corners, cross, doubled_area = corners[keep], cross[keep], doubled_area[keep]
+    if not len(corners):
+        return np.empty((0, 3)), np.empty((0, 3)), [], []
+
+    rng = np.random.default_rng(seed)
+    chosen = rng.choice(len(corners), size=count, p=doubled_area / doubled_area.sum())
+    u, v = rng.random(count), rng.random(count)
+    flip = u + v > 1  # Fold the unit square onto the triangle
+    u[flip], v[flip] = 1 - u[flip], 1 - v[flip]
+    a, b, c = corners[chosen, 0], corners[chosen, 1], corners[chosen, 2]
+    points = a + u[:, None] * (b - a) + v[:, None] * (c - a)
+    normals = cross[chosen] / doubled_area[chosen, None]
+    return points, normals, vertices.tolist(), triangles[keep].tolist()
+
+def visibility_matrix(
+    locations: np.ndarray,
+    points: np.ndarray,
+    normals: np.ndarray,
+    vertices: list,
+    triangles: list
+) -> np.ndarray:
+    """Return which camera locations see which surface points.
+
+    A point is seen if it faces the camera and the segment from the point to
+    the camera hits no geometry. Both sides of a surface count as facing,
+    since imported meshes are often single-sided or inconsistently wound.
+    """
+    from mathutils import Vector
+    from mathutils.bvhtree import BVHTree
+
+    bvh = BVHTree.FromPolygons(vertices, triangles, all_triangles=True)
+    size = np.ptp(points, axis=0).max() if len(points) else 1.0
+    visibility = np.zeros((len(locations), len(points)), dtype=bool)
+    for view, location in enumerate(locations):
+        to_camera = location - points
+        distance = np.linalg.norm(to_camera, axis=1)
+        direction = to_camera / distance[:, None]
+        facing = np.einsum("ij,ij->i", direction, normals)
+        # Start each ray just off the side of the surface facing the camera
+        origins = points + np.sign(facing)[:, None] * normals * (RAY_OFFSET * size)
+        for k in np.flatnonzero(facing != 0):
+            hit = bvh.ray_cast(Vector(origins[k]), Vector(direction[k]), distance[k])
+            visibility[view, k] = hit[0] is None
+    return visibility
+
+class CoveragePathGenerator(CameraPathGenerator):
+    """Generates the fewest views that see a target fraction of the model's surface."""
+
+    plans_from_scene = True
+
+    def __init__(self):
+        self._config = None
+        self._path = None
+        self._stats = {}
+
+    @property
+    def name(self) -> str:
+        """Return the unique name of the camera path type."""
+        return "coverage"
+
+    @property
+    def stats(self) -> dict:
+        """Return the coverage achieved by the last generated path."""
+        return self._stats
+
+    def generate_positions(self, camera_config: CameraConfig) -> CameraPath:
+        """Plan views covering the model in the current Blender scene.
+
+        Candidates are a golden-ratio spiral of camera_config.coverage_candidates
+        views (upper half only with SphereCoverage.HALF) at
+        camera_config.distance. The target (camera_config.coverage_target)
+        is a fraction of the surface that any candidate sees; surface hidden
+        from every direction, such as interiors, cannot be covered by any path.
+        The plan is kept for repeated calls with the same config.
+
+        Returns:
+            CameraPath: The picked views, most informative first
+        """
+        if self._path is not None and self._config == camera_config:
+            return self._path
+
+        import bpy
+
+        start_time = time.time()
+        candidates = SpiralPhiPathGenerator().generate_positions(
+            CameraConfig(
+                distance=camera_config.distance,
+                camera_density=camera_config.coverage_candidates,
+                sphere_coverage=camera_config.sphere_coverage
+            )
+        )
+        candidates.roll[:] = camera_config.roll
+
+        points, normals, vertices, triangles = sample_surface(
+            bpy.context.scene, camera_config.coverage_samples
+        )
+        if len(points) == 0:
+            logger.warning("Coverage path: no mesh surface to cover; using all candidates")
+            picked, coverage, surface_coverage = list(range(len(candidates))), 0.0, 0.0
+        else:
+            visibility = visibility_matrix(
+                candidates.locations(), points, normals, vertices, triangles
+            )
+            picked, coverage = greedy_cover(visibility, camera_config.coverage_target)
+            surface_coverage = float(visibility[picked].any(axis=0).mean()) if picked else 0.0
+
+        self._config = camera_config
+        self._path = candidates[np.array(picked, dtype=np.int64)]
+        self._stats = {
+            'coverage': {
+                'coverage': coverage,
+                'coverage_target': camera_config.coverage_target,
+                'surface_coverage': surface_coverage,
+                'selected_views': len(picked),
+                'candidate_views': len(candidates),
+                'surface_samples': len(points),
+                'planning_time': time.time() - start_time,
+            }
+        }
+        logger.info(
+            f"Coverage path: {len(picked)} of {len(candidates)} candidate views "
+            f"cover {coverage:.1%} of the visible surface"
+        )
+        return self._path
@@ -3,6 +3,7 @@
 from typing import List
 
 from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
 from renderer.config.camera_config import CameraConfig, SphereCoverage
 from renderer.utils.coordinates import SphericalCoordinate
 
@@ -14,7 +15,7 @@ class CubePathGenerator(CameraPathGenerator):
         """Return the unique name of the camera path type."""
         return "cube"
     
-    def generate_positions(self, camera_config: CameraConfig) -> List[SphericalCoordinate]:
+    def generate_positions(self, camera_config: CameraConfig) -> CameraPath:
         """Generate camera positions for 6 cube faces.
         
         Creates 6 camera positions corresponding to viewing the object
@@ -22,58 +23,17 @@ class CubePathGenerator(CameraPathGenerator):
         positions maintain consistent orientation and distance from the object.
         
         Returns:
-            List[SphericalCoordinate]: List of 6 camera positions for cube face views
+            CameraPath: 6 camera positions for cube face views
         """
-        # Define the 6 standard cube face views
-        cube_views = [
-            # Front view (0, 0, 0)
-            SphericalCoordinate(
-                radius=camera_config.distance,
-                azimuth=0,
-                elevation=0,
-                roll=0
-            ),
-            # Right view (-90, 0, 0)
-            SphericalCoordinate(
-                radius=camera_config.distance,
-                azimuth=90,
-                elevation=0,
-                roll=0
-            ),
-            # Back view (180, 0, 0)
-            SphericalCoordinate(
-                radius=camera_config.distance,
-                azimuth=180,
-                elevation=0,
-                roll=0
-            ),
-            # Left view (90, 0, 0)
-            SphericalCoordinate(
-                radius=camera_config.distance,
-                azimuth=270,
-                elevation=0,
-                roll=0
-            ),
-            # Top view (0, 90, 0)
-            SphericalCoordinate(
-                radius=camera_config.distance,
-                azimuth=0,
-                elevation=90,
-                roll=0
-            ),
-            # Bottom view (0, -90, 0)
-            SphericalCoordinate(
-                radius=camera_config.distance,
-                azimuth=0,
-                elevation=-90,
-                roll=0
-            )
-        ]
+        # The 6 standard cube face views: front, right, back, left, top, bottom
+        azimuth = [0, 90, 180, 270, 0, 0]
+        elevation = [0, 0, 0, 0, 90, -90]
+        cube_views = CameraPath(camera_config.distance, azimuth, elevation, 0)
         
         # Filter views based on sphere coverage
         if camera_config.sphere_coverage == SphereCoverage.HALF:
             # For half coverage, exclude bottom view and any views below horizon
-            cube_views = [view for view in cube_views if view.elevation >= 0]
+            cube_views = cube_views[cube_views.elevation >= 0]
         
         return cube_views
        
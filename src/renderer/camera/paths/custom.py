@@ -0,0 +1,87 @@
+"""Camera path generator for views read from a file."""
+
+import os
+from typing import Iterator
+
+import numpy as np
+
+from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
+from renderer.config.camera_config import CameraConfig
+
+# Columns of a custom path file, by number of columns; missing radius and roll
+# come from the camera config
+FILE_COLUMNS = {
+    2: ("azimuth", "elevation"),
+    3: ("azimuth", "elevation", "roll"),
+    4: ("radius", "azimuth", "elevation", "roll"),
+}
+
+# Row layout of raw (non-.npy) files
+RAW_DTYPE = np.dtype("<f8")
+RAW_COLUMNS = 4
+
+class CustomPathGenerator(CameraPathGenerator):
+    """Generates camera positions from a file of externally defined views.
+
+    The file (CameraConfig.custom_path_file) is memory-mapped, so only the
+    views of the chunk being rendered are read into memory. It is either:
+
+    - a .npy file of shape (N, 2), (N, 3) or (N, 4), with columns (azimuth,
+      elevation), (azimuth, elevation, roll) or (radius, azimuth, elevation,
+      roll) in degrees, as written by numpy.save()
+    - any other file: raw little-endian float64 rows of (radius, azimuth,
+      elevation, roll), as written by ndarray.tofile()
+    """
+
+    @property
+    def name(self) -> str:
+        """Return the unique name of the camera path type."""
+        return "custom"
+
+    def _views(self, camera_config: CameraConfig) -> np.ndarray:
+        """Memory-map the view rows of the custom path file."""
+        path = camera_config.custom_path_file
+        if not path or not os.path.isfile(path):
+            raise FileNotFoundError(f"Custom camera path file not found: {path}")
+        if path.lower().endswith(".npy"):
+            views = np.load(path, mmap_mode="r")
+        elif os.path.getsize(path) % (RAW_DTYPE.itemsize * RAW_COLUMNS):
+            raise ValueError(
+                f"Custom camera path file {path} is not a whole number of "
+                f"{RAW_COLUMNS}-column float64 rows"
+            )
+        elif os.path.getsize(path) == 0:
+            views = np.empty((0, RAW_COLUMNS), dtype=RAW_DTYPE)
+        else:
+            views = np.memmap(path, dtype=RAW_DTYPE, mode="r").reshape(-1, RAW_COLUMNS)
+        if views.ndim != 2 or views.shape[1] not in FILE_COLUMNS:
+            raise ValueError(
+                f"Custom camera path array must have shape (N, 2), (N, 3) or (N, 4); "
+                f"got {views.shape}"
+            )
+        return views
+
+    def _path(self, camera_config: CameraConfig, rows: np.ndarray) -> CameraPath:
+        """Build a CameraPath from file rows, filling in missing columns."""
+        columns = {"radius": camera_config.distance, "roll": camera_config.roll}
+        columns.update(zip(FILE_COLUMNS[rows.shape[1]], np.asarray(rows).T))
+        return CameraPath(**columns)
+
+    def count(self, camera_config: CameraConfig) -> int:
+        """Return the number of views in the file without reading them."""
+        return len(self._views(camera_config))
+
+    def generate_positions(self, camera_config: CameraConfig) -> CameraPath:
+        """Read all views of the custom path file.
+
+        Returns:
+            CameraPath: The views in file order
+        """
+        return self._path(camera_config, self._views(camera_config))
+
+    def iter_chunks(self, camera_config: CameraConfig, chunk_size: int) -> Iterator[CameraPath]:
+        """Read the views of the custom path file chunk_size rows at a time."""
+        views = self._views(camera_config)
+        for start in range(0, len(views), chunk_size):
+            yield self._path(camera_config, views[start:start + chunk_size])
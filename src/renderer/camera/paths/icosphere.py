@@ -0,0 +1,122 @@
+"""Camera path generator on a subdivided icosahedron (geodesic sphere).
+
+Level 0 is the 12 vertices of an icosahedron with a vertex at each pole;
+each further level adds the midpoints of the previous level's edges, pushed
+out onto the sphere, for 10 * 4**level + 2 views in all. The path lists the
+vertices coarse to fine, so the path of level k starts with the whole path
+of level k - 1: frame indices and coordinates of existing views never change
+when the level is raised, and a resumed render only renders the new views.
+
+Every complete level is evenly spread over the sphere. The 12 level-0 views
+are in farthest-point order, and each level's midpoints follow the order of
+the coarser views they lie between, so an interrupted level fills in around
+the earliest views first.
+"""
+
+import numpy as np
+
+from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
+from renderer.config.camera_config import CameraConfig, SphereCoverage
+
+def _icosahedron() -> tuple:
+    """Return the (12, 3) unit vertices and (20, 3) faces of an icosahedron
+    with vertices at the poles, vertices in farthest-point order."""
+    ring_height = 1 / np.sqrt(5)  # Rings at elevation +-atan(1/2)
+    ring_radius = 2 / np.sqrt(5)
+    upper = np.radians(np.arange(5) * 72.0)
+    lower = upper + np.radians(36.0)
+    vertices = np.concatenate([
+        [[0.0, 0.0, 1.0], [0.0, 0.0, -1.0]],
+        np.column_stack([ring_radius * np.sin(upper), ring_radius * np.cos(upper), np.full(5, ring_height)]),
+        np.column_stack([ring_radius * np.sin(lower), ring_radius * np.cos(lower), np.full(5, -ring_height)]),
+    ])
+    faces = []
+    for i in range(5):
+        u0, u1 = 2 + i, 2 + (i + 1) % 5
+        l0, l1 = 7 + i, 7 + (i + 1) % 5
+        faces += [(0, u0, u1), (u0, l0, u1), (u1, l0, l1), (1, l1, l0)]
+    faces = np.array(faces, dtype=np.int64)
+
+    # Farthest-point order, starting from the top view
+    order = [0]
+    nearest = vertices @ vertices[0]  # Cosine to the closest chosen vertex
+    for _ in range(len(vertices) - 1):
+        nearest[order] = np.inf
+        order.append(int(np.argmin(nearest)))
+        nearest = np.maximum(nearest, vertices @ vertices[order[-1]])
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return vertices[order], rank[faces]
+
+def _subdivide(vertices: np.ndarray, faces: np.ndarray) -> tuple:
+    """Split each face into four at its edge midpoints.
+
+    The midpoints are appended after the existing vertices, ordered by the
+    later and then the earlier of the two vertices they lie between.
+    """
+    edges = np.sort(faces[:, [[0, 1], [1, 2], [2, 0]]].reshape(-1, 2), axis=1)
+    unique_edges, inverse = np.unique(edges, axis=0, return_inverse=True)
+    order = np.lexsort((unique_edges[:, 0], unique_edges[:, 1]))
+    unique_edges = unique_edges[order]
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+
+    midpoints = vertices[unique_edges[:, 0]] + vertices[unique_edges[:, 1]]
+    midpoints /= np.linalg.norm(midpoints, axis=1, keepdims=True)
+    ab, bc, ca = (len(vertices) + rank[inverse.reshape(-1)]).reshape(-1, 3).T
+    a, b, c = faces.T
+    faces = np.concatenate([
+        np.column_stack([a, ab, ca]),
+        np.column_stack([b, bc, ab]),
+        np.column_stack([c, ca, bc]),
+        np.column_stack([ab, bc, ca]),
+    ])
+    return np.concatenate([vertices, midpoints]), faces
+
+def icosphere_mesh(level: int) -> tuple:
+    """Return the (10 * 4**level + 2, 3) unit vertices of an icosphere, coarse
+    to fine, and its (20 * 4**level, 3) triangles."""
+    vertices, faces = _icosahedron()
+    for _ in range(level):
+        vertices, faces = _subdivide(vertices, faces)
+    return vertices, faces
+
+def icosphere_vertices(level: int) -> np.ndarray:
+    """Return the (10 * 4**level + 2, 3) unit vertices of an icosphere, coarse to fine."""
+    return icosphere_mesh(level)[0]
+
+def directions_to_path(directions: np.ndarray, camera_config: CameraConfig) -> CameraPath:
+    """Return views from (N, 3) unit directions at the configured distance and roll."""
+    azimuth = np.mod(np.degrees(np.arctan2(directions[:, 0], directions[:, 1])), 360.0)
+    elevation = np.degrees(np.arcsin(np.clip(directions[:, 2], -1.0, 1.0)))
+    return CameraPath(camera_config.distance, azimuth, elevation, camera_config.roll)
+
+class IcospherePathGenerator(CameraPathGenerator):
+    """Generates nested, evenly spaced views on a geodesic sphere."""
+
+    @property
+    def name(self) -> str:
+        """Return the unique name of the camera path type."""
+        return "icosphere"
+
+    def count(self, camera_config: CameraConfig) -> int:
+        """Return the number of views without generating them (FULL coverage)."""
+        if camera_config.sphere_coverage == SphereCoverage.HALF:
+            return super().count(camera_config)
+        return 10 * 4 ** camera_config.icosphere_level + 2
+
+    def generate_positions(self, camera_config: CameraConfig) -> CameraPath:
+        """Generate the views of icosphere level camera_config.icosphere_level.
+
+        With SphereCoverage.HALF only views at or above the equator are kept,
+        which preserves the coarse-to-fine order.
+
+        Returns:
+            CameraPath: 10 * 4**level + 2 views (FULL), coarse to fine
+        """
+        vertices = icosphere_vertices(camera_config.icosphere_level)
+        positions = directions_to_path(vertices, camera_config)
+        if camera_config.sphere_coverage == SphereCoverage.HALF:
+            positions = positions[vertices[:, 2] >= -1e-9]
+        return positions
@@ -1,10 +1,10 @@
 """Camera path generator for top and bottom down views with rotation."""
 
-from typing import List
+import numpy as np
 
 from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
 from renderer.config.camera_config import CameraConfig, SphereCoverage
-from renderer.utils.coordinates import SphericalCoordinate
 
 class PoleRotationPathGenerator(CameraPathGenerator):
     """Generates a smooth rotation near poles while ensuring visible azimuth changes."""
@@ -13,7 +13,7 @@ class PoleRotationPathGenerator(CameraPathGenerator):
     def name(self) -> str:
         return "pole_rotation"
        
-    def generate_positions(self, camera_config: CameraConfig) -> List[SphericalCoordinate]:
+    def generate_positions(self, camera_config: CameraConfig) -> CameraPath:
         """Generate camera positions for smooth rotation near the poles.
 
         The method ensures azimuth changes are visible near the poles by offsetting elevation angles.
@@ -24,23 +24,16 @@ class PoleRotationPathGenerator(CameraPathGenerator):
             camera_config: Camera configuration parameters
         
         Returns:
-            List[SphericalCoordinate]: List of camera positions for pole rotations.
+            CameraPath: Camera positions for pole rotations.
         """
         #TODO: move frames_per_rotation to camera_config 
         frames_per_rotation = 30  # Adjust for rotation speed
         tilt_offset = 2  # Fixed offset from 90° and -90°
-        radius = camera_config.distance
-        roll = camera_config.roll
+        azimuth = (np.arange(frames_per_rotation) / frames_per_rotation) * 360
+        elevation = np.full(frames_per_rotation, 90.0 - tilt_offset)
 
-        positions = [
-            SphericalCoordinate(radius, (i / frames_per_rotation) * 360, 90 - tilt_offset, roll)
-            for i in range(frames_per_rotation)
-        ]
-        
         if camera_config.sphere_coverage == SphereCoverage.FULL:
-            positions.extend(
-                SphericalCoordinate(radius, (i / frames_per_rotation) * 360, -90 + tilt_offset, roll)
-                for i in range(frames_per_rotation)
-            )
-        
-        return positions
+            azimuth = np.concatenate([azimuth, azimuth])
+            elevation = np.concatenate([elevation, -elevation])
+
+        return CameraPath(camera_config.distance, azimuth, elevation, camera_config.roll)
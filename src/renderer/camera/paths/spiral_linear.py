@@ -1,10 +1,10 @@
 """Generates camera positions in a spiral pattern of rings with adaptive step sizing."""
 
-from typing import List
+import numpy as np
 
 from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
 from renderer.config.camera_config import CameraConfig, SphereCoverage
-from renderer.utils.coordinates import SphericalCoordinate
 
 class SpiralLinearPathGenerator(CameraPathGenerator):
     """Generates camera positions in a spiral pattern of rings with adaptive step sizing."""
@@ -14,7 +14,7 @@ class SpiralLinearPathGenerator(CameraPathGenerator):
         """Return the unique name of the camera path type."""
         return "spiral_lin"
     
-    def generate_positions(self, camera_config: CameraConfig) -> List[SphericalCoordinate]:
+    def generate_positions(self, camera_config: CameraConfig) -> CameraPath:
         """
         Generates camera positions in a spiral pattern of rings with adaptive azimuth steps.
 
@@ -31,18 +31,15 @@ class SpiralLinearPathGenerator(CameraPathGenerator):
                 or HALF (70° to 0°).
 
         Returns:
-            List[SphericalCoordinate]: A list of spherical coordinates representing 
-            the camera positions.
+            CameraPath: The camera positions, ring by ring.
         
         Notes:
         - Elevation range is fixed from 70° to -70° (FULL) or 70° to 0° (HALF) to
           prevent instability near poles.
         - Azimuth steps are adaptive, with smaller steps near the poles.
-        - Ensures smooth wrap-around handling for azimuth values.
+        - An angular step larger than the elevation range gives a single ring
+          at 70°.
         """
-        coords = []
-        last_azimuth = 0
-        
         # Basic parameters
         max_elevation = 70 # TODO: modify to camera_config.max_elevation but with a warning
         base_angular_step = camera_config.angular_step
@@ -55,42 +52,24 @@ class SpiralLinearPathGenerator(CameraPathGenerator):
         
         num_elevation_steps = int(elevation_range / base_angular_step)
         
-        # Generate points with adaptive stepping
-        for i in range(num_elevation_steps + 1):
-            # Calculate elevation
-            t = i / num_elevation_steps
-            elevation = max_elevation - (elevation_range * t)
-            
-            # Calculate adaptive azimuth step for this elevation
-            # More points at higher elevations for smoother transitions
-            elevation_factor = abs(elevation / max_elevation)  
-            # scale 0.5 at max elevation, 1.0 at equator
-            scale_factor = 0.5 + (0.5 * (1 - elevation_factor))  
-            azimuth_step = base_angular_step * scale_factor
-            
-            # Calculate number of points for this elevation
-            points_at_elevation = int(360 / azimuth_step)
-            
-            # Generate points around this elevation ring
-            for j in range(points_at_elevation):
-                # Calculate raw azimuth
-                current_azimuth = (j * azimuth_step) % 360
-                
-                # Handle wrap-around for smooth transitions
-                if j > 0:
-                    if current_azimuth - last_azimuth > 180:
-                        current_azimuth -= 360
-                    elif current_azimuth - last_azimuth < -180:
-                        current_azimuth += 360
-                
-                coords.append(SphericalCoordinate(
-                    radius=camera_config.distance,
-                    azimuth=current_azimuth % 360,
-                    elevation=elevation,
-                    roll=camera_config.roll
-                ))
-                
-                last_azimuth = current_azimuth
+        # Elevation of each ring
+        t = np.arange(num_elevation_steps + 1) / max(num_elevation_steps, 1)
+        ring_elevation = max_elevation - (elevation_range * t)
+        
+        # Calculate adaptive azimuth step for each ring
+        # More points at higher elevations for smoother transitions
+        elevation_factor = np.abs(ring_elevation / max_elevation)
+        # scale 0.5 at max elevation, 1.0 at equator
+        scale_factor = 0.5 + (0.5 * (1 - elevation_factor))
+        azimuth_step = base_angular_step * scale_factor
+        
+        # Calculate number of points for each ring
+        points_at_elevation = (360 / azimuth_step).astype(np.int64)
         
-        return coords
+        # Index of every point within its ring; a ring never passes 360°
+        ring_start = np.cumsum(points_at_elevation) - points_at_elevation
+        j = np.arange(points_at_elevation.sum()) - np.repeat(ring_start, points_at_elevation)
+        azimuth = (j * np.repeat(azimuth_step, points_at_elevation)) % 360
+        elevation = np.repeat(ring_elevation, points_at_elevation)
         
+        return CameraPath(camera_config.distance, azimuth, elevation, camera_config.roll)
@@ -3,11 +3,15 @@
 full azimuthal rotation at high elevation then descending with controlled,
 consistent steps."""
 
-from typing import List
+import math
+from fractions import Fraction
+from typing import Tuple
+
+import numpy as np
 
 from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
 from renderer.config.camera_config import CameraConfig, SphereCoverage
-from renderer.utils.coordinates import SphericalCoordinate
 
 class SpiralPhasedPathGenerator(CameraPathGenerator):
     """Generates camera positions in a spiral pattern with adaptive step sizing."""
@@ -17,13 +21,45 @@ class SpiralPhasedPathGenerator(CameraPathGenerator):
         """Return the unique name of the camera path type."""
         return "spiral_phased"    
 
-    def generate_positions(self, camera_config: CameraConfig) -> List[SphericalCoordinate]:
+    def _rings(self, camera_config: CameraConfig) -> Tuple[int, np.ndarray]:
+        """Return the number of views per ring and the elevation of each ring."""
+        base_step = camera_config.angular_step  # Base step for azimuth changes
+        elevation_step = base_step / 2  # Smaller elevation steps for smoother descent
+
+        # Determine final elevation based on sphere coverage
+        final_elevation = 0 if camera_config.sphere_coverage == SphereCoverage.HALF else -85
+
+        # A ring ends when the azimuth comes back to exactly 0°, after
+        # 360 / gcd(step, 360) views for an integer step; the step is read as
+        # the nearest fraction so that steps like 0.1 return to 0° as well
+        step = Fraction(base_step).limit_denominator(10**6)
+        ring_size = (360 / step).numerator
+        descent_rings = math.floor((83 - final_elevation) / elevation_step + 1e-9) + 1
+
+        # Phase 1 ring at 85°, then the phase 2 rings from 83° down to the final elevation
+        ring_elevation = np.concatenate([
+            [85.0], 83 - elevation_step * np.arange(descent_rings)
+        ])
+        return ring_size, ring_elevation
+
+    def count(self, camera_config: CameraConfig) -> int:
+        """Return the number of views without generating them."""
+        ring_size, ring_elevation = self._rings(camera_config)
+        return ring_size * len(ring_elevation)
+
+    def generate_positions(self, camera_config: CameraConfig) -> CameraPath:
         """
         Generates camera positions in a two-phase spiral pattern.
 
-        The method begins with a full azimuthal rotation near the zenith (87° elevation) before
+        The method begins with a full azimuthal rotation near the zenith (85° elevation) before
         transitioning into a gradual spiral descent. The descent maintains predictable step sizes
-        in both azimuth and elevation, ensuring uniform coverage.
+        in both azimuth and elevation, ensuring uniform coverage: the azimuth advances by
+        angular_step per view, and the elevation drops by angular_step / 2 each time the
+        azimuth comes back to 0°, down to 0° (HALF) or -85° (FULL).
+
+        A ring therefore holds 360 / gcd(angular_step, 360) views for an integer step: 360 / step
+        if the step divides 360, but e.g. 360 views for a 7° step, which circles the model
+        seven times before it returns to 0° (18000 views for the FULL sphere).
 
         Parameters:
             camera_config (CameraConfig): Configuration object containing:
@@ -32,47 +68,13 @@ class SpiralPhasedPathGenerator(CameraPathGenerator):
                 - angular_step: Base step size for azimuth calculations.
 
         Returns:
-            List[SphericalCoordinate]: A list of spherical coordinates defining the camera positions.
+            CameraPath: The camera positions, ring by ring.
         """
-        coords = []
-        base_step = camera_config.angular_step  # Base step for azimuth changes
-        elevation_step = base_step / 2  # Smaller elevation steps for smoother descent
-
-        # Initial conditions
-        current_elevation = 85
-        current_azimuth = 0
-
-        # Determine final elevation based on sphere coverage
-        final_elevation = 0 if camera_config.sphere_coverage == SphereCoverage.HALF else -85
-
-        # Phase 1: Full rotation at the highest elevation (85°)
-        while current_elevation == 85:
-            coords.append(SphericalCoordinate(
-                radius=camera_config.distance,
-                azimuth=current_azimuth,
-                elevation=current_elevation,
-                roll=camera_config.roll
-            ))
-            current_azimuth = (current_azimuth + base_step) % 360
-
-            # After one full rotation, start descent
-            if current_azimuth == 0:
-                current_elevation = 83
-
-        # Phase 2: Spiral descent
-        while current_elevation >= final_elevation:
-            coords.append(SphericalCoordinate(
-                radius=camera_config.distance,
-                azimuth=current_azimuth,
-                elevation=current_elevation,
-                roll=camera_config.roll
-            ))
-
-            # Increment azimuth continuously
-            current_azimuth = (current_azimuth + base_step) % 360
-
-            # Decrease elevation only after completing a full rotation
-            if current_azimuth == 0:
-                current_elevation -= elevation_step
-
-        return coords
+        ring_size, ring_elevation = self._rings(camera_config)
+        ring_azimuth = (np.arange(ring_size) * camera_config.angular_step) % 360
+        return CameraPath(
+            radius=camera_config.distance,
+            azimuth=np.tile(ring_azimuth, len(ring_elevation)),
+            elevation=np.repeat(ring_elevation, ring_size),
+            roll=camera_config.roll
+        )
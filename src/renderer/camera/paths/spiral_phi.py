@@ -1,11 +1,10 @@
 """Camera path generator for spiral views based on the Golden ratio (phi)."""
 
-from typing import List
 import numpy as np
 
 from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
 from renderer.config.camera_config import CameraConfig, SphereCoverage
-from renderer.utils.coordinates import SphericalCoordinate
 
 class SpiralPhiPathGenerator(CameraPathGenerator):
     """Generates camera positions for spiral view (phi)."""
@@ -15,30 +14,26 @@ class SpiralPhiPathGenerator(CameraPathGenerator):
         """Return the unique name of the camera path type."""
         return "spiral_phi"
     
-    def generate_positions(self, camera_config: CameraConfig) -> List[SphericalCoordinate]:
+    def generate_positions(self, camera_config: CameraConfig) -> CameraPath:
         """Generate camera positions evenly distributed over a sphere.
 
         Starts from top-down view and spirals down using Golden ratio (phi)
         When SphereCoverage.HALF is specified, the bottom half is excluded.
+        A density of 1 gives the top-down view only.
         
         Returns:
-            List[SphericalCoordinate]: List of camera positions in spherical coordinates.
+            CameraPath: Camera positions in spherical coordinates.
         """
-        
-        radius = camera_config.distance
         camera_density = camera_config.camera_density
-        positions = []
-        
         golden_ratio = (1 + np.sqrt(5)) / 2  # For even azimuthal spacing
-        indices = reversed(range(camera_density))  # Reverse order to start from the top
-        
-        for i in indices:
-            elevation = np.degrees(np.arcsin(-1 + 2 * i / (camera_density - 1)))  # -90° to 90°
-            azimuth = (360 * (i / golden_ratio)) % 360  # Spread around sphere
-            
-            if camera_config.sphere_coverage == SphereCoverage.HALF and elevation < 0:
-                continue  # Skip bottom hemisphere for half-sphere coverage
-            
-            positions.append(SphericalCoordinate(radius, azimuth, elevation, 0))
-        
+        indices = np.arange(camera_density - 1, -1, -1)  # Reverse order to start from the top
+
+        heights = -1 + 2 * indices / (camera_density - 1) if camera_density > 1 else np.ones(1)
+        elevation = np.degrees(np.arcsin(heights))  # -90° to 90°
+        azimuth = (360 * (indices / golden_ratio)) % 360  # Spread around sphere
+        positions = CameraPath(camera_config.distance, azimuth, elevation, 0)
+
+        if camera_config.sphere_coverage == SphereCoverage.HALF:
+            positions = positions[elevation >= 0]  # Skip bottom hemisphere for half-sphere coverage
+
         return positions
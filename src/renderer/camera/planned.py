@@ -0,0 +1,46 @@
+# src/renderer/camera/planned.py
+"""Serve a camera path that was generated once, elsewhere.
+
+Paths planned from the imported model (coverage, adaptive) are costly to
+plan, and the adaptive path depends on probe renders. A sharded render plans
+such a path once in the parent process and sends it to every worker wrapped
+in a PlannedPathGenerator, so that all workers render the same views without
+planning them again.
+"""
+
+from renderer.camera.base import CameraPathGenerator
+from renderer.camera.path import CameraPath
+
+class PlannedPathGenerator(CameraPathGenerator):
+    """Generator returning a path generated up front, with its stats.
+
+    Args:
+        generator: Generator that plans the path
+        camera_config: Config the path is planned for
+    """
+
+    def __init__(self, generator: CameraPathGenerator, camera_config):
+        self._name = generator.name
+        self._config = camera_config
+        self._path = generator.generate_positions(camera_config)
+        self._stats = dict(generator.stats)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the generator that planned the path."""
+        return self._name
+
+    @property
+    def stats(self) -> dict:
+        """Return the stats of the planned path."""
+        return self._stats
+
+    def generate_positions(self, camera_config) -> CameraPath:
+        """Return the planned path; camera_config must be the one it was planned for."""
+        if camera_config != self._config:
+            raise ValueError("The camera path was planned for a different camera config")
+        return self._path
+
+    def count(self, camera_config) -> int:
+        """Return the number of views of the planned path."""
+        return len(self.generate_positions(camera_config))
@@ -9,6 +9,10 @@ from renderer.camera.paths.spiral_phi import SpiralPhiPathGenerator
 from renderer.camera.paths.spiral_linear import SpiralLinearPathGenerator
 from renderer.camera.paths.spiral_phased import SpiralPhasedPathGenerator
 from renderer.camera.paths.pole_rotation import PoleRotationPathGenerator
+from renderer.camera.paths.custom import CustomPathGenerator
+from renderer.camera.paths.coverage import CoveragePathGenerator
+from renderer.camera.paths.icosphere import IcospherePathGenerator
+from renderer.camera.paths.adaptive import AdaptivePathGenerator
 # Import other generators...
 
 class CameraPathRegistry:
@@ -59,5 +63,9 @@ camera_registry.register(SpiralPhiPathGenerator)
 camera_registry.register(PoleRotationPathGenerator)
 camera_registry.register(SpiralLinearPathGenerator)
 camera_registry.register(SpiralPhasedPathGenerator)
+camera_registry.register(CustomPathGenerator)
+camera_registry.register(CoveragePathGenerator)
+camera_registry.register(IcospherePathGenerator)
+camera_registry.register(AdaptivePathGenerator)
 # Register new generators here...
 
@@ -4,18 +4,29 @@
 from renderer.config.blend_config import BlendFileConfig
 from renderer.config.camera_config import CameraConfig, CameraPathType, SphereCoverage
 from renderer.config.lighting_config import LightingConfig, LightType, LightSetup
-from renderer.config.render_config import RenderConfig, Background
+from renderer.config.render_config import (
+    RenderConfig,
+    Background,
+    BorderMode,
+    OutputFormat,
+    RenderEngine,
+    RenderPass
+)
 
 __all__ = [
     'BlendFileConfig',
     'Background',
+    'BorderMode',
     'CameraConfig',
-    'CameraPathType'
+    'CameraPathType',
     'SphereCoverage',
     'LightingConfig',
     'LightType',
     'LightSetup',
-    'RenderConfig'
+    'OutputFormat',
+    'RenderConfig',
+    'RenderEngine',
+    'RenderPass'
 ]
 
 
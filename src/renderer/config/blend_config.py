@@ -10,7 +10,22 @@ class BlendFileConfig:
         keep_lights: Whether to preserve existing lights
         keep_materials: Whether to preserve existing materials
         keep_world_settings: Whether to preserve world settings
+        bake_materials: Bake kept procedural materials to image textures
+            once before rendering (requires keep_materials)
+        bake_type: "DIFFUSE" (surface color, lit by the renderer's lights) or
+            "COMBINED" (color and the .blend's own lighting)
+        bake_resolution: Width and height of each baked image in pixels
     """
     keep_lights: bool = False
     keep_materials: bool = True
     keep_world_settings: bool = False
+    bake_materials: bool = False
+    bake_type: str = "DIFFUSE"
+    bake_resolution: int = 1024
+
+    def __post_init__(self):
+        """Validate configuration after initialization."""
+        if self.bake_type not in {"DIFFUSE", "COMBINED"}:
+            raise ValueError("Bake type must be either 'DIFFUSE' or 'COMBINED'")
+        if self.bake_resolution <= 0:
+            raise ValueError("Bake resolution must be positive")
@@ -3,6 +3,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Optional
 
 class SphereCoverage(Enum):
     """Render all angles or top half of the model only."""
@@ -19,6 +20,10 @@ class CameraPathType(Enum):
         POLE_ROTATION: Focused rotation near poles
         CUBE: Six standard orthographic views
         ORBIT: Simple horizontal orbit
+        CUSTOM: Views read from a file (see CameraConfig.custom_path_file)
+        COVERAGE: Fewest views seeing a target fraction of the model's surface
+        ICOSPHERE: Geodesic sphere views, nested across levels, coarse to fine
+        ADAPTIVE: Coarse icosphere views, refined where neighbouring images differ
     """
     SPIRAL_PHI = "spiral_phi"
     SPIRAL_LINEAR = "spiral_lin"
@@ -26,6 +31,10 @@ class CameraPathType(Enum):
     POLE_ROTATION = "pole_rotation"
     CUBE = "cube"
     ORBIT = "orbit"
+    CUSTOM = "custom"
+    COVERAGE = "coverage"
+    ICOSPHERE = "icosphere"
+    ADAPTIVE = "adaptive"
 
 @dataclass
 class CameraConfig:
@@ -40,6 +49,27 @@ class CameraConfig:
         camera_density: Number of total images for phi spiral or orbit
         angular_step: Base angular step for linear and phased spiral
         sphere_coverage: Camera coverage (FULL or HALF) of model
+        custom_path_file: Views of the CUSTOM path: a .npy array, or a raw
+            file of little-endian float64 values, with one row per view
+            (see renderer.camera.paths.custom)
+        coverage_target: Fraction of the visible surface the COVERAGE path
+            must see
+        coverage_candidates: Candidate views the COVERAGE path picks from
+        coverage_samples: Surface points sampled to measure coverage
+        icosphere_level: Subdivisions of the ICOSPHERE path; level k has
+            10 * 4**k + 2 views and contains all views of level k - 1
+        refine_level: Icosphere level of the ADAPTIVE path's coarse views
+        refine_threshold: RMS difference (on a [0, 1] scale) between the
+            probe images of neighbouring views above which the ADAPTIVE
+            path adds a view between them
+        refine_budget: Largest number of ADAPTIVE path views; the coarse
+            views are always kept
+        refine_resolution: Width and height in pixels of the ADAPTIVE
+            path's probe images
+        dedup_tolerance: Drop views within this angle in degrees of an
+            earlier view of the path (0 keeps every view)
+        dedup_ignore_roll: Also drop views that differ from an earlier one
+            only by in-plane rotation
 
     Notes
     -----
@@ -56,6 +86,17 @@ class CameraConfig:
     camera_density: int = 35
     angular_step: float = 45.0
     sphere_coverage: SphereCoverage = SphereCoverage.FULL
+    custom_path_file: Optional[str] = None
+    coverage_target: float = 0.95
+    coverage_candidates: int = 256
+    coverage_samples: int = 1024
+    icosphere_level: int = 2
+    refine_level: int = 1
+    refine_threshold: float = 0.05
+    refine_budget: int = 162
+    refine_resolution: int = 32
+    dedup_tolerance: float = 0.0
+    dedup_ignore_roll: bool = False
     
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -76,4 +117,23 @@ class CameraConfig:
             raise ValueError("Camera density must be positive")
         if self.angular_step <= 0:
             raise ValueError("Angular step must be positive")
-
+        if self.camera_path_type == CameraPathType.CUSTOM and not self.custom_path_file:
+            raise ValueError("The custom camera path requires a custom_path_file")
+        if not 0 < self.coverage_target <= 1:
+            raise ValueError("Coverage target must be in (0, 1]")
+        if self.coverage_candidates <= 0:
+            raise ValueError("Coverage candidates must be positive")
+        if self.coverage_samples <= 0:
+            raise ValueError("Coverage samples must be positive")
+        if not 0 <= self.icosphere_level <= 8:
+            raise ValueError("Icosphere level must be between 0 and 8")
+        if not 0 <= self.refine_level <= 8:
+            raise ValueError("Refinement level must be between 0 and 8")
+        if self.refine_threshold <= 0:
+            raise ValueError("Refinement threshold must be positive")
+        if self.refine_budget <= 0:
+            raise ValueError("Refinement budget must be positive")
+        if self.refine_resolution <= 0:
+            raise ValueError("Refinement probe resolution must be positive")
+        if not 0 <= self.dedup_tolerance < 180:
+            raise ValueError("Deduplication tolerance must be between 0 and 180 degrees")
@@ -1,14 +1,38 @@
 """Render configuration settings."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Union, Tuple, List
+from typing import Union, Tuple, List, Optional
 
 class Background(Enum):
     """Background type for renders."""
     WHITE = "white"
     TRANSPARENT = "transparent"
 
+class BorderMode(Enum):
+    """Whether to render only the region around the model's projected bounds."""
+    NONE = "none"  # Trace every pixel
+    CROP = "crop"  # Save only the region (image size varies per frame)
+    FULL_FRAME = "full_frame"  # Save full-size frames, background filled outside
+
+class RenderEngine(Enum):
+    """Render engine, from path traced to fast preview."""
+    CYCLES = "cycles"
+    EEVEE = "eevee"
+    WORKBENCH = "workbench"
+
+class RenderPass(Enum):
+    """Extra render passes written next to the beauty image."""
+    DEPTH = "depth"
+    NORMAL = "normal"
+    OBJECT_INDEX = "object_index"
+    ALPHA = "alpha"
+
+class OutputFormat(Enum):
+    """How rendered frames are stored in the output directory."""
+    FILES = "files"  # One PNG file per frame
+    TAR_SHARDS = "tar_shards"  # WebDataset-style tar shards with JSON sidecars
+
 @dataclass
 class RenderConfig:
     """Configuration for render settings.
@@ -17,15 +41,87 @@ class RenderConfig:
         resolution: Output resolution in pixels. A single integer 
             for square image or tuple/list for (width,height).
         samples: Number of render samples
+        engine: Render engine. EEVEE and WORKBENCH need a GPU context; without 
+            one the render falls back to Cycles at a few samples with denoising.
         device: Render device ("GPU" or "CPU")
         use_denoising: Whether to use denoising
+        autotune_samples: Probe a few views and lower samples (and loosen the
+            adaptive threshold) as far as noise_target allows; samples is the
+            reference and upper bound. Cycles only.
+        noise_target: Largest RMSE (0-1 scale) of autotuned probes against
+            the reference render
+        autotune_views: Number of probe views taken from the camera path
         background: Background type (WHITE or TRANSPARENT)
+        border_mode: Render only a padded region around the model's projected
+            bounding box (CROP or FULL_FRAME), or every pixel (NONE)
+        border_padding: Margin around the projected bounding box, as a
+            fraction of the frame
+        lod_decimation: Decimate meshes whose triangles are too small to see
+            from the closest camera on the path
+        lod_max_error_px: Projected edge length in pixels below which detail
+            may be collapsed away by lod_decimation
+        downscale_textures: Reduce image textures to the smallest mip that
+            still resolves the model at the output resolution
+        symmetry_aliasing: Render only one fundamental domain of views of a
+            model (and lighting) that is rotationally or mirror symmetric
+            about the vertical axis, and write the other views as copies.
+            Geometry and materials are tested, textures are not.
+        symmetry_tolerance: Distance within which vertices match under a
+            symmetry, as a fraction of the model's radius
+        workers: Number of Blender processes to split the camera path across
+        threads: Render threads per process (None: all cores divided by workers)
+        bake_animation: Bake the camera path (and moving lights) into keyframes
+            and render it with a single animation render call
+        path_chunk_size: Camera views generated, posed and rendered at a time;
+            bounds memory use for very long or file-backed camera paths
+        verify_resume: When resuming, check the checksum of each completed
+            frame rather than only its size (reads every frame once)
+        cache_dir: Directory of a render cache shared across jobs (None: no cache)
+        cache_max_size_mb: Size limit of the render cache in megabytes
+        scene_cache_dir: Directory of prepared-scene snapshots (imported and
+            normalized models as .blend files) and downscaled textures shared
+            across jobs (None: none)
+        scene_cache_max_size_mb: Size limit of the scene cache in megabytes
+        encode_workers: Threads encoding and writing PNGs while the next frame
+            renders (0: Blender writes each PNG before the next render starts)
+        output_format: One PNG file per frame (FILES) or rolling tar shards of
+            PNGs and JSON sidecars plus a shards.json index (TAR_SHARDS)
+        shard_size_mb: Size at which a new tar shard is started, in megabytes
+        passes: Extra passes written by the same render as each frame, as
+            <frame name>_<pass>.exr/.png
+        pass_format: File format of the passes, "EXR" (32-bit float) or
+            "PNG" (16-bit, values remapped into [0, 1])
     """
     resolution: Union[int, Tuple[int, int], List[int]] = 1024
     samples: int = 128
+    engine: RenderEngine = RenderEngine.CYCLES
     device: str = "GPU"
     use_denoising: bool = True
+    autotune_samples: bool = False
+    noise_target: float = 0.01
+    autotune_views: int = 3
     background: Background = Background.WHITE
+    border_mode: BorderMode = BorderMode.NONE
+    border_padding: float = 0.05
+    lod_decimation: bool = False
+    lod_max_error_px: float = 1.0
+    downscale_textures: bool = False
+    symmetry_aliasing: bool = False
+    symmetry_tolerance: float = 0.005
+    workers: int = 1
+    threads: Optional[int] = None
+    bake_animation: bool = False
+    path_chunk_size: int = 4096
+    verify_resume: bool = False
+    cache_dir: Optional[str] = None
+    cache_max_size_mb: int = 10240
+    scene_cache_dir: Optional[str] = None
+    scene_cache_max_size_mb: int = 4096
+    encode_workers: int = 0
+    output_format: OutputFormat = OutputFormat.FILES
+    shard_size_mb: int = 1024
+    passes: List[RenderPass] = field(default_factory=list)
+    pass_format: str = "EXR"
     # quiet: bool = True #  TO DO. Implemented elsewhere by default
           
     def __post_init__(self):
@@ -45,9 +141,47 @@ class RenderConfig:
         if self.samples <= 0:
             raise ValueError("Samples must be positive")
 
+        if self.noise_target <= 0:
+            raise ValueError("Noise target must be positive")
+        if self.autotune_views <= 0:
+            raise ValueError("Autotune views must be positive")
+
+        if not isinstance(self.engine, RenderEngine):
+            raise ValueError("Engine must be a RenderEngine")
+
         if self.device not in {"GPU", "CPU"}:
             raise ValueError("Device must be either 'GPU' or 'CPU'")
 
+        if not isinstance(self.border_mode, BorderMode):
+            raise ValueError("Border mode must be a BorderMode")
+        if not 0 <= self.border_padding < 0.5:
+            raise ValueError("Border padding must be in [0, 0.5)")
+        if self.lod_max_error_px <= 0:
+            raise ValueError("LOD error bound must be positive")
+        if not 0 < self.symmetry_tolerance < 1:
+            raise ValueError("Symmetry tolerance must be in (0, 1)")
+
+        if self.workers <= 0:
+            raise ValueError("Workers must be positive")
+        if self.threads is not None and self.threads <= 0:
+            raise ValueError("Threads must be positive")
+        if self.path_chunk_size <= 0:
+            raise ValueError("Path chunk size must be positive")
+        if self.cache_max_size_mb <= 0:
+            raise ValueError("Cache size limit must be positive")
+        if self.scene_cache_max_size_mb <= 0:
+            raise ValueError("Scene cache size limit must be positive")
+        if self.encode_workers < 0:
+            raise ValueError("Encode workers must not be negative")
+        if not isinstance(self.output_format, OutputFormat):
+            raise ValueError("Output format must be an OutputFormat")
+        if self.shard_size_mb <= 0:
+            raise ValueError("Shard size must be positive")
+        if not all(isinstance(p, RenderPass) for p in self.passes):
+            raise ValueError("Passes must be RenderPass values")
+        if self.pass_format not in {"EXR", "PNG"}:
+            raise ValueError("Pass format must be either 'EXR' or 'PNG'")
+
     @property
     def resolution_x(self) -> int:
         """Get the x-resolution."""
@@ -17,6 +17,11 @@ class BaseLightSetup(ABC):
         self.config = config
         self._lights: List[bpy.types.Object] = []
 
+    @property
+    def lights(self) -> List[bpy.types.Object]:
+        """Lights created by the last create_lights() call."""
+        return list(self._lights)
+
     @abstractmethod
     def create_lights(self) -> List[bpy.types.Object]:
         """Create and return the initial light setup."""
@@ -27,6 +32,14 @@ class BaseLightSetup(ABC):
         """Update light positions based on camera angle."""
         pass
 
+    def insert_keyframes(self, frame: int) -> None:
+        """Keyframe the current light positions for an animation render.
+        
+        Lights that never move need no keyframes, so this does nothing by
+        default. Setups that move lights in update_positions() override it.
+        """
+        pass
+
     def _create_light(self) -> bpy.types.Object:
         """Helper method to create a single light with common properties."""
         bpy.ops.object.light_add(type=self.config.light_type.value)
@@ -39,5 +39,8 @@ class RandomDynamicLightSetup(BaseLightSetup):
             light.location = (x, y, self.config.light_height)
             light.rotation_euler = (math.radians(-45), 0, math.radians(angle))
 
-
-
+    def insert_keyframes(self, frame: int) -> None:
+        """Keyframe the light positions set by the last update_positions() call."""
+        for light in self._lights:
+            light.keyframe_insert("location", frame=frame)
+            light.keyframe_insert("rotation_euler", frame=frame)
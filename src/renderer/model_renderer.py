@@ -4,23 +4,79 @@ import gc
 import math
 import os
 import sys
+import tempfile
 import time
-from typing import List, Optional
+from dataclasses import asdict, replace
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Tuple
 from contextlib import contextmanager, redirect_stdout
 
 import bpy
 import numpy as np
+from bpy_extras.object_utils import world_to_camera_view
 from mathutils import Vector
 from tqdm import tqdm
 
-from renderer.config.render_config import RenderConfig, Background
+from renderer.config.render_config import (
+    RenderConfig,
+    Background,
+    BorderMode,
+    OutputFormat,
+    RenderEngine,
+    RenderPass
+)
 from renderer.config.lighting_config import LightingConfig
 from renderer.config.camera_config import CameraConfig
 from renderer.config.blend_config import BlendFileConfig
+from renderer.utils.autotune import AutotuneCache, SampleAutotuner, SampleSettings, probe_indices
+from renderer.utils.bake import bake_procedural_materials
+from renderer.utils.border import (
+    Region,
+    border_region,
+    fill_outside_region,
+    region_area,
+    union_region
+)
+from renderer.utils.budget import plan_budget
+from renderer.utils.cache import RenderCache
+from renderer.utils.capture import FrameCapture
 from renderer.utils.coordinates import SphericalCoordinate
+from renderer.utils.engine import FALLBACK_SAMPLES, gpu_context_available
+from renderer.utils.hashing import canonicalize, config_hash, file_checksum
+from renderer.utils.lod import bvh_build_cost, lod_ratio, pixels_per_unit, surface_area
 from renderer.utils.logger import logger
-from renderer.camera import camera_registry
+from renderer.utils.manifest import RenderManifest
+from renderer.utils.passes import PassOutput, assign_pass_indices
+from renderer.utils.snapshot import load_snapshot, snapshot_key, write_snapshot
+from renderer.utils.symmetry import (
+    Symmetry,
+    SymmetryAliases,
+    detect_symmetry,
+    lighting_symmetry,
+    model_vertices,
+    world_is_uniform,
+    write_aliases
+)
+from renderer.utils.textures import TEXEL_MARGIN, downscale_images, peak_memory_mb
+from renderer.camera import CameraPath, CameraPathGenerator, camera_registry
+from renderer.camera.dedup import DeduplicatedPathGenerator
+from renderer.camera.planned import PlannedPathGenerator
+from renderer.camera.paths.adaptive import PROBE_SAMPLES, AdaptivePathGenerator
 from renderer.lighting import lighting_registry
+from renderer.output import (
+    AsyncFrameWriter,
+    TarShardWriter,
+    consolidate_shard_indexes,
+    encode_png,
+    write_file_atomic
+)
+from renderer.parallel import render_sharded, shard_frames
+
+# Frames timed at the configured settings before a time budget is planned
+BUDGET_PROBE_FRAMES = 2
+
+# Pixels across the empty-scene render that full-frame border fills sample
+BACKGROUND_RESOLUTION = 16
 
 @contextmanager
 def stdout_redirected(to=os.devnull):
@@ -41,7 +97,8 @@ class ModelRenderer:
     """A class for rendering 3D models with configurable camera paths,  
     lighting, and render settings.
     
-    Provides functionality to render 3D models using Blender's Cycles engine,
+    Provides functionality to render 3D models using Blender's Cycles engine
+    (or EEVEE/Workbench for fast previews),
     supporting multiple camera path types, lighting configurations, and render settings.
     The renderer handles multiple file formats and can generate multiple views
     based on configurable camera paths and lighting setups.
@@ -53,15 +110,43 @@ class ModelRenderer:
         - keep_lights: Whether to preserve existing lights (default: False)
         - keep_materials: Whether to preserve existing materials (default: True)
         - keep_world_settings: Whether to preserve world settings (default: False)
+        - bake_materials: Bake procedural materials to images once (default: False)
+        - bake_type: "DIFFUSE" or "COMBINED" bakes (default: "DIFFUSE")
+        - bake_resolution: Size of each baked image (default: 1024)
         If not provided, uses default BlendFileConfig settings.
         
     render_config : RenderConfig, optional
         Configuration for rendering settings:
         - resolution: Output resolution in pixels (default: 1024)
         - samples: Number of render samples (default: 128)
+        - engine: RenderEngine.CYCLES, EEVEE or WORKBENCH (default: CYCLES)
         - device: Render device, "GPU" or "CPU" (default: "GPU")
         - use_denoising: Whether to use denoising (default: True)
+        - autotune_samples: Lower samples per model down to noise_target (default: False)
+        - noise_target: RMSE allowed against the reference samples (default: 0.01)
+        - autotune_views: Probe views used by the autotuner (default: 3)
         - background: Background type (Background.WHITE or Background.TRANSPARENT)
+        - border_mode: Trace only the model's projected region (BorderMode.NONE,
+          CROP or FULL_FRAME; default: NONE)
+        - border_padding: Margin around the projected region (default: 0.05)
+        - lod_decimation: Decimate sub-pixel mesh detail (default: False)
+        - lod_max_error_px: Edge length in pixels that may be collapsed (default: 1.0)
+        - downscale_textures: Reduce textures to the visible mip (default: False)
+        - symmetry_aliasing: Copy views that repeat others by symmetry (default: False)
+        - workers: Number of Blender processes sharing the camera path (default: 1)
+        - threads: Render threads per process (default: cores / workers)
+        - bake_animation: Render the path as one keyframed animation (default: False)
+        - path_chunk_size: Views generated and posed at a time (default: 4096)
+        - cache_dir: Render cache shared across jobs (default: None, no cache)
+        - cache_max_size_mb: Render cache size limit (default: 10240)
+        - scene_cache_dir: Snapshots of imported models and downscaled textures
+          (default: None, no cache)
+        - scene_cache_max_size_mb: Scene cache size limit (default: 4096)
+        - encode_workers: Threads encoding PNGs off the render thread (default: 0)
+        - output_format: OutputFormat.FILES or OutputFormat.TAR_SHARDS
+        - shard_size_mb: Size of each tar shard (default: 1024)
+        - passes: Extra RenderPass outputs per frame, e.g. depth (default: none)
+        - pass_format: "EXR" or "PNG" (16-bit) for the passes (default: "EXR")
         If not provided, uses default RenderConfig settings.
     
     lighting_config : LightingConfig, optional
@@ -84,22 +169,67 @@ class ModelRenderer:
         - camera_density: Number of cameras for orbit and phi spiral (default: 35)
         - angular_step: Base angular step for linear and phased spiral (default: 45.0)
         - sphere_coverage: Camera coverage (SphereCoverage.FULL or SphereCoverage.HALF)
+        - custom_path_file: .npy or raw float64 file of views for CameraPathType.CUSTOM
+        - icosphere_level: Subdivision level of CameraPathType.ICOSPHERE (default: 2)
+        - refine_threshold: Probe image difference above which CameraPathType.ADAPTIVE adds views (default: 0.05)
+        - refine_budget: Largest number of CameraPathType.ADAPTIVE views (default: 162)
+        - dedup_tolerance: Angle in degrees within which views are duplicates (default: 0, off)
         If not provided, uses default CameraConfig settings.
     
     Methods
     -------
-    render(model_path: str, output_dir: str) -> None
+    render(model_path: str, output_dir: str, resume: bool = False,
+           time_budget_s: Optional[float] = None) -> None
         Render the model from multiple angles based on the camera path configuration
         and save to the specified output directory. The output filenames include
-        camera position information (azimuth, elevation, roll).
-        
+        camera position information (azimuth, elevation, roll). Finished frames
+        are recorded in the directory's manifest.jsonl; with resume=True, frames
+        already completed with the same configuration are not rendered again.
+        With OutputFormat.TAR_SHARDS, frames and JSON sidecars are instead 
+        streamed into shard-NNNNNN.tar files indexed by shards.json.
+        Requested passes are written by the same render as each frame, as
+        <frame name>_<pass>.exr/.png (<key>.<pass>.<ext> members in tar shards).
+        With time_budget_s, the first frames are timed and samples, resolution
+        and denoising of the rest are chosen to finish within the budget.
+
+    render_batch(model_paths: List[str], output_root: str, resume: bool = False) -> None
+        Render several models in one warm Blender session, reusing the scene,
+        camera and lights. Each model is saved to its own subdirectory of
+        output_root and per-model statistics are listed under 'models'.
+
+    render_iter(model_path: str, linear: bool = False) -> Iterator
+        Render the model and yield (SphericalCoordinate, np.ndarray) pairs
+        instead of writing image files to an output directory.
+
     get_render_stats() -> dict
         Return statistics about the last render operation, including:
         - total_renders: Total number of renders attempted
         - successful_renders: Number of successful renders
+        - skipped_renders: Number of frames reused from a previous run (resume)
+        - cache_hits / cache_misses: Frames taken from / missing in the render cache
+        - encode_time: Time spent encoding and writing PNGs on encoder threads
+        - encode_wait_time: Time rendering was blocked waiting for encoders
         - failed_renders: Number of failed renders
         - render_time: Total time taken for rendering
         - output_directory: Directory where renders were saved
+        - engine: Engine actually used (after any fallback to Cycles)
+        - samples / adaptive_threshold: Cycles sampling used (after autotuning)
+        - autotune_time: Time spent rendering autotune probes
+        - time_budget: Settings chosen for a time_budget_s render (if given)
+        - border_area: Mean fraction of the frame traced (1.0 without borders)
+        - import_time: Time spent importing and preparing the model
+        - scene_cache_hit: Whether the model was loaded from a scene snapshot
+        - import_time_saved: Import time avoided by loading the snapshot
+        - lod: Triangle counts before/after decimation (if lod_decimation)
+        - textures: Estimated decoded texture memory before/after downscaling,
+          from image sizes (if downscale_textures)
+        - symmetry: Model and lighting symmetry, frames aliased (if symmetry_aliasing)
+        - bake: Procedural materials baked to images (if bake_materials)
+        - coverage: Surface coverage of a CameraPathType.COVERAGE path
+        - refinement: Views added and difference left by a CameraPathType.ADAPTIVE path
+        - deduplication: Views kept and renders saved (if dedup_tolerance)
+        - peak_memory_mb: Peak resident memory of the rendering process so far
+          (a high-water mark, so it does not show the texture downscaling saving)
     
     Examples
     --------
@@ -136,24 +266,40 @@ class ModelRenderer:
         self.lighting_config = lighting_config or LightingConfig()
         self.camera_config = camera_config or CameraConfig()
         self.render_stats = {}
+        self._shard: Optional[Tuple[int, int]] = None  # (index, count) in a worker
+        self._manifest: Optional[RenderManifest] = None
+        self._cache: Optional[RenderCache] = None
+        self._scene_cache: Optional[RenderCache] = None
+        self._import_stats = {}
+        self._tar_writer: Optional[TarShardWriter] = None
+        self._pass_output: Optional[PassOutput] = None
+        self._engine = self.render_config.engine  # After any fallback
+        self._autotuned: Dict[str, SampleSettings] = {}  # Per model/config hash
+        self._sampling_stats = {}
+        self._budget_stats = {}
+        self._lod_stats = {}
+        self._texture_stats = {}
+        self._symmetry_stats = {}
+        self._symmetry_aliases: Optional[SymmetryAliases] = None  # Of the current render
+        # First frame index, locations and rotations of the posed part of the path
+        self._camera_poses: Optional[Tuple[int, np.ndarray, np.ndarray]] = None
+        self._progress: Optional[tqdm] = None  # Progress bar of the current render
+        self._path_generator: Optional[CameraPathGenerator] = None  # Of the current model
+        # Path planned by the parent process of a worker
+        self._planned_generator: Optional[PlannedPathGenerator] = None
+        self._bake_stats = {}
+        self._degraded = False  # Frames are rendered below the configured quality
+        self._border_areas: List[float] = []
+        # Background pixel of full-frame border renders, by FrameCapture.linear
+        self._background_pixels: Dict[bool, np.ndarray] = {}
+        self._sample_metadata: dict = {}
+        self._output_stats = {'encode_time': 0.0, 'encode_wait_time': 0.0}
         
     def _setup_scene(self) -> None:
         """Configure the basic scene settings and render engine."""
-        #  Configure engine
-        bpy.context.scene.render.engine = 'CYCLES'
-        bpy.context.scene.cycles.samples = self.render_config.samples
-        bpy.context.scene.cycles.use_adaptive_sampling = True
-        bpy.context.scene.cycles.use_denoising = self.render_config.use_denoising
-        
-        #  Untested alternatives:     
-        #  bpy.context.scene.render.engine = 'BLENDER_EEVEE'
-        #  bpy.context.scene.eevee.use_ssr = True  # Enable screen-space reflections
-        #  bpy.context.scene.eevee.use_bloom = True  # Enable bloom for glow effects
-
-        if self.render_config.device == "GPU":
-            bpy.context.scene.cycles.device = 'GPU'
-            #  bpy.context.preferences.addons["cycles"].preferences.compute_device_type = \
-            #      "CUDA"  # or "HIP" for AMD
+        self._setup_engine(bpy.context.scene)
+        self._setup_threads(bpy.context.scene)
+        self._setup_passes(bpy.context.scene)
 
         bpy.context.scene.render.resolution_x = self.render_config.resolution_x
         bpy.context.scene.render.resolution_y = self.render_config.resolution_y
@@ -177,24 +323,130 @@ class ModelRenderer:
             if obj.type == "MESH" and not obj.data.materials:
                 logger.warning(f"Object {obj.name} has no materials!")
 
-    def _import_model(self, filepath: str) -> None:
-        """Import 3D model based on file extension."""
+    def _effective_render_config(self) -> RenderConfig:
+        """Return the render config with the engine, samples and denoising 
+        actually used, after any fallback to Cycles.
+        
+        EEVEE and Workbench rasterize on the GPU. On headless CPU nodes they 
+        are replaced by Cycles at FALLBACK_SAMPLES samples with denoising, 
+        which gives a comparable preview at a similar cost.
+        """
+        config = self.render_config
+        if config.engine == RenderEngine.CYCLES or gpu_context_available():
+            return config
+        return replace(
+            config,
+            engine=RenderEngine.CYCLES,
+            samples=min(config.samples, FALLBACK_SAMPLES),
+            use_denoising=True
+        )
 
-        # Clear scene. TODO: refactor to self._clear_scene()
-        # Remove all objects except the world settings.
+    def _setup_engine(self, scene: bpy.types.Scene) -> None:
+        """Select the render engine, falling back to Cycles without a GPU context."""
+        effective = self._effective_render_config()
+        engine = effective.engine
+        samples = effective.samples
+        use_denoising = effective.use_denoising
+        if engine != self.render_config.engine:
+            logger.warning(
+                f"No GPU context for {self.render_config.engine.value}; falling back to "
+                f"Cycles at {FALLBACK_SAMPLES} samples with denoising"
+            )
+        self._engine = engine
+
+        if engine == RenderEngine.CYCLES:
+            scene.render.engine = 'CYCLES'
+            scene.cycles.samples = samples
+            scene.cycles.use_adaptive_sampling = True
+            scene.cycles.use_denoising = use_denoising
+            if self.render_config.device == "GPU":
+                scene.cycles.device = 'GPU'
+                #  bpy.context.preferences.addons["cycles"].preferences.compute_device_type = \
+                #      "CUDA"  # or "HIP" for AMD
+        elif engine == RenderEngine.EEVEE:
+            # Blender 4.2-4.4 register EEVEE as 'BLENDER_EEVEE_NEXT'
+            engines = scene.render.bl_rna.properties['engine'].enum_items.keys()
+            scene.render.engine = (
+                'BLENDER_EEVEE_NEXT' if 'BLENDER_EEVEE_NEXT' in engines else 'BLENDER_EEVEE'
+            )
+            scene.eevee.taa_render_samples = samples
+        else:
+            scene.render.engine = 'BLENDER_WORKBENCH'
+            scene.display.shading.light = 'STUDIO'
+            scene.display.shading.color_type = 'MATERIAL'
+
+    def _setup_threads(self, scene: bpy.types.Scene) -> None:
+        """Limit render threads, e.g. when several workers share a node."""
+        if self.render_config.threads is not None:
+            scene.render.threads_mode = 'FIXED'
+            scene.render.threads = self.render_config.threads
+
+    def _setup_passes(self, scene: bpy.types.Scene) -> None:
+        """Enable the requested passes and route them to a compositor File Output node."""
+        self._pass_output = None
+        if self.render_config.passes:
+            self._pass_output = PassOutput(
+                scene, self.render_config.passes, self.render_config.pass_format
+            )
+
+    def _clear_scene(self) -> None:
+        """Remove all objects except the world settings."""
         bpy.ops.object.select_all(action='SELECT')
         bpy.ops.object.delete()
         # Remove orphaned meshes, materials, etc.
         bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
 
+    def _remove_model(self, camera: bpy.types.Object) -> None:
+        """Remove the current model's datablocks while keeping camera and lights.
+        
+        Used by render_batch() to swap models inside a warm session instead of
+        resetting Blender to factory settings between models.
+        """
+        keep = {camera.name, *(light.name for light in self.light_setup.lights)}
+        for obj in list(bpy.context.scene.objects):
+            if obj.name not in keep:
+                bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+
+    def _import_model(self, filepath: str, clear_scene: bool = True) -> None:
+        """Import 3D model based on file extension.
+        
+        If clear_scene is False, existing objects (camera, lights) are kept and
+        only deselected so that the imported objects form the new selection.
+        """
+        self._path_generator = None  # Paths may depend on the model
+        if clear_scene:
+            self._clear_scene()
+        else:
+            bpy.ops.object.select_all(action='DESELECT')
+
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Model file not found: {filepath}")
             
         ext = os.path.splitext(filepath)[1].lower()
+        import_start = time.time()
 
-        if ext == '.blend':
+        if ext == '.blend':  # Opened as a whole, so never snapshotted
             bpy.ops.wm.open_mainfile(filepath=filepath)
             self._handle_blend_file_settings()
+            self._bake_materials()
+            self._assign_pass_indices()
+            self._import_stats = {
+                'import_time': time.time() - import_start,
+                'scene_cache_hit': False,
+                'import_time_saved': 0.0
+            }
+            return
+
+        snapshot = self._load_snapshot(filepath)
+        if snapshot is not None:
+            self._assign_pass_indices()
+            import_time = time.time() - import_start
+            self._import_stats = {
+                'import_time': import_time,
+                'scene_cache_hit': True,
+                'import_time_saved': max(0.0, snapshot['import_time'] - import_time)
+            }
             return
         
         importers = {
@@ -220,22 +472,103 @@ class ModelRenderer:
         
         bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
         #  Options include type='ORIGIN_CENTER_OF_MASS', center='MEDIAN', or others
+        import_time = time.time() - import_start
+        self._store_snapshot(filepath, import_time)
+        self._assign_pass_indices()
+        self._import_stats = {
+            'import_time': import_time,
+            'scene_cache_hit': False,
+            'import_time_saved': 0.0
+        }
 
         #  Align model to X axis (buggy)
         #  bpy.ops.object.transform_apply(rotation=True)
         #  bpy.context.active_object.rotation_euler = (0, 0, 0)
 
+    def _open_scene_cache(self) -> Optional[RenderCache]:
+        """Return the prepared-scene cache, if one is configured."""
+        if self._scene_cache is None and self.render_config.scene_cache_dir:
+            self._scene_cache = RenderCache(
+                self.render_config.scene_cache_dir,
+                self.render_config.scene_cache_max_size_mb * 1024 * 1024,
+                suffix=".blend"
+            )
+        return self._scene_cache
+
+    def _load_snapshot(self, filepath: str) -> Optional[dict]:
+        """Append the model's prepared objects from the scene cache, if cached.
+        
+        Returns the snapshot's metadata on a hit and None on a miss. The 
+        appended objects form the new selection, like freshly imported ones.
+        """
+        cache = self._open_scene_cache()
+        if cache is None:
+            return None
+        path = cache.lookup(snapshot_key(file_checksum(filepath)))
+        if path is None:
+            return None
+        try:
+            objects, metadata = load_snapshot(path, bpy.context.scene)
+        except (OSError, RuntimeError, KeyError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable scene snapshot {path}: {str(e)}")
+            return None
+        for obj in objects:
+            obj.select_set(True)
+            bpy.context.view_layer.objects.active = obj
+        logger.info(f"Loaded prepared scene from {path} in {metadata['load_time']:.2f}s")
+        return metadata
+
+    def _store_snapshot(self, filepath: str, import_time: float) -> None:
+        """Save the freshly imported and normalized model to the scene cache."""
+        cache = self._open_scene_cache()
+        if cache is None:
+            return
+        objects = [obj for obj in bpy.context.scene.objects if obj.select_get()]
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_path = os.path.join(temp_dir, "snapshot.blend")
+                write_snapshot(temp_path, objects, import_time)
+                cache.store(snapshot_key(file_checksum(filepath)), temp_path)
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Could not save scene snapshot of {filepath}: {str(e)}")
+
+    def _bake_materials(self) -> None:
+        """Bake the .blend's procedural materials to images, if configured."""
+        self._bake_stats = {}
+        if not (self.blend_config.keep_materials and self.blend_config.bake_materials):
+            return
+        cache = None
+        if self.render_config.scene_cache_dir:
+            cache = RenderCache(
+                os.path.join(self.render_config.scene_cache_dir, "bakes"),
+                self.render_config.scene_cache_max_size_mb * 1024 * 1024
+            )
+        stats = bake_procedural_materials(
+            bpy.context.scene, self.blend_config.bake_type,
+            self.blend_config.bake_resolution, cache
+        )
+        self._bake_stats = {'bake': stats}
+        logger.info(
+            f"Baked {stats['materials_baked']} procedural materials on "
+            f"{stats['meshes_baked']} meshes in {stats['bake_time']:.2f}s "
+            f"({stats['cache_hits']} from cache)"
+        )
+
+    def _assign_pass_indices(self) -> None:
+        """Number the model's meshes for the object index pass, if requested."""
+        if RenderPass.OBJECT_INDEX in self.render_config.passes:
+            assign_pass_indices(bpy.context.scene)
+
     def _handle_blend_file_settings(self) -> None:
         """Handle configuration differences between .blend file and renderer settings."""
         scene = bpy.context.scene
         
         # Handle render settings
-        if self.render_config.device == "GPU":
-            scene.cycles.device = 'GPU'
+        self._setup_engine(scene)
         scene.render.resolution_x = self.render_config.resolution_x
         scene.render.resolution_y = self.render_config.resolution_y
-        scene.cycles.samples = self.render_config.samples
-        scene.cycles.use_denoising = self.render_config.use_denoising
+        self._setup_threads(scene)
+        self._setup_passes(scene)
         scene.render.film_transparent = (
             self.render_config.background == Background.TRANSPARENT
         )
@@ -306,33 +639,214 @@ class ModelRenderer:
 
         return camera
 
-    def _position_camera(self, camera: bpy.types.Object, coord: SphericalCoordinate) -> None:
-        """Position and orient camera based on spherical coordinates."""
-        az_rad = math.radians(coord.azimuth)
-        el_rad = math.radians(coord.elevation)
-        roll_rad = math.radians(coord.roll)
+    def _closest_camera_distance(self) -> float:
+        """Return the smallest distance of a camera path view from the origin.
+        
+        Paths planned from the model are not planned yet when this is needed
+        and place every view at camera_config.distance; other paths (e.g.
+        custom paths, whose radii may come from the file) are read one chunk
+        at a time, before any deduplication.
+        """
+        generator = self._camera_generator()
+        if isinstance(generator, DeduplicatedPathGenerator):
+            generator = generator.generator
+        if generator.plans_from_scene:
+            return self.camera_config.distance
+        chunks = generator.iter_chunks(self.camera_config, self.render_config.path_chunk_size)
+        return min(
+            (float(np.abs(chunk.radius).min()) for chunk in chunks if len(chunk)),
+            default=self.camera_config.distance
+        )
 
-        #  Spherical to Cartesian Conversion (Z-up)
-        x = coord.radius * math.cos(el_rad) * math.sin(az_rad)
-        y = coord.radius * math.cos(el_rad) * math.cos(az_rad)
-        z = coord.radius * math.sin(el_rad)
+    def _closest_pixels_per_unit(self, camera: bpy.types.Object, radius: float) -> float:
+        """Return pixels per world unit where the camera path comes closest to
+        a model of the given radius around the origin (inf if it gets inside)."""
+        resolution = max(self.render_config.resolution_x, self.render_config.resolution_y)
+        distance = self._closest_camera_distance()
+        return pixels_per_unit(distance - radius, camera.data.angle, resolution)
 
-        camera.location = Vector((x, y, z))
+    def _downscale_textures(self, camera: bpy.types.Object) -> None:
+        """Reduce the model's textures to the detail visible from the closest camera."""
+        self._texture_stats = {}
+        if not self.render_config.downscale_textures:
+            return
+        start_time = time.time()
+        radius = max((corner.length for corner in self._model_bounds()), default=0.0)
+        density = self._closest_pixels_per_unit(camera, radius)
+        if not math.isfinite(density):
+            logger.info("Textures kept at full size: the camera path enters the model")
+            return
+        cache = None
+        if self.render_config.scene_cache_dir:
+            cache = RenderCache(
+                os.path.join(self.render_config.scene_cache_dir, "textures"),
+                self.render_config.scene_cache_max_size_mb * 1024 * 1024
+            )
+        stats = downscale_images(2.0 * radius * density * TEXEL_MARGIN, cache)
+        stats['cache_hits'] = cache.hits if cache else 0
+        stats['texture_time'] = time.time() - start_time
+        self._texture_stats = {'textures': stats}
+        logger.info(
+            f"Downscaled {stats['images_downscaled']} textures: estimated "
+            f"{stats['texture_memory_before_mb']:.1f} MB -> "
+            f"{stats['texture_memory_after_mb']:.1f} MB"
+        )
+
+    def _apply_lod(self, camera: bpy.types.Object) -> None:
+        """Decimate meshes to the detail visible from the closest camera position.
         
-        direction = -camera.location.normalized()
-        rot_quat = direction.to_track_quat('-Z', 'Y')
-        euler = rot_quat.to_euler('XYZ')
+        The decimated (and otherwise fully evaluated) meshes replace the 
+        originals and their modifier stacks for the rest of the session, so 
+        neither the decimation nor the sub-pixel triangles are processed again 
+        by each render. Meshes the camera may get inside of are left alone.
+        """
+        self._lod_stats = {}
+        if not self.render_config.lod_decimation:
+            return
+        start_time = time.time()
+        scene = bpy.context.scene
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        meshes = []  # (object, world-space vertices, triangles)
+        for obj in scene.objects:
+            if obj.type != 'MESH':
+                continue
+            mesh = obj.evaluated_get(depsgraph).data
+            vertices = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", vertices)
+            triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+            mesh.loop_triangles.foreach_get("vertices", triangles)
+            matrix = np.array(obj.matrix_world, dtype=np.float64)
+            vertices = vertices.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+            meshes.append((obj, vertices, triangles.reshape(-1, 3)))
+
+        radius = max((np.linalg.norm(v, axis=1).max() for _, v, _ in meshes if len(v)), default=0.0)
+        density = self._closest_pixels_per_unit(camera, radius)
+
+        decimated = []
+        for obj, vertices, triangles in meshes:
+            ratio = lod_ratio(
+                len(triangles), surface_area(vertices, triangles),
+                density, self.render_config.lod_max_error_px
+            )
+            if ratio < 1.0:
+                modifier = obj.modifiers.new("LOD", 'DECIMATE')
+                modifier.decimate_type = 'COLLAPSE'
+                modifier.ratio = ratio
+                decimated.append(obj)
+        triangles_before = sum(len(t) for _, _, t in meshes)
+        triangles_after = triangles_before
+
+        if decimated:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            for obj in decimated:
+                mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+                obj.modifiers.clear()
+                previous, obj.data = obj.data, mesh
+                if previous.users == 0:
+                    bpy.data.meshes.remove(previous)
+            triangles_after = 0
+            for obj in scene.objects:
+                if obj.type == 'MESH':
+                    obj.data.calc_loop_triangles()
+                    triangles_after += len(obj.data.loop_triangles)
+
+        cost_before = bvh_build_cost(triangles_before)
+        bvh_saving = 1.0 - bvh_build_cost(triangles_after) / cost_before if cost_before else 0.0
+        self._lod_stats = {
+            'lod': {
+                'triangles_before': triangles_before,
+                'triangles_after': triangles_after,
+                'decimated_meshes': len(decimated),
+                'pixels_per_unit': density,
+                'bvh_build_cost_saved': bvh_saving,
+                'lod_time': time.time() - start_time,
+            }
+        }
+        logger.info(
+            f"LOD: {triangles_before} -> {triangles_after} triangles in {len(decimated)} "
+            f"meshes; estimated BVH build time saved: {bvh_saving:.0%}"
+        )
+
+    def _position_camera(
+        self,
+        camera: bpy.types.Object,
+        coord: SphericalCoordinate,
+        index: Optional[int] = None
+    ) -> None:
+        """Position and orient camera based on spherical coordinates.
         
+        Poses are computed in batches for the current chunk of the camera 
+        path (see _load_camera_poses()); index selects the pose of coord in 
+        the path. Without an index, or for a frame outside the chunk, the 
+        pose is computed for coord alone.
+        """
+        if index is not None and self._camera_poses is not None:
+            start, locations, rotations = self._camera_poses
+            index -= start
+        if index is None or self._camera_poses is None or not 0 <= index < len(locations):
+            path = CameraPath.from_coordinates([coord])
+            locations, rotations, index = path.locations(), path.rotations(), 0
+
+        camera.location = locations[index]
         camera.rotation_mode = 'XYZ'
-        camera.rotation_euler = euler
-        camera.rotation_euler.rotate_axis('Z', roll_rad)
+        camera.rotation_euler = rotations[index]
+
+    def _load_camera_poses(self, start: int, camera_positions: CameraPath) -> None:
+        """Compute the poses of the path views starting at frame index start."""
+        self._camera_poses = (
+            start, camera_positions.locations(), camera_positions.rotations()
+        )
+
+    def _camera_generator(self) -> CameraPathGenerator:
+        """Return the generator of the selected path type.
+        
+        One generator serves all calls for the current model, so that paths
+        planned from the model (e.g. coverage) are only planned once. With a
+        dedup_tolerance, the generator drops near-duplicate views. A worker
+        uses the path its parent planned instead.
+        """
+        if self._path_generator is None and self._planned_generator is not None:
+            self._path_generator = self._planned_generator
+        elif self._path_generator is None:
+            path_type = self.camera_config.camera_path_type.value
+            self._path_generator = camera_registry.get_generator(path_type)
+            if isinstance(self._path_generator, AdaptivePathGenerator):
+                self._path_generator.probe = self._render_path_probes
+            if self.camera_config.dedup_tolerance > 0:
+                self._path_generator = DeduplicatedPathGenerator(
+                    self._path_generator,
+                    self.camera_config.dedup_tolerance,
+                    self.camera_config.dedup_ignore_roll
+                )
+        return self._path_generator
+
+    def _path_stats(self) -> dict:
+        """Return the statistics of the current camera path, if any."""
+        return self._path_generator.stats if self._path_generator is not None else {}
         
-    def _generate_camera_positions(self) -> List[SphericalCoordinate]:
-        """Generate camera positions based on the selected path type."""
-        path_type = self.camera_config.camera_path_type.value
-        generator = camera_registry.get_generator(path_type)
-        # Return camera positions
-        return generator.generate_positions(self.camera_config)
+    def _generate_camera_positions(self) -> CameraPath:
+        """Generate all camera positions of the selected path type."""
+        camera_positions = self._camera_generator().generate_positions(self.camera_config)
+        self._load_camera_poses(0, camera_positions)
+        return camera_positions
+
+    def _iter_camera_chunks(
+        self, generator: Optional[CameraPathGenerator] = None
+    ) -> Iterator[Tuple[int, CameraPath]]:
+        """Yield (first frame index, positions) chunks of the camera path."""
+        generator = generator or self._camera_generator()
+        start = 0
+        for chunk in generator.iter_chunks(self.camera_config, self.render_config.path_chunk_size):
+            yield start, chunk
+            start += len(chunk)
+
+    def _path_views(self, indices: List[int]) -> List[SphericalCoordinate]:
+        """Return the views at the given sorted frame indices, reading the 
+        path one chunk at a time."""
+        views = []
+        for start, chunk in self._iter_camera_chunks():
+            views.extend(chunk[k - start] for k in indices if start <= k < start + len(chunk))
+        return views
 
     def _setup_lighting(self) -> List[bpy.types.Object]:
         """Create lighting setup based on configuration."""
@@ -340,82 +854,1195 @@ class ModelRenderer:
         self.light_setup = setup_class(self.lighting_config)
         return self.light_setup.create_lights()
 
-    def render(self, model_path: str, output_dir: str) -> None:
-        """Render the model from multiple angles and save to output directory."""
+    def _light_poses(self, azimuth: float) -> np.ndarray:
+        """Return the (N, 6) locations and directions of the scene's lights
+        for a camera at the given azimuth."""
+        self.light_setup.update_positions(azimuth)
+        bpy.context.view_layer.update()
+        poses = []
+        for obj in bpy.context.scene.objects:
+            if obj.type == 'LIGHT':
+                matrix = obj.matrix_world
+                direction = -matrix.col[2].xyz.normalized()  # Lights shine along -Z
+                poses.append([*matrix.translation, *direction])
+        return np.array(poses, dtype=np.float64).reshape(-1, 6)
+
+    def _detect_symmetry(self) -> None:
+        """Find the symmetry shared by the model and the lighting.
+        
+        With symmetry_aliasing, views that repeat an earlier view of the path
+        under this symmetry are recorded as aliases by _render_chunks() 
+        instead of being rendered, and written by write_aliases() once the 
+        frames they repeat exist. A world with an environment or sky texture
+        lights the model unevenly, so it disables aliasing.
+        """
+        self._symmetry_stats = {}
+        self._symmetry_aliases = None
+        if not self.render_config.symmetry_aliasing:
+            return
+        if self._tar_writer is not None or self._pass_output is not None:
+            logger.warning("Symmetry aliasing applies to PNG files without passes; skipping")
+            return
+        start_time = time.time()
+        points, labels = model_vertices(bpy.context.scene)
+        model = detect_symmetry(points, self.render_config.symmetry_tolerance, labels)
+        if world_is_uniform(bpy.context.scene.world):
+            symmetry = lighting_symmetry(model, self._light_poses)
+        else:
+            symmetry = Symmetry()
+        if not symmetry.trivial:
+            self._symmetry_aliases = SymmetryAliases(symmetry, self.camera_config.dedup_tolerance)
+        self._symmetry_stats = {
+            'symmetry': {
+                'rotation_order': symmetry.rotation_order,
+                'mirror_azimuth': symmetry.mirror_azimuth,
+                'model_rotation_order': model.rotation_order,
+                'model_mirror_azimuth': model.mirror_azimuth,
+                'aliased_renders': 0,
+                'symmetry_time': time.time() - start_time,
+            }
+        }
+        logger.info(
+            f"Symmetry: model C{model.rotation_order}"
+            f"{'' if model.mirror_azimuth is None else ' with a mirror'}, "
+            f"lighting keeps C{symmetry.rotation_order}"
+            f"{'' if symmetry.mirror_azimuth is None else ' with a mirror'}"
+        )
+
+    def _record_aliases(
+        self,
+        frames: List[Tuple[int, SphericalCoordinate]],
+        aliases: Dict[int, Tuple[int, SphericalCoordinate, bool]]
+    ) -> List[Tuple[int, SphericalCoordinate]]:
+        """Record the frames that are aliases in the manifest; return the rest."""
+        remaining = []
+        for i, coord in frames:
+            if i in aliases:
+                source, source_coord, mirrored = aliases[i]
+                self._manifest.record_alias(
+                    i, coord, self._frame_filename(i, coord),
+                    self._frame_filename(source, source_coord), mirrored
+                )
+            else:
+                remaining.append((i, coord))
+        return remaining
+
+    def _write_aliases(self, manifest: RenderManifest) -> int:
+        """Write the manifest's pending aliases and count them in the symmetry stats."""
+        written = write_aliases(manifest)
+        if 'symmetry' in self._symmetry_stats:
+            self._symmetry_stats['symmetry']['aliased_renders'] = written
+        return written
+
+    def _render_probes(
+        self,
+        camera: bpy.types.Object,
+        views: List[SphericalCoordinate],
+        settings: SampleSettings
+    ) -> List[np.ndarray]:
+        """Render the autotune probe views with the given sampling settings."""
+        scene = bpy.context.scene
+        scene.cycles.samples = settings.samples
+        scene.cycles.adaptive_threshold = settings.adaptive_threshold
+        scene.render.use_border = False
+        capture = FrameCapture()
+        if self._pass_output is not None:
+            self._pass_output.node.mute = True  # Probes do not write passes
+        try:
+            images = []
+            for coord in views:
+                self._position_camera(camera, coord)
+                self.light_setup.update_positions(coord.azimuth)
+                with stdout_redirected():  # Suppress Blender output during render
+                    images.append(capture.render(scene))
+            return images
+        finally:
+            capture.close()
+            if self._pass_output is not None:
+                self._pass_output.node.mute = False
+
+    def _render_path_probes(self, positions: CameraPath) -> List[np.ndarray]:
+        """Render small probe images of views for the adaptive camera path.
+        
+        Probes are refine_resolution pixels across (keeping the aspect ratio)
+        with at most PROBE_SAMPLES samples; the scene's resolution and 
+        sampling settings are restored afterwards.
+        """
+        scene = bpy.context.scene
+        saved = (
+            scene.render.resolution_x,
+            scene.render.resolution_y,
+            scene.render.resolution_percentage,
+            scene.render.use_border,
+            scene.cycles.samples,
+            scene.cycles.adaptive_threshold,
+        )
+        scale = self.camera_config.refine_resolution / max(saved[0], saved[1])
+        scene.render.resolution_x = max(1, round(saved[0] * scale))
+        scene.render.resolution_y = max(1, round(saved[1] * scale))
+        scene.render.resolution_percentage = 100
+        settings = SampleSettings(min(PROBE_SAMPLES, saved[4]), saved[5])
+        try:
+            return self._render_probes(scene.camera, list(positions), settings)
+        finally:
+            (
+                scene.render.resolution_x,
+                scene.render.resolution_y,
+                scene.render.resolution_percentage,
+                scene.render.use_border,
+                scene.cycles.samples,
+                scene.cycles.adaptive_threshold,
+            ) = saved
+
+    def _tune_samples(
+        self,
+        camera: bpy.types.Object,
+        model_path: str
+    ) -> None:
+        """Apply autotuned Cycles sampling settings for this model, if enabled.
+        
+        Settings are looked up in this session, then in autotune.json in the
+        render cache directory if there is one, and only probed on a miss.
+        Without a cache directory the choice is kept for this session only,
+        so that autotuning writes nothing into the output directory.
+        """
+        scene = bpy.context.scene
+        start_time = time.time()
+        if self.render_config.autotune_samples and self._engine != RenderEngine.CYCLES:
+            logger.warning("Sample autotuning applies to Cycles only; skipping")
+        elif self.render_config.autotune_samples:
+            max_samples = scene.cycles.samples
+            key = config_hash(
+                self.render_config, self.lighting_config, self.blend_config,
+                self.camera_config, max_samples, file_checksum(model_path)
+            )
+            cache_dir = self.render_config.cache_dir
+            cache = AutotuneCache(cache_dir) if cache_dir else None
+            settings = self._autotuned.get(key) or (cache.get(key) if cache else None)
+            if settings is None:
+                indices = probe_indices(
+                    self._camera_generator().count(self.camera_config),
+                    self.render_config.autotune_views
+                )
+                tuner = SampleAutotuner(max_samples, self.render_config.noise_target)
+                settings = tuner.tune(
+                    partial(self._render_probes, camera, self._path_views(indices))
+                )
+                if cache:
+                    cache.put(key, settings)
+                logger.info(
+                    f"Autotuned sampling: {settings.samples} samples, "
+                    f"adaptive threshold {settings.adaptive_threshold}"
+                )
+            self._autotuned[key] = settings
+            scene.cycles.samples = settings.samples
+            scene.cycles.adaptive_threshold = settings.adaptive_threshold
+
+        self._sampling_stats = {
+            'samples': scene.cycles.samples,
+            'adaptive_threshold': scene.cycles.adaptive_threshold,
+            'autotune_time': time.time() - start_time,
+        }
+
+    def _model_bounds(self) -> List[Vector]:
+        """Return the world-space bounding box corners of every mesh in the scene."""
+        return [
+            obj.matrix_world @ Vector(corner)
+            for obj in bpy.context.scene.objects if obj.type == 'MESH'
+            for corner in obj.bound_box
+        ]
+
+    def _border_region(self, camera: bpy.types.Object, corners: List[Vector]) -> Optional[Region]:
+        """Project the model's bounding box through the camera's current pose."""
+        scene = bpy.context.scene
+        bpy.context.view_layer.update()  # Refresh camera.matrix_world
+        view_coords = np.array([tuple(world_to_camera_view(scene, camera, c)) for c in corners])
+        return border_region(view_coords, self.render_config.border_padding)
+
+    def _set_border(self, region: Optional[Region], frames: int = 1) -> None:
+        """Restrict the next render to region (None: the whole frame)."""
+        render = bpy.context.scene.render
+        render.use_border = region is not None
+        if region is not None:
+            (render.border_min_x, render.border_min_y,
+             render.border_max_x, render.border_max_y) = region
+            render.use_crop_to_border = self.render_config.border_mode == BorderMode.CROP
+        self._border_areas.extend([region_area(region)] * frames)
+
+    def _border_fill_needed(self) -> bool:
+        """Whether full-frame border renders need their background filled in.
+        
+        Blender leaves pixels outside the border transparent, which is only
+        correct for a transparent background.
+        """
+        return (
+            self.render_config.border_mode == BorderMode.FULL_FRAME
+            and self.render_config.background == Background.WHITE
+        )
+
+    def _background_pixel(self, capture: FrameCapture) -> np.ndarray:
+        """Return the value of a background pixel as the capture returns it.
+
+        The background is rendered once per render, as a small full frame
+        with every object hidden, and averaged over its pixels; it is the
+        world colour after the view transform. The scene's settings are
+        restored afterwards.
+        """
+        if capture.linear in self._background_pixels:
+            return self._background_pixels[capture.linear]
+        scene = bpy.context.scene
+        saved = (
+            scene.render.resolution_x,
+            scene.render.resolution_y,
+            scene.render.resolution_percentage,
+            scene.render.use_border,
+        )
+        hidden = [obj for obj in scene.objects if obj.type != 'CAMERA' and not obj.hide_render]
+        scene.render.resolution_x = scene.render.resolution_y = BACKGROUND_RESOLUTION
+        scene.render.resolution_percentage = 100
+        scene.render.use_border = False
+        for obj in hidden:
+            obj.hide_render = True
+        if self._pass_output is not None:
+            self._pass_output.node.mute = True
+        try:
+            with stdout_redirected():  # Suppress Blender output during render
+                pixels = capture.render(scene)
+        finally:
+            (
+                scene.render.resolution_x,
+                scene.render.resolution_y,
+                scene.render.resolution_percentage,
+                scene.render.use_border,
+            ) = saved
+            for obj in hidden:
+                obj.hide_render = False
+            if self._pass_output is not None:
+                self._pass_output.node.mute = False
+        background = pixels.reshape(-1, pixels.shape[-1]).mean(axis=0)
+        if not capture.linear:
+            background = np.rint(background).astype(pixels.dtype)
+        self._background_pixels[capture.linear] = background
+        return background
+
+    def _border_stats(self) -> dict:
+        """Return the mean traced fraction of the frames rendered so far."""
+        areas = self._border_areas
+        return {'border_area': sum(areas) / len(areas) if areas else 1.0}
+
+    def _frame_filename(self, index: int, coord: SphericalCoordinate) -> str:
+        """Return the output filename for a frame."""
+        return (
+            f"render_{index:03d}_az{coord.azimuth:03.0f}_el{coord.elevation:03.0f}"
+            f"_roll{coord.roll:03.0f}.png"
+        )
+
+    def _select_frames(
+        self, camera_positions: CameraPath, start: int = 0
+    ) -> List[Tuple[int, SphericalCoordinate]]:
+        """Pair positions with their frame index, keeping only this worker's shard.
+        
+        camera_positions may be a chunk of the path whose first frame index 
+        is start.
+        """
+        if self._shard is not None:
+            shard_index, num_shards = self._shard
+            offset = (shard_index - start) % num_shards
+            return list(zip(
+                range(start + offset, start + len(camera_positions), num_shards),
+                shard_frames(camera_positions, offset, num_shards)
+            ))
+        return list(enumerate(camera_positions, start))
+
+    def _shard_frame_count(self, path_length: int) -> int:
+        """Return the number of frames of a path of path_length this process renders."""
+        if self._shard is None:
+            return path_length
+        return len(range(self._shard[0], path_length, self._shard[1]))
+
+    @contextmanager
+    def _progress_bar(self, total: int) -> Iterator[tqdm]:
+        """Yield the progress bar of the current render, opening one over
+        total frames if none is open."""
+        if self._progress is not None:
+            yield self._progress
+            return
+        desc = "Rendering" if self._shard is None else f"Rendering shard {self._shard[0]}"
+        with tqdm(total=total, desc=desc, unit="frame") as pbar:
+            self._progress = pbar
+            try:
+                yield pbar
+            finally:
+                self._progress = None
+
+    def _frame_config_hash(self, model_path: str) -> str:
+        """Hash everything except the camera pose that determines a frame's pixels.
+        
+        The camera config is left out on purpose: each frame's pose is stored 
+        with it, so frames shared between different paths can be reused. The 
+        render config is hashed with the engine settings in effect, so frames 
+        of a preview engine that fell back to Cycles never match frames that 
+        a GPU node rendered with that engine (e.g. in a shared render cache).
+        
+        With lod_decimation or downscale_textures, the detail kept depends on
+        the path's closest camera distance, so that distance is hashed too.
+        """
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"Model file not found: {model_path}")
+        detail = []
+        if self.render_config.lod_decimation or self.render_config.downscale_textures:
+            detail = [self._closest_camera_distance()]
+        return config_hash(
+            self._effective_render_config(),
+            self.lighting_config,
+            self.blend_config,
+            file_checksum(model_path),
+            *detail
+        )
+
+    def _open_manifest(self, model_path: str, output_dir: str) -> RenderManifest:
+        """Load the output directory's manifest (a shard manifest in a worker)
+        and open the render cache, if one is configured.
+        
+        The cache holds beauty frames only, so it is not used with passes.
+        """
+        shard = None if self._shard is None else self._shard[0]
+        manifest = RenderManifest(
+            output_dir, self._frame_config_hash(model_path), shard=shard,
+            verify_checksums=self.render_config.verify_resume
+        )
+        if self.render_config.cache_dir and not self.render_config.passes:
+            self._cache = RenderCache(
+                self.render_config.cache_dir,
+                self.render_config.cache_max_size_mb * 1024 * 1024
+            )
+        return manifest
+
+    def _open_tar_writer(self, model_path: str, output_dir: str) -> Optional[TarShardWriter]:
+        """Start the tar shards of output_dir, if the render config asks for them."""
+        if self.render_config.output_format != OutputFormat.TAR_SHARDS:
+            return None
+        self._sample_metadata = {
+            'model': os.path.basename(model_path),
+            'config_hash': self._manifest.config_hash,
+            'config': canonicalize({
+                'render': self.render_config,
+                'lighting': self.lighting_config,
+                'camera': self.camera_config,
+                'blend': self.blend_config,
+            }),
+        }
+        return TarShardWriter(
+            output_dir,
+            self.render_config.shard_size_mb * 1024 * 1024,
+            worker=None if self._shard is None else self._shard[0]
+        )
+
+    def _close_tar_writer(self) -> None:
+        """Finish the last tar shard and write the shard index."""
+        if self._tar_writer is not None:
+            self._tar_writer.close()
+            self._tar_writer = None
+
+    def _add_sample(
+        self,
+        index: int,
+        coord: SphericalCoordinate,
+        data: bytes,
+        passes: Optional[dict] = None
+    ) -> None:
+        """Add an encoded frame, its JSON sidecar and its passes to the tar shards."""
+        filename = self._frame_filename(index, coord)
+        self._tar_writer.add(
+            os.path.splitext(filename)[0],
+            index,
+            data,
+            {**self._sample_metadata, 'index': index, 'coordinate': asdict(coord)},
+            passes
+        )
+
+    def _collect_passes(
+        self,
+        output_dir: str,
+        prefix: str,
+        stem: str,
+        frame: Optional[int] = None
+    ) -> dict:
+        """Give the pass files of a render their final names next to the frame.
+        
+        Returns the pass files as {pass: path} for file output, or loads and 
+        removes them and returns {"<pass>.<ext>": bytes} for tar shards.
+        """
+        if self._pass_output is None:
+            return {}
+        paths = self._pass_output.collect(output_dir, prefix, stem, frame)
+        if self._tar_writer is None:
+            return paths
+        members = {}
+        for name, path in paths.items():
+            with open(path, "rb") as file:
+                members[f"{name}{self._pass_output.extension}"] = file.read()
+            os.remove(path)
+        return members
+
+    def _cache_stats(self) -> dict:
+        """Return the render cache counters of the current render."""
+        return {
+            'cache_hits': self._cache.hits if self._cache else 0,
+            'cache_misses': self._cache.misses if self._cache else 0,
+        }
+
+    def _fetch_cached_frames(
+        self,
+        frames: List[Tuple[int, SphericalCoordinate]],
+        output_dir: str
+    ) -> Tuple[List[Tuple[int, SphericalCoordinate]], int]:
+        """Copy cached frames to output_dir; return the frames still to render 
+        and the number of cache hits."""
+        if self._cache is None or self._tar_writer is not None:
+            return frames, 0
+        uncached = []
+        for i, coord in frames:
+            filename = self._frame_filename(i, coord)
+            key = RenderCache.frame_key(self._manifest.config_hash, coord)
+            if self._cache.fetch(key, os.path.join(output_dir, filename)):
+                self._manifest.record(i, coord, filename)
+            else:
+                uncached.append((i, coord))
+        if len(uncached) < len(frames):
+            logger.info(f"Render cache: {len(frames) - len(uncached)} frames reused")
+        return uncached, len(frames) - len(uncached)
+
+    def _frame_done(self, index: int, coord: SphericalCoordinate, output_path: str) -> None:
+        """Record a freshly rendered frame in the manifest and the render cache.
+        
+        Frames degraded to meet a time budget are left out of both, so that a
+        later run renders them again at the configured quality.
+        """
+        if self._degraded:
+            return
+        self._manifest.record(index, coord, os.path.basename(output_path))
+        if self._cache is not None:
+            key = RenderCache.frame_key(self._manifest.config_hash, coord)
+            self._cache.store(key, output_path)
+
+    def _pending_frames(
+        self,
+        frames: List[Tuple[int, SphericalCoordinate]],
+        resume: bool
+    ) -> List[Tuple[int, SphericalCoordinate]]:
+        """Drop frames the manifest records as complete, if resuming."""
+        if not resume:
+            return frames
+        if self._tar_writer is not None:
+            logger.warning("Resume applies to file output only; rendering all frames")
+            return frames
+        pending = [
+            (i, coord) for i, coord in frames
+            if not self._manifest.is_complete(self._frame_filename(i, coord), coord)
+        ]
+        if len(pending) < len(frames):
+            logger.info(f"Resuming: {len(frames) - len(pending)} frames already complete")
+        return pending
+
+    def _render_frames(
+        self,
+        camera: bpy.types.Object,
+        frames: List[Tuple[int, SphericalCoordinate]],
+        output_dir: str
+    ) -> int:
+        """Render (index, position) frames to output_dir and return the success count.
+        
+        With encode_workers > 0, each frame is captured as raw pixels and 
+        encoded and written by a bounded thread pool while the next frame 
+        renders; otherwise Blender writes the PNG itself before moving on.
+        Frames for tar shards, and full-frame border renders that need their
+        background filled in, are always captured and encoded in memory.
+        """
+        total_renders = len(frames)
+        successful_renders = 0
+        writer = None
+        capture = None
+        use_border = self.render_config.border_mode != BorderMode.NONE
+        corners = self._model_bounds() if use_border else []
+        if self.render_config.encode_workers > 0:
+            writer = AsyncFrameWriter(self.render_config.encode_workers)
+        if writer is not None or self._tar_writer is not None or self._border_fill_needed():
+            capture = FrameCapture()
+
+        logger.info(f"Starting render of {total_renders} images...")
+
+        with self._progress_bar(total_renders) as pbar:
+            for i, coord in frames:
+                self._position_camera(camera, coord, i)
+                
+                # Delegate light position updates to the setup
+                self.light_setup.update_positions(coord.azimuth)
+                # Each setup class handles this differently:
+                # - RandomDynamicSetup: repositions lights based on camera angle
+                # - RandomFixedSetup: does nothing (lights stay in initial positions)
+                # - OverheadSetup: does nothing (lights stay overhead)
+
+                region = None
+                if use_border:
+                    region = self._border_region(camera, corners)
+                    self._set_border(region)
+                
+                output_path = os.path.join(output_dir, self._frame_filename(i, coord))
+                stem = os.path.splitext(os.path.basename(output_path))[0]
+                if self._tar_writer is None:
+                    if os.path.exists(output_path):
+                        os.remove(output_path)  # May be hard-linked into the render cache
+                    bpy.context.scene.render.filepath = output_path
+                if self._pass_output is not None:
+                    self._pass_output.point_at(output_dir, stem)
+   
+                logger.debug(
+                    f"Frame {i}: Azimuth={coord.azimuth}, "
+                    f"Elevation={coord.elevation}, Roll={coord.roll}"
+                )
+
+                with stdout_redirected():  # Suppress Blender output during render
+                    try:
+                        pixels = None
+                        if capture is None:
+                            bpy.ops.render.render(write_still=True)
+                        else:
+                            pixels = capture.render(bpy.context.scene)
+                            if region is not None and self._border_fill_needed():
+                                background = self._background_pixel(capture)
+                                fill_outside_region(pixels, region, background)
+                        passes = self._collect_passes(output_dir, stem, stem)
+
+                        if self._tar_writer is None:
+                            write = partial(write_file_atomic, output_path)
+                            on_done = partial(self._frame_done, i, coord, output_path)
+                        else:
+                            write = partial(self._add_sample, i, coord, passes=passes)
+                            on_done = lambda: None
+
+                        if pixels is None:
+                            on_done()
+                        elif writer is None:
+                            write(encode_png(pixels))
+                            on_done()
+                        else:
+                            writer.submit(pixels, write, on_done)
+                        successful_renders += 1
+                    except Exception as e:
+                        logger.error(f"Failed to render position {i}: {str(e)}")
+                # Update progress bar
+                pbar.update(1)
+
+        if capture is not None:
+            capture.close()
+        if writer is not None:
+            writer.close()
+            successful_renders -= writer.failed
+            self._output_stats['encode_time'] += writer.encode_time
+            self._output_stats['encode_wait_time'] += writer.wait_time
+                
+        logger.info(f"Completed {total_renders} renders.")
+        return successful_renders
+
+    def _bake_animation(
+        self,
+        camera: bpy.types.Object,
+        frames: List[Tuple[int, SphericalCoordinate]]
+    ) -> None:
+        """Keyframe camera and light poses so that animation frame n shows frames[n]."""
+        scene = bpy.context.scene
+        camera.animation_data_clear()
+        for light in self.light_setup._lights:
+            light.animation_data_clear()
+
+        for frame_number, (i, coord) in enumerate(frames):
+            self._position_camera(camera, coord, i)
+            camera.keyframe_insert("location", frame=frame_number)
+            camera.keyframe_insert("rotation_euler", frame=frame_number)
+            self.light_setup.update_positions(coord.azimuth)
+            self.light_setup.insert_keyframes(frame_number)
+
+        scene.frame_start = 0
+        scene.frame_end = len(frames) - 1
+
+    def _render_animation(
+        self,
+        camera: bpy.types.Object,
+        frames: List[Tuple[int, SphericalCoordinate]],
+        output_dir: str
+    ) -> int:
+        """Render (index, position) frames as one animation and return the success count.
+        
+        The camera path is baked into keyframes and rendered with a single 
+        bpy.ops.render.render(animation=True) call, so Cycles keeps its session 
+        between frames. Blender writes frame-numbered files, which are then 
+        renamed to the same filenames as a frame-by-frame render.
+        """
+        total_renders = len(frames)
+        if total_renders == 0:
+            return 0
+
+        scene = bpy.context.scene
+        region = None
+        if self.render_config.border_mode != BorderMode.NONE:
+            # The border cannot be animated, so it covers the model in every frame
+            corners = self._model_bounds()
+            regions = []
+            for i, coord in frames:
+                self._position_camera(camera, coord, i)
+                regions.append(self._border_region(camera, corners))
+            region = union_region(regions)
+            self._set_border(region, len(frames))
+        self._bake_animation(camera, frames)
+        scene.render.filepath = os.path.join(output_dir, "frame_####")
+        if self._pass_output is not None:
+            self._pass_output.point_at(output_dir, "frame")
+
+        logger.info(f"Starting animation render of {total_renders} images...")
+
+        with self._progress_bar(total_renders) as pbar:
+            def on_frame_written(scene, *args):
+                pbar.update(1)
+
+            bpy.app.handlers.render_write.append(on_frame_written)
+            try:
+                with stdout_redirected():  # Suppress Blender output during render
+                    bpy.ops.render.render(animation=True)
+            except Exception as e:
+                logger.error(f"Animation render failed: {str(e)}")
+            finally:
+                bpy.app.handlers.render_write.remove(on_frame_written)
+
+        capture = None
+        if region is not None and self._border_fill_needed():
+            capture = FrameCapture()
+
+        successful_renders = 0
+        for frame_number, (i, coord) in enumerate(frames):
+            frame_path = scene.render.frame_path(frame=frame_number)
+            if os.path.exists(frame_path) and capture is not None:
+                pixels = fill_outside_region(
+                    capture.read(frame_path), region, self._background_pixel(capture)
+                )
+                write_file_atomic(frame_path, encode_png(pixels))
+            if os.path.exists(frame_path):
+                output_path = os.path.join(output_dir, self._frame_filename(i, coord))
+                stem = os.path.splitext(os.path.basename(output_path))[0]
+                try:
+                    passes = self._collect_passes(output_dir, "frame", stem, frame_number)
+                except RuntimeError as e:
+                    logger.error(f"Failed to render position {i}: {str(e)}")
+                    continue
+                if self._tar_writer is not None:
+                    with open(frame_path, "rb") as file:
+                        self._add_sample(i, coord, file.read(), passes)
+                    os.remove(frame_path)
+                else:
+                    os.replace(frame_path, output_path)
+                    self._frame_done(i, coord, output_path)
+                successful_renders += 1
+            else:
+                logger.error(f"Failed to render position {i}")
+        if capture is not None:
+            capture.close()
+
+        logger.info(f"Completed {total_renders} renders.")
+        return successful_renders
+
+    def _render_path(
+        self,
+        camera: bpy.types.Object,
+        frames: List[Tuple[int, SphericalCoordinate]],
+        output_dir: str
+    ) -> int:
+        """Render frames one by one or as a baked animation, per the render config."""
+        if self.render_config.bake_animation:
+            return self._render_animation(camera, frames, output_dir)
+        return self._render_frames(camera, frames, output_dir)
+
+    def _render_within_budget(
+        self,
+        camera: bpy.types.Object,
+        frames: List[Tuple[int, SphericalCoordinate]],
+        output_dir: str,
+        deadline: float,
+        later_frames: int = 0
+    ) -> int:
+        """Render frames so that they finish by deadline; return the success count.
+        
+        The first BUDGET_PROBE_FRAMES frames are rendered and timed at the 
+        configured settings. plan_budget() then picks samples, resolution 
+        percentage, denoising and a Cycles per-frame time limit for the rest,
+        and for later_frames frames of later chunks of the path, which are 
+        rendered with the same settings. EEVEE takes the planned samples as
+        its render samples; Workbench has no sample count, so its budget is
+        met by the resolution alone.
+        """
+        scene = bpy.context.scene
+        probe_count = min(BUDGET_PROBE_FRAMES, len(frames))
+        probe_start = time.time()
+        successful_renders = self._render_path(camera, frames[:probe_count], output_dir)
+        frame_time = (time.time() - probe_start) / max(probe_count, 1)
+
+        remaining = frames[probe_count:]
+        if self._engine == RenderEngine.CYCLES:
+            samples, use_denoising = scene.cycles.samples, scene.cycles.use_denoising
+        elif self._engine == RenderEngine.EEVEE:
+            samples, use_denoising = scene.eevee.taa_render_samples, False
+        else:
+            logger.warning(
+                f"The time budget only scales the resolution of {self._engine.value} renders"
+            )
+            samples, use_denoising = 1, False
+        plan = plan_budget(
+            deadline - time.time(),
+            len(remaining) + later_frames,
+            frame_time,
+            samples,
+            use_denoising
+        )
+        self._budget_stats = {
+            'time_budget': {
+                'probe_frames': probe_count,
+                'frame_time': frame_time,
+                **asdict(plan),
+            }
+        }
+        if plan.degraded:
+            logger.info(
+                f"Time budget: {frame_time:.2f}s per frame is too slow for "
+                f"{len(remaining) + later_frames} frames; using {plan.samples} samples at "
+                f"{plan.resolution_percentage}% resolution"
+            )
+        if self._engine == RenderEngine.CYCLES:
+            scene.cycles.samples = plan.samples
+            scene.cycles.use_denoising = plan.use_denoising
+            scene.cycles.time_limit = plan.time_limit
+        elif self._engine == RenderEngine.EEVEE:
+            scene.eevee.taa_render_samples = plan.samples
+        scene.render.resolution_percentage = plan.resolution_percentage
+        self._degraded = plan.degraded  # Until the end of the path; see _render_chunks()
+        successful_renders += self._render_path(camera, remaining, output_dir)
+        return successful_renders
+
+    def _render_chunks(
+        self,
+        camera: bpy.types.Object,
+        output_dir: str,
+        resume: bool,
+        deadline: Optional[float] = None
+    ) -> Tuple[int, int, int]:
+        """Render this process's frames of the camera path to output_dir.
+        
+        The path is generated, posed and rendered path_chunk_size views at a
+        time, so that only one chunk of views and poses is held in memory. 
+        Frames that are complete (if resuming) or cached are skipped, and 
+        frames that repeat another by symmetry are recorded as aliases and 
+        not counted as successful until they are written. With a 
+        deadline, the time budget is planned on the first chunk with frames 
+        to render and applies to the rest of the path.
+        
+        Returns:
+            Tuple of (total, successful, skipped) frame counts
+        """
+        generator = self._camera_generator()
+        total_renders = self._shard_frame_count(generator.count(self.camera_config))
+        successful_renders = skipped_renders = 0
+        seen = 0
+        try:
+            with self._progress_bar(total_renders) as pbar:
+                for start, chunk in self._iter_camera_chunks(generator):
+                    # Every worker indexes the whole path, so all agree on the aliases
+                    aliases = {}
+                    if self._symmetry_aliases is not None:
+                        aliases = self._symmetry_aliases.add(start, chunk)
+                    frames = self._select_frames(chunk, start)
+                    seen += len(frames)
+                    pending = self._pending_frames(frames, resume)
+                    skipped_renders += len(frames) - len(pending)
+                    pending = self._record_aliases(pending, aliases)
+                    pending, cache_hits = self._fetch_cached_frames(pending, output_dir)
+                    successful_renders += cache_hits
+                    pbar.update(len(frames) - len(pending))
+                    if not pending:
+                        continue
+                    self._load_camera_poses(start, chunk)
+                    if deadline is not None and not self._budget_stats:
+                        successful_renders += self._render_within_budget(
+                            camera, pending, output_dir, deadline, total_renders - seen
+                        )
+                    else:
+                        successful_renders += self._render_path(camera, pending, output_dir)
+        finally:
+            self._degraded = False
+            self._camera_poses = None
+        return total_renders, successful_renders, skipped_renders
+
+    def _reset_blender(self) -> None:
+        """Remove all objects and reset Blender to factory settings."""
+        # Ensure all objects are removed
+        bpy.ops.object.select_all(action='SELECT')
+        bpy.ops.object.delete()
+        # Reset Blender scene to factory settings
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+        self._pass_output = None
+        logger.info("Blender scene reset to factory settings.")
+        # Garbage collect
+        gc.collect()
+
+    def render(
+        self,
+        model_path: str,
+        output_dir: str,
+        resume: bool = False,
+        time_budget_s: Optional[float] = None
+    ) -> None:
+        """Render the model from multiple angles and save to output directory.
+        
+        If resume is True, frames that the output directory's manifest records 
+        as completed with the same configuration are skipped; missing, partial 
+        or outdated frames are rendered again.
+        
+        If time_budget_s is given, the whole path (including setup) is planned
+        to finish within that many seconds; see _render_within_budget().
+        """
+        start_time = time.time()
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
+        if self.render_config.workers > 1 and self._shard is None:
+            try:
+                self._frame_config_hash(model_path)  # Fail early on a missing model
+                path_type = self.camera_config.camera_path_type.value
+                plan_path = camera_registry.get_generator(path_type).plans_from_scene
+                planned = None
+                if self.render_config.autotune_samples or plan_path:
+                    # Probe and plan once here and hand the results to the workers
+                    try:
+                        self._setup_scene()
+                        self._import_model(model_path)
+                        camera = self._setup_camera()
+                        self._apply_lod(camera)
+                        self._downscale_textures(camera)
+                        self._setup_lighting()
+                        self._tune_samples(camera, model_path)
+                        if plan_path:
+                            planned = PlannedPathGenerator(
+                                self._camera_generator(), self.camera_config
+                            )
+                    finally:
+                        self._reset_blender()
+                deadline = None if time_budget_s is None else start_time + time_budget_s
+                self.render_stats = render_sharded(
+                    self, model_path, output_dir, resume, deadline, self._autotuned, planned
+                )
+                if 'symmetry' in self.render_stats:
+                    manifest = RenderManifest(output_dir, self._frame_config_hash(model_path))
+                    manifest.consolidate()  # Fold in the workers' pending aliases
+                    self._symmetry_stats = {'symmetry': dict(self.render_stats['symmetry'])}
+                    written = self._write_aliases(manifest)
+                    manifest.flush()
+                    self.render_stats.update(self._symmetry_stats)
+                    self.render_stats['successful_renders'] += written
+                    self.render_stats['failed_renders'] -= written
+                if self.render_config.autotune_samples:
+                    self.render_stats['autotune_time'] = self._sampling_stats['autotune_time']
+            except Exception as e:
+                raise RuntimeError(f"Render operation failed: {str(e)}")
+            finally:
+                if os.path.exists(model_path):
+                    RenderManifest(
+                        output_dir, self._frame_config_hash(model_path)
+                    ).consolidate()
+                consolidate_shard_indexes(output_dir)
+            return
+
+        self._manifest = None
+        self._cache = None
+        self._output_stats = {'encode_time': 0.0, 'encode_wait_time': 0.0}
+        self._budget_stats = {}
+        self._border_areas = []
+        self._background_pixels = {}
+        self._import_stats = {}
+        self._bake_stats = {}
         try:
-            start_time = time.time()
+            self._manifest = self._open_manifest(model_path, output_dir)
+            self._tar_writer = self._open_tar_writer(model_path, output_dir)
             
             self._setup_scene()
             self._import_model(model_path)
                           
             camera = self._setup_camera()            
+            self._apply_lod(camera)
+            self._downscale_textures(camera)
             lights = self._setup_lighting()
+            self._detect_symmetry()
             
-            camera_positions = self._generate_camera_positions()           
-            total_renders = len(camera_positions)
-            successful_renders = 0
-            
-            logger.info(f"Starting render of {total_renders} images...")
-
-            with tqdm(total=total_renders, desc="Rendering", unit="frame") as pbar:
-                for i, coord in enumerate(camera_positions):
-                    self._position_camera(camera, coord)
-                    
-                    # Delegate light position updates to the setup
-                    self.light_setup.update_positions(coord.azimuth)
-                    # Each setup class handles this differently:
-                    # - RandomDynamicSetup: repositions lights based on camera angle
-                    # - RandomFixedSetup: does nothing (lights stay in initial positions)
-                    # - OverheadSetup: does nothing (lights stay overhead)
-                    
-                    output_path = os.path.join(
-                        output_dir, 
-                        f"render_{i:03d}_az{coord.azimuth:03.0f}_el{coord.elevation:03.0f}"
-                        f"_roll{coord.roll:03.0f}.png"
-                    )
-                    bpy.context.scene.render.filepath = output_path
-       
-                    logger.debug(
-                        f"Frame {i}: Azimuth={coord.azimuth}, "
-                        f"Elevation={coord.elevation}, Roll={coord.roll}"
-                    )
-
-                    with stdout_redirected():  # Suppress Blender output during render
-                        try:
-                            bpy.ops.render.render(write_still=True)
-                            successful_renders += 1
-                        except Exception as e:
-                            logger.error(f"Failed to render position {i}: {str(e)}")
-                    # Update progress bar
-                    pbar.update(1)
-                    
-            logger.info(f"Completed {total_renders} renders.")
+            self._tune_samples(camera, model_path)
+            deadline = None if time_budget_s is None else start_time + time_budget_s
+            total_renders, successful_renders, skipped_renders = self._render_chunks(
+                camera, output_dir, resume, deadline
+            )
+            if self._symmetry_aliases is not None and self._shard is None:
+                # Workers leave their aliases to the parent, once all frames exist
+                successful_renders += self._write_aliases(self._manifest)
             
             end_time = time.time()
             
             self.render_stats = {
                 'total_renders': total_renders,
                 'successful_renders': successful_renders,
-                'failed_renders': total_renders - successful_renders,
+                'skipped_renders': skipped_renders,
+                'failed_renders': total_renders - skipped_renders - successful_renders,
+                **self._cache_stats(),
+                **self._output_stats,
+                **self._sampling_stats,
+                **self._budget_stats,
+                **self._border_stats(),
+                **self._import_stats,
+                **self._lod_stats,
+                **self._texture_stats,
+                **self._bake_stats,
+                **self._symmetry_stats,
+                **self._path_stats(),
+                'peak_memory_mb': peak_memory_mb(),
                 'render_time': end_time - start_time,
-                'output_directory': output_dir
+                'output_directory': output_dir,
+                'engine': self._engine.value
             }
             
         except Exception as e:
             raise RuntimeError(f"Render operation failed: {str(e)}")
 
         finally:
-            # Ensure all objects are removed
-            bpy.ops.object.select_all(action='SELECT')
-            bpy.ops.object.delete()
-            # Reset Blender scene to factory settings
-            bpy.ops.wm.read_factory_settings(use_empty=True)
-            logger.info("Blender scene reset to factory settings.")
-            # Garbage collect
-            gc.collect()
+            self._close_tar_writer()
+            if self._manifest is not None:
+                self._manifest.flush()
+            self._reset_blender()
+
+    def render_batch(
+        self,
+        model_paths: List[str],
+        output_root: str,
+        resume: bool = False
+    ) -> None:
+        """Render many models in one warm Blender session.
+        
+        The scene, world, camera and light rig are set up once and reused; 
+        between models only the previous model's datablocks are removed. Each 
+        model is rendered to ``output_root/<model name>``. A failed model is 
+        logged and recorded in the stats, and the session is rebuilt before 
+        the next model. 
+        
+        Each model directory keeps its own manifest; see render() for resume.
+        
+        Note: .blend files replace the whole session when opened, so they are 
+        rendered cold with render() and the session is rebuilt afterwards.
+        """
+        if not os.path.exists(output_root):
+            os.makedirs(output_root)
+
+        start_time = time.time()
+        camera = None  # None means the session needs a (re)build
+        model_stats = []
+        used_names = set()
+
+        try:
+            for model_path in model_paths:
+                model_name = os.path.splitext(os.path.basename(model_path))[0]
+                if model_name in used_names:
+                    model_name = f"{model_name}_{len(model_stats):03d}"
+                used_names.add(model_name)
+                output_dir = os.path.join(output_root, model_name)
+                os.makedirs(output_dir, exist_ok=True)
+
+                logger.info(f"Batch model {len(model_stats) + 1}/{len(model_paths)}: {model_path}")
+                model_start = time.time()
+                stats = {
+                    'model_path': model_path,
+                    'output_directory': output_dir,
+                    'total_renders': 0,
+                    'successful_renders': 0,
+                    'skipped_renders': 0,
+                    'failed_renders': 0,
+                    'cache_hits': 0,
+                    'cache_misses': 0,
+                    'encode_time': 0.0,
+                    'encode_wait_time': 0.0,
+                    'import_time_saved': 0.0,
+                }
+
+                try:
+                    if model_path.lower().endswith('.blend'):
+                        camera = None
+                        self.render(model_path, output_dir, resume)
+                        stats.update(self.render_stats)
+                        stats['import_time'] = None
+                    else:
+                        self._manifest = self._open_manifest(model_path, output_dir)
+                        self._tar_writer = self._open_tar_writer(model_path, output_dir)
+                        self._output_stats = {'encode_time': 0.0, 'encode_wait_time': 0.0}
+                        self._border_areas = []
+                        self._background_pixels = {}
+                        import_start = time.time()
+                        if camera is None:
+                            self._setup_scene()
+                            self._import_model(model_path)
+                            camera = self._setup_camera()
+                            self._setup_lighting()
+                        else:
+                            self._remove_model(camera)
+                            self._import_model(model_path, clear_scene=False)
+                            camera = self._setup_camera()  # Retarget tracking
+                        self._apply_lod(camera)
+                        self._downscale_textures(camera)
+                        self._detect_symmetry()
+                        stats['import_time'] = time.time() - import_start
+                        stats['scene_cache_hit'] = self._import_stats['scene_cache_hit']
+                        stats['import_time_saved'] = self._import_stats['import_time_saved']
+                        stats.update(self._lod_stats)
+                        stats.update(self._texture_stats)
+
+                        self._tune_samples(camera, model_path)
+                        stats.update(self._sampling_stats)
+                        total, successful, skipped = self._render_chunks(
+                            camera, output_dir, resume
+                        )
+                        if self._symmetry_aliases is not None:
+                            successful += self._write_aliases(self._manifest)
+                        stats['total_renders'] = total
+                        stats['successful_renders'] = successful
+                        stats['skipped_renders'] = skipped
+                        stats['failed_renders'] = total - skipped - successful
+                        stats.update(self._cache_stats())
+                        stats.update(self._output_stats)
+                        stats.update(self._border_stats())
+                        stats.update(self._symmetry_stats)
+                        stats.update(self._path_stats())
+                except Exception as e:
+                    logger.error(f"Batch render failed for {model_path}: {str(e)}")
+                    stats['error'] = str(e)
+                    camera = None
+                finally:
+                    self._close_tar_writer()
+                    if self._manifest is not None:
+                        self._manifest.flush()
+                        self._manifest = None
+
+                stats['render_time'] = time.time() - model_start
+                model_stats.append(stats)
+
+        finally:
+            self._reset_blender()
+
+        self.render_stats = {
+            'total_models': len(model_stats),
+            'successful_models': sum('error' not in s for s in model_stats),
+            'failed_models': sum('error' in s for s in model_stats),
+            'total_renders': sum(s['total_renders'] for s in model_stats),
+            'successful_renders': sum(s['successful_renders'] for s in model_stats),
+            'skipped_renders': sum(s['skipped_renders'] for s in model_stats),
+            'cache_hits': sum(s['cache_hits'] for s in model_stats),
+            'cache_misses': sum(s['cache_misses'] for s in model_stats),
+            'encode_time': sum(s['encode_time'] for s in model_stats),
+            'encode_wait_time': sum(s['encode_wait_time'] for s in model_stats),
+            'import_time_saved': sum(s['import_time_saved'] for s in model_stats),
+            'failed_renders': sum(s['failed_renders'] for s in model_stats),
+            'peak_memory_mb': peak_memory_mb(),
+            'render_time': time.time() - start_time,
+            'output_directory': output_root,
+            'engine': self._engine.value,
+            'models': model_stats
+        }
+
+    def render_iter(
+        self,
+        model_path: str,
+        linear: bool = False
+    ) -> Iterator[Tuple[SphericalCoordinate, np.ndarray]]:
+        """Render the model and yield (position, pixels) pairs in path order.
+        
+        Pixels are RGBA arrays of shape (resolution_y, resolution_x, 4), top 
+        row first. By default they are uint8 and identical to the PNG files 
+        render() would write; with linear=True they are float32 scene-linear 
+        values. No PNG is encoded and nothing is written to an output directory.
+        With BorderMode.CROP, each array only covers the frame's border region.
+        
+        Note: workers, bake_animation, resume, the render cache, 
+        output_format, passes, symmetry_aliasing and autotune_samples apply to rendering to a 
+        directory and are ignored here. Render stats are available 
+        once the generator is exhausted or closed.
+        """
+        start_time = time.time()
+        total_renders = 0
+        successful_renders = 0
+        capture = None
+        self._import_stats = {}
+        self._bake_stats = {}
+
+        try:
+            try:
+                self._setup_scene()
+                self._import_model(model_path)
+                if self._pass_output is not None:
+                    self._pass_output.remove()
+                    self._pass_output = None
+                camera = self._setup_camera()
+                self._apply_lod(camera)
+                self._downscale_textures(camera)
+                self._setup_lighting()
+                generator = self._camera_generator()
+                total_renders = generator.count(self.camera_config)
+            except Exception as e:
+                raise RuntimeError(f"Render operation failed: {str(e)}")
+
+            capture = FrameCapture(linear)
+            use_border = self.render_config.border_mode != BorderMode.NONE
+            corners = self._model_bounds() if use_border else []
+            self._border_areas = []
+            self._background_pixels = {}
+            logger.info(f"Starting in-memory render of {total_renders} images...")
+
+            for start, chunk in self._iter_camera_chunks(generator):
+                self._load_camera_poses(start, chunk)
+                for i, coord in enumerate(chunk, start):
+                    self._position_camera(camera, coord, i)
+                    self.light_setup.update_positions(coord.azimuth)
+                    region = None
+                    if use_border:
+                        region = self._border_region(camera, corners)
+                        self._set_border(region)
+                    try:
+                        with stdout_redirected():  # Suppress Blender output during render
+                            pixels = capture.render(bpy.context.scene)
+                        if region is not None and self._border_fill_needed():
+                            fill_outside_region(pixels, region, self._background_pixel(capture))
+                    except Exception as e:
+                        logger.error(f"Failed to render position {i}: {str(e)}")
+                        continue
+                    successful_renders += 1
+                    yield coord, pixels
+
+        finally:
+            if capture is not None:
+                capture.close()
+            self.render_stats = {
+                'total_renders': total_renders,
+                'successful_renders': successful_renders,
+                'failed_renders': total_renders - successful_renders,
+                'render_time': time.time() - start_time,
+                'output_directory': None,
+                'engine': self._engine.value,
+                **self._border_stats(),
+                **self._import_stats,
+                **self._lod_stats,
+                **self._texture_stats,
+                **self._bake_stats,
+                **self._path_stats(),
+                'peak_memory_mb': peak_memory_mb()
+            }
+            self._reset_blender()
 
     def get_render_stats(self) -> dict:
         """Return statistics about the last render operation."""
@@ -0,0 +1,14 @@
+# src/renderer/output/__init__.py
+"""Output stages that write rendered frames."""
+
+from renderer.output.async_writer import AsyncFrameWriter, write_file_atomic
+from renderer.output.png import encode_png
+from renderer.output.tar_shards import TarShardWriter, consolidate_shard_indexes
+
+__all__ = [
+    'AsyncFrameWriter',
+    'TarShardWriter',
+    'consolidate_shard_indexes',
+    'encode_png',
+    'write_file_atomic'
+]
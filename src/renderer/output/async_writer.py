@@ -0,0 +1,93 @@
+# src/renderer/output/async_writer.py
+"""Encode and write frames on a bounded thread pool, off the render thread."""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from renderer.output.png import encode_png
+from renderer.utils.logger import logger
+
+def write_file_atomic(output_path: str, data: bytes) -> None:
+    """Write data to output_path through a temporary file, so readers never
+    see a partially written image."""
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(data)
+    os.replace(tmp_path, output_path)
+
+class AsyncFrameWriter:
+    """Hands captured frames to worker threads for PNG encoding and writing.
+
+    At most max_pending frames are queued or being encoded at any time;
+    submit() blocks until a slot frees up, which keeps memory bounded when
+    encoding is slower than rendering. Completion callbacks run on the thread
+    calling submit(), poll() or close(), so they may safely touch bpy or other
+    non-thread-safe state.
+
+    Args:
+        workers: Number of encoder threads
+        max_pending: Maximum number of frames held in memory (default: 2 * workers)
+    """
+
+    def __init__(self, workers: int, max_pending: int = 0):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="encoder")
+        self._slots = threading.Semaphore(max_pending or 2 * workers)
+        self._pending: List[Tuple[Future, Callable[[], None]]] = []
+        self._lock = threading.Lock()
+        self.encode_time = 0.0  # Summed over encoder threads
+        self.wait_time = 0.0  # Time the render thread was blocked by backpressure
+        self.failed = 0
+
+    def _encode_and_write(self, pixels: np.ndarray, write: Callable[[bytes], None]) -> None:
+        """Encode a frame as PNG and write it (runs on an encoder thread)."""
+        start_time = time.perf_counter()
+        try:
+            write(encode_png(pixels))
+        finally:
+            with self._lock:
+                self.encode_time += time.perf_counter() - start_time
+            self._slots.release()
+
+    def submit(
+        self,
+        pixels: np.ndarray,
+        write: Callable[[bytes], None],
+        on_done: Callable[[], None]
+    ) -> None:
+        """Queue a frame for encoding.
+        
+        write receives the PNG bytes on an encoder thread, e.g. 
+        partial(write_file_atomic, path); on_done is called once it returned.
+        """
+        start_time = time.perf_counter()
+        self._slots.acquire()
+        self.wait_time += time.perf_counter() - start_time
+        future = self._executor.submit(self._encode_and_write, pixels, write)
+        self._pending.append((future, on_done))
+        self.poll()
+
+    def poll(self) -> None:
+        """Run the callbacks of frames that have finished writing."""
+        still_pending = []
+        for future, on_done in self._pending:
+            if not future.done():
+                still_pending.append((future, on_done))
+                continue
+            try:
+                future.result()
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Failed to write frame: {str(e)}")
+            else:
+                on_done()
+        self._pending = still_pending
+
+    def close(self) -> None:
+        """Wait for all queued frames and run their callbacks."""
+        self._executor.shutdown(wait=True)
+        self.poll()
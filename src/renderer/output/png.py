@@ -0,0 +1,48 @@
+# src/renderer/output/png.py
+"""Minimal PNG encoder for uint8 RGB(A) arrays.
+
+Compression is done by zlib, which releases the GIL, so several frames can be
+encoded in parallel by a thread pool while Blender renders the next frame.
+"""
+
+import struct
+import zlib
+
+import numpy as np
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_COLOR_TYPES = {3: 2, 4: 6}  # channels -> PNG color type (RGB, RGBA)
+_FILTER_UP = 2
+
+def _chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Return a PNG chunk with length and CRC."""
+    return (
+        struct.pack(">I", len(data))
+        + chunk_type
+        + data
+        + struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF)
+    )
+
+def encode_png(pixels: np.ndarray, compress_level: int = 6) -> bytes:
+    """Encode an array of shape (height, width, 3 or 4), top row first, as PNG.
+
+    Every scanline uses the 'Up' filter (difference to the previous row),
+    which is cheap to compute with NumPy and compresses renders well.
+    """
+    if pixels.dtype != np.uint8 or pixels.ndim != 3 or pixels.shape[2] not in _COLOR_TYPES:
+        raise ValueError("Pixels must be a uint8 array of shape (height, width, 3 or 4)")
+    height, width, channels = pixels.shape
+
+    rows = pixels.reshape(height, width * channels)
+    filtered = np.empty((height, width * channels + 1), dtype=np.uint8)
+    filtered[:, 0] = _FILTER_UP
+    filtered[0, 1:] = rows[0]
+    np.subtract(rows[1:], rows[:-1], out=filtered[1:, 1:])  # Wraps modulo 256
+
+    header = struct.pack(">IIBBBBB", width, height, 8, _COLOR_TYPES[channels], 0, 0, 0)
+    return b"".join([
+        _PNG_SIGNATURE,
+        _chunk(b"IHDR", header),
+        _chunk(b"IDAT", zlib.compress(filtered.tobytes(), compress_level)),
+        _chunk(b"IEND", b""),
+    ])
@@ -0,0 +1,136 @@
+# src/renderer/output/tar_shards.py
+"""WebDataset-style output: frames and JSON sidecars in rolling tar shards.
+
+Each frame becomes a sample of two tar members sharing a key, ``<key>.png``
+and ``<key>.json`` (coordinate and configs). Shards are plain uncompressed
+tar files that roll over at a configurable size, so downstream loaders can
+stream them with large sequential reads instead of opening millions of small
+files. A JSON shard index lists every shard with the byte offset and size of
+each member, for random access without scanning the tars.
+"""
+
+import glob
+import io
+import json
+import os
+import tarfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from renderer.utils.manifest import write_json_atomic
+
+SHARD_INDEX_FILENAME = "shards.json"
+WORKER_INDEX_PATTERN = "shards.worker-*.json"
+
+class TarShardWriter:
+    """Append samples to rolling tar shards and keep a shard index.
+
+    add() is thread-safe, so encoder threads may write samples directly.
+
+    Args:
+        output_dir: Directory for the shards and the shard index
+        shard_size_bytes: Size at which a new shard is started
+        worker: Index of the worker process writing, if the render is sharded
+            across processes; each worker writes its own shards and index
+    """
+
+    def __init__(self, output_dir: str, shard_size_bytes: int, worker: Optional[int] = None):
+        self.output_dir = output_dir
+        self.shard_size_bytes = shard_size_bytes
+        if worker is None:
+            self._prefix = "shard"
+            self.index_path = os.path.join(output_dir, SHARD_INDEX_FILENAME)
+        else:
+            self._prefix = f"shard-w{worker:02d}"
+            self.index_path = os.path.join(output_dir, f"shards.worker-{worker}.json")
+        self.shards: List[dict] = []
+        self._tar: Optional[tarfile.TarFile] = None
+        self._lock = threading.Lock()
+
+    def _open_shard(self) -> None:
+        """Start the next shard file."""
+        name = f"{self._prefix}-{len(self.shards):06d}.tar"
+        self._tar = tarfile.open(os.path.join(self.output_dir, name), "w", format=tarfile.PAX_FORMAT)
+        self.shards.append({"name": name, "size": 0, "samples": []})
+
+    def _close_shard(self) -> None:
+        """Finish the current shard and update the index on disk."""
+        if self._tar is None:
+            return
+        self._tar.close()
+        self._tar = None
+        shard = self.shards[-1]
+        shard["size"] = os.path.getsize(os.path.join(self.output_dir, shard["name"]))
+        self._write_index()
+
+    def _add_member(self, name: str, data: bytes) -> dict:
+        """Append one member to the current shard and return its location."""
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        self._tar.addfile(info, io.BytesIO(data))
+        padded_size = -(-len(data) // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+        return {"name": name, "offset": self._tar.offset - padded_size, "size": len(data)}
+
+    def add(
+        self,
+        key: str,
+        index: int,
+        image: bytes,
+        metadata: dict,
+        extra: Optional[Dict[str, bytes]] = None
+    ) -> None:
+        """Add a sample: the encoded image, its JSON sidecar and any extra
+        members, stored as <key>.<extension> (e.g. {"depth.exr": data})."""
+        sidecar = json.dumps(metadata, sort_keys=True).encode("utf-8")
+        extra = extra or {}
+        with self._lock:
+            sample_size = (
+                len(image) + len(sidecar) + sum(len(data) for data in extra.values())
+                + (2 * len(extra) + 4) * tarfile.BLOCKSIZE
+            )
+            if self._tar is not None and self._tar.offset + sample_size > self.shard_size_bytes:
+                self._close_shard()
+            if self._tar is None:
+                self._open_shard()
+            self.shards[-1]["samples"].append({
+                "key": key,
+                "index": index,
+                "members": [
+                    self._add_member(f"{key}.png", image),
+                    self._add_member(f"{key}.json", sidecar),
+                    *(self._add_member(f"{key}.{ext}", data) for ext, data in extra.items()),
+                ],
+            })
+
+    def _write_index(self) -> None:
+        """Atomically write the shard index."""
+        write_json_atomic(self.index_path, {
+            "version": 1,
+            "samples": sum(len(shard["samples"]) for shard in self.shards),
+            "shards": self.shards,
+        })
+
+    def close(self) -> None:
+        """Finish the last shard and write the final index."""
+        with self._lock:
+            self._close_shard()
+            self._write_index()
+
+def consolidate_shard_indexes(output_dir: str) -> None:
+    """Merge per-worker shard indexes into the directory's main shard index."""
+    worker_paths = sorted(glob.glob(os.path.join(output_dir, WORKER_INDEX_PATTERN)))
+    if not worker_paths:
+        return
+    shards: List[Dict] = []
+    for path in worker_paths:
+        with open(path) as file:
+            shards.extend(json.load(file)["shards"])
+    write_json_atomic(os.path.join(output_dir, SHARD_INDEX_FILENAME), {
+        "version": 1,
+        "samples": sum(len(shard["samples"]) for shard in shards),
+        "shards": shards,
+    })
+    for path in worker_paths:
+        os.remove(path)
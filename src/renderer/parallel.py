@@ -0,0 +1,164 @@
+# src/renderer/parallel.py
+"""Process-pool rendering of one model's camera path across CPU cores.
+
+Each worker is a separate Python process with its own Blender instance. Every
+worker imports the model, regenerates the (deterministic) camera path and
+renders only its shard of frames, so frame indices and filenames are the same
+as in a serial run. Paths planned from the model (coverage, adaptive) are
+planned once by the parent and sent to the workers instead.
+
+Note: workers are started with the 'spawn' method, so scripts that render
+with RenderConfig(workers=N) must be protected by ``if __name__ == "__main__"``.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import List, Optional, Sequence, Tuple, TypeVar
+
+from renderer.utils.logger import logger
+
+T = TypeVar("T")
+
+def shard_frames(frames: Sequence[T], shard_index: int, num_shards: int) -> List[T]:
+    """Return the frames belonging to one shard.
+
+    Frames are dealt out round-robin rather than in contiguous blocks, so that
+    every shard gets a similar mix of views (e.g. polar and equatorial views
+    of a spiral path, which can differ a lot in render time).
+    """
+    return list(frames[shard_index::num_shards])
+
+def threads_per_worker(workers: int) -> int:
+    """Divide the available CPU cores evenly between workers."""
+    return max(1, (os.cpu_count() or 1) // workers)
+
+@contextmanager
+def _without_blender_script_paths():
+    """Hide Blender's script directories from sys.path while spawning workers.
+
+    Importing bpy prepends its bundled ``scripts/modules`` directory, which
+    holds a pure-Python ``bpy`` package. Spawned workers inherit the parent's
+    sys.path, and would then import that package instead of the bpy module.
+    """
+    bpy_module = sys.modules.get("bpy")
+    blender_root = bpy_module.utils.resource_path('LOCAL') if bpy_module else None
+    saved_path = list(sys.path)
+    if blender_root:
+        sys.path[:] = [p for p in sys.path if not p.startswith(blender_root + os.sep)]
+    try:
+        yield
+    finally:
+        sys.path[:] = saved_path
+
+def _render_shard(
+    configs: dict,
+    model_path: str,
+    output_dir: str,
+    shard: Tuple[int, int],
+    resume: bool,
+    deadline: Optional[float] = None,
+    autotuned: Optional[dict] = None,
+    path_generator=None
+) -> dict:
+    """Render one shard in a worker process and return its render stats.
+    
+    A deadline (time.time() value) is turned into the worker's time budget.
+    Autotuned sampling settings and a PlannedPathGenerator from the parent
+    are used as they are.
+    """
+    # Imported here so the parent process does not need bpy to build the pool
+    from renderer.model_renderer import ModelRenderer
+
+    renderer = ModelRenderer(**configs)
+    renderer._shard = shard
+    renderer._autotuned.update(autotuned or {})
+    renderer._planned_generator = path_generator
+    time_budget_s = None if deadline is None else deadline - time.time()
+    renderer.render(model_path, output_dir, resume, time_budget_s)
+    stats = renderer.get_render_stats()
+    stats['shard'] = shard[0]
+    return stats
+
+def merge_shard_stats(shard_stats: List[dict], output_dir: str, render_time: float) -> dict:
+    """Combine per-shard render stats into stats for the whole path."""
+    merged = {
+        'total_renders': sum(s['total_renders'] for s in shard_stats),
+        'successful_renders': sum(s['successful_renders'] for s in shard_stats),
+        'skipped_renders': sum(s['skipped_renders'] for s in shard_stats),
+        'cache_hits': sum(s['cache_hits'] for s in shard_stats),
+        'cache_misses': sum(s['cache_misses'] for s in shard_stats),
+        'encode_time': sum(s['encode_time'] for s in shard_stats),
+        'encode_wait_time': sum(s['encode_wait_time'] for s in shard_stats),
+        'import_time_saved': sum(s['import_time_saved'] for s in shard_stats),
+        'failed_renders': sum(s['failed_renders'] for s in shard_stats),
+        'render_time': render_time,
+        'output_directory': output_dir,
+        'engine': shard_stats[0]['engine'] if shard_stats else None,
+        **{
+            key: shard_stats[0][key]
+            for key in ('samples', 'adaptive_threshold', 'coverage', 'refinement', 'deduplication',
+                        'symmetry')
+            if shard_stats and key in shard_stats[0]
+        },
+        'workers': len(shard_stats),
+        'shards': sorted(shard_stats, key=lambda s: s['shard'])
+    }
+    return merged
+
+def render_sharded(
+    renderer,
+    model_path: str,
+    output_dir: str,
+    resume: bool = False,
+    deadline: Optional[float] = None,
+    autotuned: Optional[dict] = None,
+    path_generator=None
+) -> dict:
+    """Render a model with render_config.workers processes and merge the stats.
+
+    Each worker records its frames in its own shard manifest; the caller is
+    responsible for consolidating them into the main manifest.
+
+    Args:
+        renderer: ModelRenderer whose configs are copied to every worker
+        model_path: Path to the 3D model file
+        output_dir: Directory shared by all workers for their output frames
+        resume: Skip frames the manifest records as complete
+        deadline: time.time() by which every worker should have finished
+        autotuned: Autotuned sampling settings by config hash, probed once by
+            the caller rather than in every worker
+        path_generator: PlannedPathGenerator of a path planned by the caller,
+            rendered by the workers instead of planning it again
+
+    Returns:
+        dict: Merged render stats, with per-shard stats under 'shards'
+    """
+    workers = renderer.render_config.workers
+    threads = renderer.render_config.threads or threads_per_worker(workers)
+    configs = {
+        'blend_config': renderer.blend_config,
+        'render_config': replace(renderer.render_config, workers=1, threads=threads),
+        'lighting_config': renderer.lighting_config,
+        'camera_config': renderer.camera_config
+    }
+    logger.info(f"Rendering with {workers} worker processes, {threads} threads each")
+
+    start_time = time.time()
+    context = multiprocessing.get_context("spawn")  # bpy is not fork-safe
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        with _without_blender_script_paths():  # Workers are spawned on submit
+            futures = [
+                executor.submit(
+                    _render_shard, configs, model_path, output_dir, (k, workers), resume,
+                    deadline, autotuned, path_generator
+                )
+                for k in range(workers)
+            ]
+        shard_stats = [future.result() for future in futures]
+
+    return merge_shard_stats(shard_stats, output_dir, time.time() - start_time)
@@ -1,5 +1,10 @@
 # src/renderer/utils/__init__.py
-"""Utility functions and classes for the renderer package."""
+"""Utility functions and classes for the renderer package.
+
+Only bpy-free modules are imported here. The modules wrapping Blender data
+(bake, capture, passes, snapshot, symmetry, textures) import bpy and are imported
+directly by the renderer.
+"""
 
 from renderer.utils.logger import logger  
 from renderer.utils.coordinates import SphericalCoordinate
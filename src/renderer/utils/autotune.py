@@ -0,0 +1,116 @@
+# src/renderer/utils/autotune.py
+"""Pick the cheapest Cycles sampling settings that meet a noise target.
+
+A few probe views are rendered at the configured samples (the reference) and
+then along a ladder of cheaper (samples, adaptive_threshold) pairs. The first
+pair whose images are within the target RMSE of the reference is used for the
+whole camera path. Results are cached per model and config hash, so a batch
+or a resumed job does not repeat the probe.
+"""
+
+import json
+import math
+import os
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from renderer.utils.logger import logger
+from renderer.utils.manifest import write_json_atomic
+
+AUTOTUNE_FILENAME = "autotune.json"
+
+# Cycles' default adaptive threshold, used for the reference render
+REFERENCE_THRESHOLD = 0.01
+
+@dataclass(frozen=True)
+class SampleSettings:
+    """Cycles sampling settings chosen by the autotuner."""
+    samples: int
+    adaptive_threshold: float
+
+def sample_ladder(max_samples: int, min_samples: int = 8) -> List[SampleSettings]:
+    """Return candidate settings from cheapest to the max_samples reference.
+
+    Samples double from min_samples; the adaptive threshold is loosened in
+    proportion to the expected noise (1 / sqrt(samples)) of each step.
+    """
+    ladder = []
+    samples = min(min_samples, max_samples)
+    while samples < max_samples:
+        threshold = min(REFERENCE_THRESHOLD * math.sqrt(max_samples / samples), 0.1)
+        ladder.append(SampleSettings(samples, round(threshold, 4)))
+        samples *= 2
+    ladder.append(SampleSettings(max_samples, REFERENCE_THRESHOLD))
+    return ladder
+
+def probe_indices(num_positions: int, num_views: int) -> List[int]:
+    """Return up to num_views indices spread evenly along a camera path."""
+    if num_positions <= 0:
+        return []
+    num_views = min(num_views, num_positions)
+    return sorted({round(k * num_positions / num_views) for k in range(num_views)})
+
+def image_rmse(image: np.ndarray, reference: np.ndarray) -> float:
+    """Return the RMS difference of the RGB channels, on a [0, 1] scale."""
+    scale = 255.0 if image.dtype == np.uint8 else 1.0
+    diff = (image[..., :3].astype(np.float32) - reference[..., :3].astype(np.float32)) / scale
+    return float(np.sqrt(np.mean(diff * diff)))
+
+class SampleAutotuner:
+    """Search the sample ladder for the cheapest settings meeting noise_target.
+
+    Args:
+        max_samples: Samples of the reference render (RenderConfig.samples)
+        noise_target: Largest acceptable RMSE against the reference
+    """
+
+    def __init__(self, max_samples: int, noise_target: float):
+        self.ladder = sample_ladder(max_samples)
+        self.noise_target = noise_target
+        self.errors: Dict[int, float] = {}  # samples -> RMSE of the probes
+
+    def tune(self, render: Callable[[SampleSettings], List[np.ndarray]]) -> SampleSettings:
+        """Return the chosen settings; render(settings) returns the probe images."""
+        reference = render(self.ladder[-1])
+        for settings in self.ladder[:-1]:
+            images = render(settings)
+            error = float(np.mean([image_rmse(i, r) for i, r in zip(images, reference)]))
+            self.errors[settings.samples] = error
+            logger.debug(
+                f"Autotune: {settings.samples} samples, threshold "
+                f"{settings.adaptive_threshold}: RMSE {error:.4f}"
+            )
+            if error <= self.noise_target:
+                return settings
+        return self.ladder[-1]
+
+class AutotuneCache:
+    """Chosen settings per model/config hash in a JSON file.
+
+    Args:
+        directory: Directory holding autotune.json (created if missing)
+    """
+
+    def __init__(self, directory: str):
+        self.path = os.path.join(directory, AUTOTUNE_FILENAME)
+        os.makedirs(directory, exist_ok=True)
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def get(self, key: str) -> Optional[SampleSettings]:
+        """Return the cached settings for key, if any."""
+        entry = self._load().get(key)
+        return SampleSettings(**entry) if entry else None
+
+    def put(self, key: str, settings: SampleSettings) -> None:
+        """Store the settings chosen for key."""
+        entries = self._load()
+        entries[key] = asdict(settings)
+        write_json_atomic(self.path, entries)
@@ -0,0 +1,266 @@
+# src/renderer/utils/bake.py
+"""Bake procedural materials into image textures before a camera sweep.
+
+Procedural textures (noise, Voronoi, bricks, ...) are evaluated at every
+shading point of every sample of every view. For views of a static model the
+result never changes, so each mesh using such materials is baked once to an
+image on a dedicated UV layer ("BakeUV", smart-projected so islands never
+overlap) and its materials are swapped for a simple shader reading that image.
+
+DIFFUSE bakes the surface color only and is shaded again by the render's
+lights. COMBINED also bakes the lighting present at bake time (the .blend's
+own lights and world) and is shown through an emission shader.
+
+Bakes are cached as PNG files keyed by the hashes of the mesh, its material
+node trees, the bake type and the image size, so later runs skip the bake.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import bpy
+import numpy as np
+
+from renderer.utils.cache import RenderCache
+from renderer.utils.hashing import config_hash
+from renderer.utils.logger import logger
+
+BAKE_TYPES = {"DIFFUSE", "COMBINED"}
+
+BAKE_UV_NAME = "BakeUV"
+
+# Samples of a DIFFUSE color bake; only anti-aliases texel edges
+COLOR_BAKE_SAMPLES = 16
+
+# Passes of a bake type; a COMBINED bake with no passes fails in Blender
+BAKE_PASS_FILTERS = {
+    "DIFFUSE": {'COLOR'},
+    "COMBINED": {'EMIT', 'DIRECT', 'INDIRECT', 'DIFFUSE', 'GLOSSY', 'TRANSMISSION'},
+}
+
+# Texture nodes computed from coordinates rather than read from an image
+PROCEDURAL_NODE_TYPES = {
+    'TEX_BRICK', 'TEX_CHECKER', 'TEX_GABOR', 'TEX_GRADIENT', 'TEX_MAGIC',
+    'TEX_MUSGRAVE', 'TEX_NOISE', 'TEX_VORONOI', 'TEX_WAVE', 'TEX_WHITE_NOISE',
+}
+
+def is_procedural(tree: Optional[bpy.types.NodeTree]) -> bool:
+    """Return whether a node tree (or a group inside it) has procedural textures."""
+    if tree is None:
+        return False
+    return any(
+        node.type in PROCEDURAL_NODE_TYPES
+        or (node.type == 'GROUP' and is_procedural(node.node_tree))
+        for node in tree.nodes
+    )
+
+def _plain(value: Any) -> Any:
+    """Convert an RNA property value into something JSON can hash."""
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if isinstance(value, bpy.types.NodeTree):
+        return node_tree_hash(value)
+    if isinstance(value, bpy.types.ID):
+        return [value.name, getattr(value, "filepath", "")]
+    if isinstance(value, bpy.types.ColorRamp):
+        return [value.interpolation, [[e.position, list(e.color)] for e in value.elements]]
+    if isinstance(value, set):  # Enum flags
+        return sorted(value)
+    try:
+        return [_plain(v) for v in value]
+    except TypeError:
+        return None  # Other structs (e.g. curve mappings) are not hashed
+
+def node_tree_hash(tree: bpy.types.NodeTree) -> str:
+    """Return a hash of a node tree's nodes, settings, socket values and links."""
+    base_properties = {prop.identifier for prop in bpy.types.Node.bl_rna.properties}
+    nodes = []
+    for node in sorted(tree.nodes, key=lambda n: n.name):
+        nodes.append([
+            node.bl_idname,
+            node.name,
+            {
+                prop.identifier: _plain(getattr(node, prop.identifier))
+                for prop in node.bl_rna.properties
+                if prop.identifier not in base_properties
+            },
+            [
+                _plain(socket.default_value) for socket in node.inputs
+                if hasattr(socket, "default_value")
+            ],
+        ])
+    links = sorted(
+        [link.from_node.name, link.from_socket.identifier,
+         link.to_node.name, link.to_socket.identifier]
+        for link in tree.links
+    )
+    payload = json.dumps([nodes, links], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def mesh_hash(mesh: bpy.types.Mesh) -> str:
+    """Return a hash of a mesh's vertex positions and faces."""
+    digest = hashlib.sha256()
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loops)
+    sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", sizes)
+    for array in (coords, loops, sizes):
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+def _add_bake_uvs(obj: bpy.types.Object) -> None:
+    """Give the object's mesh a non-overlapping BakeUV layer and make it active.
+
+    The layer used for rendering (active_render) is left unchanged.
+    """
+    mesh = obj.data
+    layer = mesh.uv_layers.get(BAKE_UV_NAME) or mesh.uv_layers.new(name=BAKE_UV_NAME)
+    mesh.uv_layers.active = layer
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='SELECT')
+    bpy.ops.uv.smart_project(island_margin=0.02)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+def _bake(obj: bpy.types.Object, image: bpy.types.Image, bake_type: str) -> None:
+    """Bake all materials of an object into image through its BakeUV layer."""
+    scene = bpy.context.scene
+    targets = []
+    for material in {slot.material for slot in obj.material_slots if slot.material}:
+        node = material.node_tree.nodes.new('ShaderNodeTexImage')
+        node.image = image
+        material.node_tree.nodes.active = node
+        targets.append((material, node))
+
+    engine, samples = scene.render.engine, scene.cycles.samples
+    scene.render.engine = 'CYCLES'
+    if bake_type == "DIFFUSE":
+        scene.cycles.samples = COLOR_BAKE_SAMPLES
+    try:
+        bpy.ops.object.select_all(action='DESELECT')
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.bake(
+            type=bake_type,
+            pass_filter=BAKE_PASS_FILTERS[bake_type],
+            margin=4
+        )
+    finally:
+        scene.render.engine, scene.cycles.samples = engine, samples
+        for material, node in targets:
+            material.node_tree.nodes.remove(node)
+
+def _discard_bake(mesh: bpy.types.Mesh, image: Optional[bpy.types.Image], created_uvs: bool) -> None:
+    """Remove the image and BakeUV layer left by a failed bake."""
+    if bpy.context.object is not None and bpy.context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    if image is not None:
+        bpy.data.images.remove(image)
+    layer = mesh.uv_layers.get(BAKE_UV_NAME)
+    if created_uvs and layer is not None:
+        mesh.uv_layers.remove(layer)
+
+def baked_material(name: str, image: bpy.types.Image, bake_type: str) -> bpy.types.Material:
+    """Return a material showing a baked image through the BakeUV layer."""
+    material = bpy.data.materials.new(name)
+    if material.node_tree is None:  # Blender < 5.0
+        material.use_nodes = True
+    tree = material.node_tree
+    tree.nodes.clear()
+    uv_map = tree.nodes.new('ShaderNodeUVMap')
+    uv_map.uv_map = BAKE_UV_NAME
+    texture = tree.nodes.new('ShaderNodeTexImage')
+    texture.image = image
+    output = tree.nodes.new('ShaderNodeOutputMaterial')
+    if bake_type == "COMBINED":
+        shader = tree.nodes.new('ShaderNodeEmission')
+        color_input = shader.inputs["Color"]
+    else:
+        shader = tree.nodes.new('ShaderNodeBsdfPrincipled')
+        color_input = shader.inputs["Base Color"]
+    tree.links.new(uv_map.outputs["UV"], texture.inputs["Vector"])
+    tree.links.new(texture.outputs["Color"], color_input)
+    tree.links.new(shader.outputs[0], output.inputs["Surface"])
+    return material
+
+def bake_procedural_materials(
+    scene: bpy.types.Scene,
+    bake_type: str,
+    size: int,
+    cache: Optional[RenderCache] = None
+) -> dict:
+    """Bake every mesh with procedural materials and swap in baked materials.
+
+    Meshes shared by several objects are baked once.
+
+    Args:
+        scene: Scene whose mesh objects are baked
+        bake_type: "DIFFUSE" or "COMBINED"
+        size: Width and height of each baked image in pixels
+        cache: Cache of baked images (None: bake every time)
+
+    Returns:
+        dict: Meshes and materials baked, cache hits and bake time
+    """
+    start_time = time.time()
+    users: Dict[bpy.types.Mesh, List[bpy.types.Object]] = {}
+    for obj in scene.objects:
+        if obj.type == 'MESH' and any(
+            slot.material and is_procedural(slot.material.node_tree)
+            for slot in obj.material_slots
+        ):
+            users.setdefault(obj.data, []).append(obj)
+
+    materials_baked = cache_hits = failed = 0
+    for mesh, objects in users.items():
+        obj = objects[0]
+        materials = [slot.material for slot in obj.material_slots]
+        key = config_hash(
+            "bake", mesh_hash(mesh), bake_type, size,
+            [node_tree_hash(m.node_tree) if m and m.node_tree else None for m in materials]
+        )
+        path = cache.lookup(key) if cache is not None else None
+        created_uvs = BAKE_UV_NAME not in mesh.uv_layers
+        image = None
+        try:
+            _add_bake_uvs(obj)
+            if path is not None:
+                image = bpy.data.images.load(path)
+                image.name = f"{mesh.name}_baked"
+                cache_hits += 1
+            else:
+                image = bpy.data.images.new(f"{mesh.name}_baked", size, size)
+                _bake(obj, image, bake_type)
+        except RuntimeError as e:  # E.g. the object is hidden from the view layer
+            logger.warning(f"Could not bake the materials of {obj.name}: {str(e)}")
+            _discard_bake(mesh, image, created_uvs)
+            failed += 1
+            continue
+        image.pack()  # Keeps the pixels if the cache entry is evicted
+
+        if path is None and cache is not None:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_path = os.path.join(temp_dir, "bake.png")
+                with open(temp_path, "wb") as file:
+                    file.write(image.packed_file.data)
+                cache.store(key, temp_path)
+
+        material = baked_material(f"{mesh.name}_baked", image, bake_type)
+        for user in objects:
+            for slot in user.material_slots:
+                slot.material = material
+        materials_baked += sum(m is not None for m in set(materials))
+        logger.debug(f"Baked {len(materials)} materials of mesh {mesh.name}")
+
+    return {
+        'meshes_baked': len(users) - failed,
+        'materials_baked': materials_baked,
+        'cache_hits': cache_hits,
+        'bake_time': time.time() - start_time,
+    }
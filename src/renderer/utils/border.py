@@ -0,0 +1,88 @@
+# src/renderer/utils/border.py
+"""Render regions around the model's projected bounding box.
+
+Cycles only traces the pixels inside scene.render's border region. The region
+is the padded 2D bounding box of the model's bounding-box corners projected
+through the camera (normalized view coordinates from world_to_camera_view,
+origin at the bottom left). The rest of a full-size frame is filled with the
+background value, which the renderer takes from a render of the empty scene:
+no pixel inside the region is known to show the background, since the model
+may touch the region's edges (no padding, or a region clamped to the frame).
+"""
+
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+# (min_x, min_y, max_x, max_y) in normalized view coordinates
+Region = Tuple[float, float, float, float]
+
+# Regions covering more of the frame than this are not worth a border render
+MAX_BORDER_AREA = 0.8
+
+def border_region(view_coords: np.ndarray, padding: float) -> Optional[Region]:
+    """Return the padded region containing the projected points, if useful.
+
+    Args:
+        view_coords: (N, 3) points from world_to_camera_view (x, y, depth)
+        padding: Margin added on every side, as a fraction of the frame
+
+    Returns:
+        The region clamped to the frame, or None if a point lies behind the
+        camera or the region would cover most of the frame anyway
+    """
+    view_coords = np.asarray(view_coords, dtype=np.float64)
+    if len(view_coords) == 0 or np.any(view_coords[:, 2] <= 0):
+        return None
+    min_x, min_y = np.clip(view_coords[:, :2].min(axis=0) - padding, 0.0, 1.0)
+    max_x, max_y = np.clip(view_coords[:, :2].max(axis=0) + padding, 0.0, 1.0)
+    if max_x <= min_x or max_y <= min_y:
+        return None  # Entirely outside the frame
+    if (max_x - min_x) * (max_y - min_y) > MAX_BORDER_AREA:
+        return None
+    return float(min_x), float(min_y), float(max_x), float(max_y)
+
+def union_region(regions: Iterable[Optional[Region]]) -> Optional[Region]:
+    """Return the smallest region containing all regions (None if any is None)."""
+    regions = list(regions)
+    if not regions or any(region is None for region in regions):
+        return None
+    return (
+        min(r[0] for r in regions), min(r[1] for r in regions),
+        max(r[2] for r in regions), max(r[3] for r in regions),
+    )
+
+def region_area(region: Optional[Region]) -> float:
+    """Return the fraction of the frame a region covers (1.0 for no region)."""
+    if region is None:
+        return 1.0
+    return (region[2] - region[0]) * (region[3] - region[1])
+
+def region_pixels(region: Region, width: int, height: int) -> Tuple[int, int, int, int]:
+    """Return the (left, top, right, bottom) pixel bounds, rows counted from the top.
+
+    Matches how Blender truncates the border to whole pixels.
+    """
+    left, right = int(region[0] * width), int(region[2] * width)
+    bottom, top = int(region[1] * height), int(region[3] * height)
+    return left, height - top, right, height - bottom
+
+def fill_outside_region(pixels: np.ndarray, region: Region, background: Sequence) -> np.ndarray:
+    """Fill the pixels outside a border render with the background value.
+
+    Args:
+        pixels: Full-size (height, width, channels) frame, top row first
+        region: Region the frame was rendered with
+        background: Value of a background pixel, one per channel
+
+    Returns:
+        The same array, filled in place
+    """
+    height, width = pixels.shape[:2]
+    left, top, right, bottom = region_pixels(region, width, height)
+    if right <= left or bottom <= top:
+        return pixels  # Region smaller than a pixel; Blender renders nothing
+    inside = pixels[top:bottom, left:right].copy()
+    pixels[...] = background
+    pixels[top:bottom, left:right] = inside
+    return pixels
@@ -0,0 +1,62 @@
+# src/renderer/utils/budget.py
+"""Plan render settings so that a camera path fits a wall-clock budget.
+
+Cycles' render time per frame grows roughly linearly with the number of
+samples and the number of pixels. After a few frames have been timed at the
+configured settings, plan_budget() scales samples down first (with denoising
+to hide the extra noise) and only then lowers the resolution percentage.
+"""
+
+import math
+from dataclasses import dataclass
+
+# Fraction of the remaining budget that is planned for; the rest absorbs
+# frame-to-frame variation
+SAFETY_MARGIN = 0.9
+
+@dataclass(frozen=True)
+class BudgetPlan:
+    """Render settings for the frames after the timed probe frames."""
+    samples: int
+    resolution_percentage: int
+    use_denoising: bool
+    time_limit: float  # Cycles per-frame time limit in seconds (0: none)
+    degraded: bool  # Quality is below the configured settings
+
+def plan_budget(
+    remaining_time: float,
+    remaining_frames: int,
+    frame_time: float,
+    samples: int,
+    use_denoising: bool,
+    min_samples: int = 4,
+    min_resolution_percentage: int = 25
+) -> BudgetPlan:
+    """Choose samples, resolution and denoising for the remaining frames.
+
+    Args:
+        remaining_time: Seconds left in the budget
+        remaining_frames: Frames still to render
+        frame_time: Measured seconds per frame at the configured settings
+        samples: Configured samples
+        use_denoising: Configured denoising
+        min_samples: Lowest sample count to plan for
+        min_resolution_percentage: Lowest resolution percentage to plan for
+
+    Returns:
+        BudgetPlan: The configured settings if they fit, else cheaper ones
+        with a per-frame Cycles time limit as a hard cap (none if the budget
+        is already spent)
+    """
+    if remaining_frames <= 0 or frame_time <= 0:
+        return BudgetPlan(samples, 100, use_denoising, 0.0, False)
+    target_time = max(remaining_time, 0.0) * SAFETY_MARGIN / remaining_frames
+    ratio = target_time / frame_time
+    if ratio >= 1.0:
+        return BudgetPlan(samples, 100, use_denoising, 0.0, False)
+
+    planned_samples = max(min(min_samples, samples), int(samples * ratio))
+    # Whatever the sample reduction cannot absorb comes out of the pixel count
+    pixel_ratio = min(1.0, ratio * samples / planned_samples)
+    percentage = max(min_resolution_percentage, int(100 * math.sqrt(pixel_ratio)))
+    return BudgetPlan(planned_samples, percentage, True, round(target_time, 3), True)
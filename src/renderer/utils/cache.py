@@ -0,0 +1,141 @@
+# src/renderer/utils/cache.py
+"""Content-addressed cache of rendered frames shared across jobs.
+
+A frame is identified by the hash of everything that determines its pixels:
+the model file contents, the canonicalized render/lighting/blend configs and
+the frame's SphericalCoordinate. On a hit the cached file is hard-linked (or
+copied, across filesystems) to the output path instead of invoking Cycles.
+
+The cache is bounded in size. When it grows past max_size_bytes, the least
+recently used entries (by modification time, refreshed on every hit) are
+evicted until it is below 90% of the limit.
+
+The same store holds other content-addressed files, e.g. prepared-scene
+snapshots, when created with a different suffix.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import asdict
+from typing import List, Optional, Tuple
+
+from renderer.utils.coordinates import SphericalCoordinate
+from renderer.utils.logger import logger
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Hard-link src to dst, copying if linking is not possible."""
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered frames in a directory.
+
+    Args:
+        cache_dir: Directory holding the cache (may be shared between jobs)
+        max_size_bytes: Size above which least recently used frames are evicted
+        suffix: File extension of the cached entries
+    """
+
+    def __init__(self, cache_dir: str, max_size_bytes: int, suffix: str = ".png"):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._size: Optional[int] = None  # Scanned on the first store
+
+    @staticmethod
+    def frame_key(config_hash: str, coord: SphericalCoordinate) -> str:
+        """Return the cache key of a frame rendered with config_hash at coord."""
+        payload = json.dumps(
+            [config_hash, {key: float(value) for key, value in asdict(coord).items()}],
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Return the cache path of a key, fanned out over 256 subdirectories."""
+        return os.path.join(self.cache_dir, key[:2], f"{key}{self.suffix}")
+
+    def _entries(self) -> List[Tuple[float, str, int]]:
+        """Return (mtime, path, size) of every cached entry."""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(self.suffix):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:  # Evicted by another job
+                        continue
+                    entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Return the path of a cached entry to read in place, or None on a miss."""
+        path = self._path(key)
+        try:
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """Place the cached frame at output_path; return False on a miss."""
+        path = self._path(key)
+        try:
+            link_or_copy(path, output_path)
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, key: str, output_path: str) -> None:
+        """Add a freshly rendered frame (or other file) to the cache."""
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+        os.close(fd)
+        try:
+            link_or_copy(output_path, tmp_path)
+            os.replace(tmp_path, path)  # Atomic for concurrent readers
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._entries())
+        else:
+            self._size += os.path.getsize(path)
+        if self._size > self.max_size_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used frames until below 90% of the size limit."""
+        entries = sorted(self._entries())
+        self._size = sum(size for _, _, size in entries)
+        target = 0.9 * self.max_size_bytes
+        removed = 0
+        for _, path, size in entries:
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._size -= size
+            removed += 1
+        logger.debug(f"Evicted {removed} entries from cache {self.cache_dir}")
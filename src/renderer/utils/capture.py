@@ -0,0 +1,95 @@
+# src/renderer/utils/capture.py
+"""Capture rendered frames as NumPy arrays instead of output files.
+
+Blender does not expose the pixels of a render to Python in background mode
+('Render Result' has no pixel buffer, and Viewer nodes are not evaluated for
+final renders in recent versions). Frames are therefore passed through an
+uncompressed image in a RAM-backed temporary directory (/dev/shm where
+available), which skips the PNG codec and the output filesystem entirely.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+import bpy
+import numpy as np
+
+def _ram_temp_dir() -> str:
+    """Return a RAM-backed directory for scratch images, if the OS has one."""
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return tempfile.gettempdir()
+
+class FrameCapture:
+    """Render the current scene into RGBA arrays of shape (height, width, 4).
+
+    Args:
+        linear: If False, return uint8 display-referred pixels, identical to the
+            PNG files render() writes. If True, return float32 scene-linear
+            pixels (before the view transform).
+    """
+
+    def __init__(self, linear: bool = False):
+        self.linear = linear
+        extension = ".exr" if linear else ".tif"
+        fd, self._path = tempfile.mkstemp(
+            prefix="pyblenderrender_", suffix=extension, dir=_ram_temp_dir()
+        )
+        os.close(fd)
+
+    @contextmanager
+    def _scratch_output(self, scene: bpy.types.Scene):
+        """Temporarily point the render output at the uncompressed scratch image."""
+        settings = scene.render.image_settings
+        saved = (
+            scene.render.filepath,
+            settings.file_format,
+            settings.color_mode,
+            settings.color_depth,
+        )
+        scene.render.filepath = self._path
+        if self.linear:
+            settings.file_format = 'OPEN_EXR'
+            settings.color_mode = 'RGBA'
+            settings.color_depth = '32'
+            settings.exr_codec = 'NONE'
+        else:
+            settings.file_format = 'TIFF'
+            settings.color_mode = 'RGBA'
+            settings.color_depth = '8'
+            settings.tiff_codec = 'NONE'
+        try:
+            yield
+        finally:
+            scene.render.filepath = saved[0]
+            settings.file_format = saved[1]
+            settings.color_mode = saved[2]
+            settings.color_depth = saved[3]
+
+    def render(self, scene: bpy.types.Scene) -> np.ndarray:
+        """Render the scene and return its pixels, top row first."""
+        with self._scratch_output(scene):
+            bpy.ops.render.render(write_still=True)
+        return self.read(self._path)
+
+    def read(self, path: str) -> np.ndarray:
+        """Load an image file written by Blender as an RGBA array."""
+        image = bpy.data.images.load(path, check_existing=False)
+        try:
+            width, height = image.size
+            pixels = np.empty(width * height * 4, dtype=np.float32)
+            image.pixels.foreach_get(pixels)
+        finally:
+            bpy.data.images.remove(image)
+        # Blender stores rows bottom-up
+        pixels = pixels.reshape(height, width, 4)[::-1]
+        if self.linear:
+            return np.ascontiguousarray(pixels)
+        return np.rint(pixels * 255).astype(np.uint8)
+
+    def close(self) -> None:
+        """Remove the scratch image."""
+        if os.path.exists(self._path):
+            os.remove(self._path)
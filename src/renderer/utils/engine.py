@@ -0,0 +1,30 @@
+# src/renderer/utils/engine.py
+"""Detect which render engines can run on this machine.
+
+EEVEE and Workbench rasterize on the GPU through OpenGL/Vulkan; in background
+mode Blender opens a headless EGL context for them. On a node without a GPU
+that context is missing or falls back to a software rasterizer, where those
+engines fail or are far slower than a few Cycles samples on the CPU.
+"""
+
+import glob
+import os
+import sys
+from functools import lru_cache
+
+# Samples used when a rasterizing engine falls back to Cycles
+FALLBACK_SAMPLES = 4
+
+@lru_cache(maxsize=None)
+def gpu_context_available() -> bool:
+    """Return whether Blender can open a hardware GPU context for rasterizing.
+
+    The check runs once per process. It does not create a context: the gpu 
+    module refuses to in background mode, so instead we look for a display 
+    server or a GPU device node that EGL can use.
+    """
+    if sys.platform != "linux":
+        return True  # Metal (macOS) and Windows drivers do not need a display server
+    if os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"):
+        return True
+    return bool(glob.glob("/dev/dri/renderD*") or glob.glob("/dev/nvidia[0-9]*"))
@@ -0,0 +1,61 @@
+# src/renderer/utils/hashing.py
+"""Stable hashes of configuration objects and files."""
+
+import hashlib
+import json
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any
+
+# Config fields that change how a render is executed, but not the images it produces
+RUNTIME_FIELDS = {
+    "workers",
+    "threads",
+    "bake_animation",
+    "path_chunk_size",
+    "verify_resume",
+    "cache_dir",
+    "cache_max_size_mb",
+    "scene_cache_dir",
+    "scene_cache_max_size_mb",
+    "encode_workers",
+    "output_format",
+    "shard_size_mb",
+}
+
+def canonicalize(value: Any) -> Any:
+    """Convert configs into plain JSON-serializable values with a stable layout.
+
+    Dataclasses become dicts of their fields (minus RUNTIME_FIELDS), enums their
+    values and tuples lists. Numbers become floats, so 1 and 1.0 hash the same.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: canonicalize(getattr(value, f.name))
+            for f in fields(value)
+            if f.name not in RUNTIME_FIELDS
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): canonicalize(v) for k, v in value.items()}
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    return str(value)
+
+def config_hash(*configs: Any) -> str:
+    """Return a SHA-256 hex digest of the canonicalized configs."""
+    payload = json.dumps(canonicalize(list(configs)), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def file_checksum(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
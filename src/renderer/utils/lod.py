@@ -0,0 +1,68 @@
+# src/renderer/utils/lod.py
+"""Pick decimation ratios from the model's size on screen.
+
+At the closest a camera on the path gets to the model (the path radius minus
+the model's bounding radius), one world unit covers pixels_per_unit() pixels.
+Triangle edges shorter than the visual-error bound in pixels cannot change
+the image much, so a mesh only needs about as many triangles as tile its
+surface with equilateral triangles of that edge length. Collapse decimation
+down to that count removes sub-pixel detail that Cycles would otherwise build
+into its BVH for every render.
+"""
+
+import math
+
+import numpy as np
+
+# Meshes are kept at full detail unless decimation removes at least this much
+MAX_LOD_RATIO = 0.9
+
+# Fewest triangles a mesh is decimated to
+MIN_LOD_TRIANGLES = 64
+
+def pixels_per_unit(distance: float, fov: float, resolution: int) -> float:
+    """Return the pixels covered by one world unit at a distance from the camera.
+
+    Args:
+        distance: Distance from the camera in world units
+        fov: Field of view along the larger frame dimension, in radians
+        resolution: Pixels along the larger frame dimension
+
+    Returns:
+        Pixels per world unit, or inf if the distance is not positive
+    """
+    if distance <= 0:
+        return math.inf
+    return resolution / (2.0 * distance * math.tan(fov / 2.0))
+
+def surface_area(vertices: np.ndarray, triangles: np.ndarray) -> float:
+    """Return the total area of the (M, 3) triangles indexing (N, 3) vertices."""
+    corners = vertices[triangles]
+    cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    return float(0.5 * np.linalg.norm(cross, axis=1).sum())
+
+def lod_ratio(
+    triangles: int,
+    area: float,
+    pixels_per_unit: float,
+    max_error_px: float
+) -> float:
+    """Return the fraction of a mesh's triangles to keep (1.0: leave it alone).
+
+    Args:
+        triangles: Current triangle count
+        area: World-space surface area
+        pixels_per_unit: Pixels per world unit at the closest camera
+        max_error_px: Largest projected edge length in pixels that may be
+            collapsed away
+    """
+    if triangles <= MIN_LOD_TRIANGLES or not math.isfinite(pixels_per_unit):
+        return 1.0
+    edge = max_error_px / pixels_per_unit
+    target = max(MIN_LOD_TRIANGLES, area / (math.sqrt(3.0) / 4.0 * edge * edge))
+    ratio = target / triangles
+    return ratio if ratio <= MAX_LOD_RATIO else 1.0
+
+def bvh_build_cost(triangles: int) -> float:
+    """Return the relative cost of building a BVH over triangles (n log n)."""
+    return triangles * math.log2(triangles) if triangles > 1 else 0.0
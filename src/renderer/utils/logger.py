@@ -2,10 +2,15 @@
 import logging
 
 def setup_logger():
-    logging.basicConfig(
-        level=logging.DEBUG, # Change to INFO or WARNING as needed
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    )
-    return logging.getLogger("PyBlenderRender")
+    """Return the package logger, with only a NullHandler attached.
+
+    Level, handlers and formatting are left to the application (e.g.
+    logging.basicConfig()); messages propagate to its root handlers, and
+    nothing is printed if it configures none.
+    """
+    logger = logging.getLogger("PyBlenderRender")
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    return logger
 
 logger = setup_logger()
@@ -0,0 +1,333 @@
+# src/renderer/utils/manifest.py
+"""On-disk record of the frames a render has completed.
+
+The manifest lives in the output directory and lists, for each finished frame,
+the config hash, camera coordinate, output file, file size and checksum. It is
+what makes resumable renders possible: a frame whose entry matches the current
+config and coordinate, and whose file is still intact, does not need to be
+rendered again.
+
+The manifest is a JSON lines journal: a version header, then one entry per
+line. Flushes append the entries recorded since the last flush, so writing
+stays proportional to the new frames however long the path is, and a later
+line for the same file replaces an earlier one. The journal is rewritten with
+one line per frame (compacted) when superseded lines pile up and when shard
+manifests are consolidated. A line cut short by a crash is ignored.
+
+Frames that repeat another frame by symmetry are first recorded as pending
+aliases (alias_of names the frame they copy) and get their size and checksum
+once the copy is written.
+"""
+
+import glob
+import json
+import math
+import os
+import tempfile
+import time
+from dataclasses import astuple
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from renderer.utils.coordinates import SphericalCoordinate
+from renderer.utils.hashing import file_checksum
+from renderer.utils.logger import logger
+
+MANIFEST_FILENAME = "manifest.jsonl"
+SHARD_MANIFEST_PATTERN = "manifest.shard-*.jsonl"
+MANIFEST_VERSION = 2
+
+# Single-file manifest of earlier versions, read on resume and replaced by the journal
+LEGACY_MANIFEST_FILENAME = "manifest.json"
+LEGACY_MANIFEST_VERSION = 1
+
+# A journal is compacted once it has this many times more lines than entries...
+COMPACTION_RATIO = 2
+# ...and at least this many lines
+MIN_COMPACTION_LINES = 10000
+
+def _write_atomic(path: str, suffix: str, write: Callable) -> None:
+    """Call write(file) on a temp file in the same directory, then rename it over path."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=suffix, dir=directory)
+    try:
+        with os.fdopen(fd, "w") as file:
+            write(file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_json_atomic(path: str, data: dict) -> None:
+    """Write JSON to a temp file in the same directory, then rename it over path.
+
+    The rename is atomic, so readers (and a resumed render after a crash) see
+    either the previous or the new file, never a partially written one.
+    """
+    _write_atomic(path, ".json", lambda file: json.dump(data, file, indent=1))
+
+def _dump_line(data: dict) -> str:
+    """Return data as one line of JSON."""
+    return json.dumps(data, separators=(",", ":")) + "\n"
+
+class _Entry(NamedTuple):
+    """In-memory form of a manifest entry of the current config."""
+    index: int
+    coordinate: Tuple[float, float, float, float]  # radius, azimuth, elevation, roll
+    size: Optional[int]
+    checksum: Optional[bytes]
+    extra: Optional[dict]  # e.g. alias_of and mirrored
+
+class RenderManifest:
+    """Frame manifest of one output directory.
+
+    Entries are keyed by output filename. Records are buffered and appended
+    to the journal at most every flush_interval seconds, and on flush().
+
+    Only entries of the current config hash are kept in memory, in a compact
+    form (a few hundred bytes per frame); entries of other configs cannot be
+    complete and are dropped when the journal is compacted.
+
+    Worker processes of a sharded render each write their own shard manifest,
+    so that they never race on one file. Loading a manifest merges the shard
+    manifests found next to it, and consolidate() folds them back into the
+    main manifest once all workers are done.
+
+    Args:
+        output_dir: Directory holding the frames and the manifest
+        config_hash: Hash of everything except the camera pose that affects a frame
+        flush_interval: Minimum number of seconds between automatic writes
+        shard: Index of the worker shard writing this manifest, if any
+        verify_checksums: Count a frame as complete only if its checksum
+            matches, rather than only its size. Reads every frame checked.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        config_hash: str,
+        flush_interval: float = 5.0,
+        shard: Optional[int] = None,
+        verify_checksums: bool = False
+    ):
+        self.output_dir = output_dir
+        self.config_hash = config_hash
+        self.flush_interval = flush_interval
+        self.verify_checksums = verify_checksums
+        self._shard = shard
+        filename = MANIFEST_FILENAME if shard is None else f"manifest.shard-{shard}.jsonl"
+        self.path = os.path.join(output_dir, filename)
+        self._legacy_path = os.path.join(output_dir, LEGACY_MANIFEST_FILENAME)
+        self._entries: Dict[str, _Entry] = {}
+        self._unsaved: Dict[str, None] = {}  # Filenames recorded since the last flush
+        self._journal_lines = 0  # Entry lines in this manifest's own journal
+        # The journal must be compacted before appending (the main manifest
+        # also replaces a legacy manifest that way)
+        self._rewrite = shard is None and os.path.exists(self._legacy_path)
+        self._load_legacy()
+        for path in [os.path.join(output_dir, MANIFEST_FILENAME), *self._shard_paths()]:
+            self._load(path)
+        self._last_flush = time.time()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, filename: str) -> bool:
+        return filename in self._entries
+
+    def _shard_paths(self) -> List[str]:
+        """Return the paths of shard manifests in the output directory."""
+        return sorted(glob.glob(os.path.join(self.output_dir, SHARD_MANIFEST_PATTERN)))
+
+    def _add(self, entry: dict) -> None:
+        """Keep an entry read from disk if it belongs to the current config."""
+        if entry["config_hash"] != self.config_hash:
+            self._entries.pop(entry["path"], None)  # The file was rendered again since
+            return
+        extra = {
+            key: value for key, value in entry.items()
+            if key not in {"index", "coordinate", "path", "size", "checksum", "config_hash"}
+        }
+        checksum = entry["checksum"]
+        self._entries[entry["path"]] = _Entry(
+            entry["index"],
+            tuple(float(entry["coordinate"][key]) for key in ("radius", "azimuth", "elevation", "roll")),
+            entry["size"],
+            None if checksum is None else bytes.fromhex(checksum),
+            extra or None,
+        )
+
+    def _load_legacy(self) -> None:
+        """Read entries from a single-file manifest written by earlier versions."""
+        if not os.path.exists(self._legacy_path):
+            return
+        try:
+            with open(self._legacy_path) as file:
+                data = json.load(file)
+            if data.get("version") != LEGACY_MANIFEST_VERSION:
+                raise ValueError(f"unsupported manifest version {data.get('version')}")
+            for filename, entry in data["frames"].items():
+                self._add({**entry, "path": filename})
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self._legacy_path}: {str(e)}")
+
+    def _load(self, path: str) -> None:
+        """Read entries from one journal, ignoring it if it is unreadable.
+
+        A last line without a newline was cut short by a crash and is skipped.
+        """
+        if not os.path.exists(path):
+            return
+        own = path == self.path
+        try:
+            with open(path) as file:
+                lines = file.readlines()
+            if not lines:
+                return
+            header = json.loads(lines[0])
+            if header.get("version") != MANIFEST_VERSION:
+                raise ValueError(f"unsupported manifest version {header.get('version')}")
+            if not lines[-1].endswith("\n"):
+                logger.warning(f"Ignoring the incomplete last line of manifest {path}")
+                lines.pop()
+                self._rewrite = self._rewrite or own
+            for line in lines[1:]:
+                self._add(json.loads(line))
+            if own:
+                self._journal_lines = len(lines) - 1
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable manifest {path}: {str(e)}")
+            self._rewrite = self._rewrite or own
+
+    def entry(self, filename: str) -> Optional[dict]:
+        """Return the entry of a frame as stored in the manifest, if any."""
+        entry = self._entries.get(filename)
+        if entry is None:
+            return None
+        return {
+            "index": entry.index,
+            "coordinate": dict(zip(("radius", "azimuth", "elevation", "roll"), entry.coordinate)),
+            "path": filename,
+            "size": entry.size,
+            "checksum": None if entry.checksum is None else entry.checksum.hex(),
+            "config_hash": self.config_hash,
+            **(entry.extra or {}),
+        }
+
+    def is_complete(self, filename: str, coord: SphericalCoordinate) -> bool:
+        """Whether a frame was rendered with this config and pose and is intact on disk.
+
+        A frame is intact if its size matches the manifest, and with
+        verify_checksums also its checksum; a size check alone misses a frame
+        corrupted in place without changing its length.
+        """
+        entry = self._entries.get(filename)
+        if entry is None or entry.size is None:
+            return False
+        if not all(
+            math.isclose(recorded, float(value), abs_tol=1e-6)
+            for recorded, value in zip(entry.coordinate, astuple(coord))
+        ):
+            return False
+        path = os.path.join(self.output_dir, filename)
+        if not (os.path.isfile(path) and os.path.getsize(path) == entry.size):
+            return False
+        return not self.verify_checksums or bytes.fromhex(file_checksum(path)) == entry.checksum
+
+    def _store(self, filename: str, entry: _Entry) -> None:
+        """Keep an entry and mark it for the next flush."""
+        self._entries[filename] = entry
+        self._unsaved[filename] = None
+
+    def record(self, index: int, coord: SphericalCoordinate, filename: str, **extra) -> None:
+        """Add an entry for a frame whose file was just written.
+
+        Extra keyword arguments (e.g. alias_of) are stored in the entry.
+        """
+        path = os.path.join(self.output_dir, filename)
+        self._store(filename, _Entry(
+            index,
+            tuple(float(value) for value in astuple(coord)),
+            os.path.getsize(path),
+            bytes.fromhex(file_checksum(path)),
+            extra or None,
+        ))
+        if time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def record_alias(
+        self,
+        index: int,
+        coord: SphericalCoordinate,
+        filename: str,
+        alias_of: str,
+        mirrored: bool
+    ) -> None:
+        """Add a pending entry for a frame to be written as a copy of another.
+
+        The entry has no size until the copy is written and recorded, so it
+        never counts as complete before that.
+        """
+        self._store(filename, _Entry(
+            index,
+            tuple(float(value) for value in astuple(coord)),
+            None,
+            None,
+            {"alias_of": alias_of, "mirrored": mirrored},
+        ))
+
+    def pending_aliases(self) -> List[Tuple[str, dict]]:
+        """Return (filename, entry) of the aliases not written yet."""
+        return [
+            (filename, self.entry(filename)) for filename, entry in self._entries.items()
+            if entry.extra and entry.extra.get("alias_of") and entry.size is None
+        ]
+
+    def _lines(self, filenames: Iterable[str]) -> List[str]:
+        """Return the journal lines of the given entries."""
+        return [_dump_line(self.entry(filename)) for filename in filenames]
+
+    def flush(self, force: bool = False) -> None:
+        """Append the unsaved entries to the journal, compacting it if needed.
+
+        With force, the journal is compacted even if nothing is unsaved.
+        """
+        compact = force or self._rewrite or self._journal_lines + len(self._unsaved) > max(
+            MIN_COMPACTION_LINES, COMPACTION_RATIO * len(self._entries)
+        )
+        if compact:
+            self._compact()
+        elif self._unsaved:
+            with open(self.path, "a") as file:
+                if self._journal_lines == 0 and file.tell() == 0:
+                    file.write(_dump_line({"version": MANIFEST_VERSION}))
+                file.writelines(self._lines(self._unsaved))
+                file.flush()
+                os.fsync(file.fileno())
+            self._journal_lines += len(self._unsaved)
+        self._unsaved = {}
+        self._last_flush = time.time()
+
+    def _compact(self) -> None:
+        """Atomically rewrite the journal with one line per entry, in frame order."""
+        filenames = sorted(self._entries, key=lambda filename: self._entries[filename].index)
+
+        def write(file) -> None:
+            file.write(_dump_line({"version": MANIFEST_VERSION}))
+            file.writelines(self._lines(filenames))
+
+        _write_atomic(self.path, ".jsonl", write)
+        self._journal_lines = len(filenames)
+        self._rewrite = False
+        if self._shard is None and os.path.exists(self._legacy_path):
+            os.remove(self._legacy_path)
+
+    def consolidate(self) -> None:
+        """Write all known entries to the main manifest and remove shard manifests."""
+        shard_paths = [path for path in self._shard_paths() if path != self.path]
+        if shard_paths or self._unsaved or self._rewrite:
+            self.flush(force=True)
+        for path in shard_paths:
+            os.remove(path)
@@ -0,0 +1,219 @@
+# src/renderer/utils/passes.py
+"""Write extra render passes (AOVs) next to each beauty frame.
+
+The passes are routed from the Render Layers node to a compositor File Output
+node, so the same render call that produces the beauty image writes them too.
+Blender 5.0 moved the compositor to a node group (scene.compositing_node_group)
+and reworked the File Output node (directory/file_name/file_output_items);
+Blender 4.x uses scene.node_tree and base_path/file_slots. Both are handled.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+import bpy
+
+from renderer.config.render_config import RenderPass
+
+# Render Layers output socket of each pass (4.x names the object index 'IndexOB')
+PASS_SOCKETS = {
+    RenderPass.DEPTH: ("Depth",),
+    RenderPass.NORMAL: ("Normal",),
+    RenderPass.OBJECT_INDEX: ("Object Index", "IndexOB"),
+    RenderPass.ALPHA: ("Alpha",),
+}
+
+# Largest object index that survives a 16-bit PNG exactly
+MAX_PNG_INDEX = 65535
+
+def _new_node(tree: bpy.types.NodeTree, *idnames: str) -> bpy.types.Node:
+    """Create the first of several node types that exists in this Blender version."""
+    for idname in idnames:
+        try:
+            return tree.nodes.new(idname)
+        except RuntimeError:
+            continue
+    raise RuntimeError(f"None of the compositor nodes {idnames} are available")
+
+def _compositor_tree(scene: bpy.types.Scene) -> bpy.types.NodeTree:
+    """Return the scene's compositor node tree, creating a pass-through one if needed."""
+    if hasattr(scene, "compositing_node_group"):  # Blender 5.0+
+        if scene.compositing_node_group is None:
+            tree = bpy.data.node_groups.new("Compositing", 'CompositorNodeTree')
+            tree.interface.new_socket("Image", in_out='OUTPUT', socket_type='NodeSocketColor')
+            render_layers = tree.nodes.new('CompositorNodeRLayers')
+            group_output = tree.nodes.new('NodeGroupOutput')
+            tree.links.new(render_layers.outputs["Image"], group_output.inputs[0])
+            scene.compositing_node_group = tree
+        return scene.compositing_node_group
+    scene.use_nodes = True  # Creates Render Layers -> Composite on first use
+    return scene.node_tree
+
+def assign_pass_indices(scene: bpy.types.Scene) -> None:
+    """Give every mesh without an object index a unique one, for OBJECT_INDEX masks."""
+    used = {obj.pass_index for obj in scene.objects}
+    next_index = max(used, default=0) + 1
+    for obj in sorted(scene.objects, key=lambda o: o.name):
+        if obj.type == 'MESH' and obj.pass_index == 0:
+            obj.pass_index = next_index
+            next_index += 1
+
+class PassOutput:
+    """Compositor File Output node writing the requested passes of every render.
+
+    EXR files hold raw float values. 16-bit PNGs cannot, so their values are
+    remapped into [0, 1]: depth is divided by the camera's clip_end, normals
+    become n * 0.5 + 0.5 and object indices are divided by 65535.
+
+    Args:
+        scene: Scene whose view layer and compositor are configured
+        passes: Passes to write
+        file_format: "EXR" (32-bit float) or "PNG" (16-bit)
+    """
+
+    def __init__(self, scene: bpy.types.Scene, passes: List[RenderPass], file_format: str):
+        self.scene = scene
+        self.passes = list(dict.fromkeys(passes))
+        self.extension = ".exr" if file_format == "EXR" else ".png"
+        self._file_format = file_format
+        self._nodes: List[bpy.types.Node] = []
+        self._depth_scale: Optional[bpy.types.Node] = None
+
+        view_layer = scene.view_layers[0]
+        view_layer.use_pass_z |= RenderPass.DEPTH in self.passes
+        view_layer.use_pass_normal |= RenderPass.NORMAL in self.passes
+        view_layer.use_pass_object_index |= RenderPass.OBJECT_INDEX in self.passes
+
+        self.tree = _compositor_tree(scene)
+        render_layers = next(
+            (node for node in self.tree.nodes if node.type == 'R_LAYERS'), None
+        ) or self._add('CompositorNodeRLayers')
+        self.node = self._add('CompositorNodeOutputFile')
+        self._configure_format(self.node.format, color_mode='RGB')
+        if hasattr(self.node, "file_output_items"):  # Blender 5.0+
+            self._items = self.node.file_output_items
+        else:
+            self._items = self.node.file_slots
+            self._items.clear()
+
+        for render_pass in self.passes:
+            socket = next(
+                render_layers.outputs[name] for name in PASS_SOCKETS[render_pass]
+                if name in render_layers.outputs
+            )
+            scalar = render_pass != RenderPass.NORMAL
+            item_input = self._add_item(render_pass.value, scalar)
+            self.tree.links.new(self._remap(render_pass, socket), item_input)
+
+    def _add(self, *idnames: str) -> bpy.types.Node:
+        """Add a node to the compositor and remember it for remove()."""
+        node = _new_node(self.tree, *idnames)
+        self._nodes.append(node)
+        return node
+
+    def _configure_format(self, settings: bpy.types.ImageFormatSettings, color_mode: str) -> None:
+        """Apply the pass file format to node or per-item image settings."""
+        if hasattr(settings, "media_type"):  # Blender 5.0+
+            settings.media_type = 'IMAGE'
+        if self._file_format == "EXR":
+            settings.file_format = 'OPEN_EXR'
+            settings.color_depth = '32'
+            settings.exr_codec = 'ZIP'
+        else:
+            settings.file_format = 'PNG'
+            settings.color_depth = '16'
+        settings.color_mode = color_mode
+
+    def _add_item(self, name: str, scalar: bool) -> bpy.types.NodeSocket:
+        """Add a File Output input for one pass, stored without a view transform."""
+        if hasattr(self.node, "file_output_items"):  # Blender 5.0+
+            item = self._items.new('FLOAT' if scalar else 'VECTOR', name)
+            item.override_node_format = scalar
+            item_input = self.node.inputs[name]
+        else:
+            self._items.new(name)
+            item = self._items[-1]
+            item.use_node_format = not scalar
+            item_input = self.node.inputs[-1]
+        item.save_as_render = False
+        if scalar:
+            self._configure_format(item.format, color_mode='BW')
+        return item_input
+
+    def _math(self, operation: str, value: float, addend: Optional[float] = None) -> bpy.types.Node:
+        """Add a scalar Math node computing x op value (+ addend)."""
+        node = self._add('ShaderNodeMath', 'CompositorNodeMath')
+        node.operation = operation
+        node.inputs[1].default_value = value
+        if addend is not None:
+            node.inputs[2].default_value = addend
+        return node
+
+    def _remap(self, render_pass: RenderPass, socket: bpy.types.NodeSocket) -> bpy.types.NodeSocket:
+        """Return socket, remapped into [0, 1] if the passes are stored as PNG."""
+        if self._file_format == "EXR" or render_pass == RenderPass.ALPHA:
+            return socket
+        links = self.tree.links
+        if render_pass == RenderPass.DEPTH:
+            self._depth_scale = self._math('DIVIDE', 100.0)  # Updated in point_at()
+            links.new(socket, self._depth_scale.inputs[0])
+            return self._depth_scale.outputs[0]
+        if render_pass == RenderPass.OBJECT_INDEX:
+            node = self._math('DIVIDE', MAX_PNG_INDEX)
+            links.new(socket, node.inputs[0])
+            return node.outputs[0]
+        separate = self._add('ShaderNodeSeparateXYZ', 'CompositorNodeSeparateXYZ')
+        combine = self._add('ShaderNodeCombineXYZ', 'CompositorNodeCombineXYZ')
+        links.new(socket, separate.inputs[0])
+        for axis in range(3):
+            node = self._math('MULTIPLY_ADD', 0.5, 0.5)
+            links.new(separate.outputs[axis], node.inputs[0])
+            links.new(node.outputs[0], combine.inputs[axis])
+        return combine.outputs[0]
+
+    def point_at(self, directory: str, prefix: str) -> None:
+        """Write the passes of the next render to directory as <prefix>_<pass>."""
+        if hasattr(self.node, "file_output_items"):  # Blender 5.0+
+            self.node.directory = directory
+            self.node.file_name = f"{prefix}_"
+        else:
+            self.node.base_path = directory
+            for slot, render_pass in zip(self._items, self.passes):
+                slot.path = f"{prefix}_{render_pass.value}"
+        if self._depth_scale is not None and self.scene.camera is not None:
+            self._depth_scale.inputs[1].default_value = self.scene.camera.data.clip_end
+
+    def collect(
+        self,
+        directory: str,
+        prefix: str,
+        stem: str,
+        frame: Optional[int] = None
+    ) -> Dict[str, str]:
+        """Rename the pass files of a render to <stem>_<pass><ext> and return them.
+
+        Blender appends the frame number to File Output names in animations
+        (and in all renders before 5.0); frame defaults to the current frame.
+        """
+        if frame is None:
+            frame = self.scene.frame_current
+        paths = {}
+        for render_pass in self.passes:
+            name = f"{prefix}_{render_pass.value}"
+            output_path = os.path.join(directory, f"{stem}_{render_pass.value}{self.extension}")
+            for candidate in (f"{name}{frame:04d}{self.extension}", f"{name}{self.extension}"):
+                path = os.path.join(directory, candidate)
+                if os.path.exists(path):
+                    if path != output_path:
+                        os.replace(path, output_path)
+                    paths[render_pass.value] = output_path
+                    break
+            else:
+                raise RuntimeError(f"Render pass '{render_pass.value}' was not written")
+        return paths
+
+    def remove(self) -> None:
+        """Remove the nodes added for the passes from the compositor."""
+        for node in self._nodes:
+            self.tree.nodes.remove(node)
+        self._nodes = []
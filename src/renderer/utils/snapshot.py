@@ -0,0 +1,75 @@
+# src/renderer/utils/snapshot.py
+"""Prepared-scene snapshots: imported and normalized models saved as .blend files.
+
+Importing a glTF/COLLADA/USD file and centering its origins can take longer
+than rendering a handful of frames. After the first import, the model's
+objects (and, through them, their meshes, materials and images) are written
+to a small compressed .blend file with bpy.data.libraries.write(). Later runs
+append them with bpy.data.libraries.load() instead of running the importer.
+
+A text datablock stored with the objects records their order in the scene
+(camera tracking targets the first mesh) and the original import time.
+"""
+
+import json
+import time
+from typing import List, Tuple
+
+import bpy
+
+from renderer.utils.hashing import config_hash
+
+# Bump when the preparation done by ModelRenderer._import_model() changes
+SNAPSHOT_VERSION = 1
+
+METADATA_TEXT = "PyBlenderRender"
+
+def snapshot_key(model_checksum: str) -> str:
+    """Return the cache key of a model's snapshot.
+
+    Snapshots are only valid for the Blender version that wrote them.
+    """
+    return config_hash("scene-snapshot", SNAPSHOT_VERSION, bpy.app.version_string, model_checksum)
+
+def write_snapshot(path: str, objects: List[bpy.types.Object], import_time: float) -> None:
+    """Write the objects and everything they use to a .blend file.
+
+    Args:
+        path: Output .blend path
+        objects: Prepared model objects, in scene order
+        import_time: Seconds the import and preparation took
+    """
+    text = bpy.data.texts.new(METADATA_TEXT)
+    try:
+        text.write(json.dumps({
+            "objects": [obj.name for obj in objects],
+            "import_time": import_time,
+        }))
+        bpy.data.libraries.write(
+            path, {*objects, text}, path_remap='ABSOLUTE', compress=True
+        )
+    finally:
+        bpy.data.texts.remove(text)
+
+def load_snapshot(path: str, scene: bpy.types.Scene) -> Tuple[List[bpy.types.Object], dict]:
+    """Append a snapshot's objects to the scene's master collection.
+
+    Returns:
+        The appended objects in their original scene order, and the metadata
+        stored with them
+    """
+    start_time = time.time()
+    with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+        data_to.objects = list(data_from.objects)
+        data_to.texts = [METADATA_TEXT]
+    text = data_to.texts[0]
+    metadata = json.loads(text.as_string())
+    bpy.data.texts.remove(text)
+
+    # Appended datablocks keep their names unless they clash with existing ones
+    by_name = dict(zip(data_from.objects, data_to.objects))
+    objects = [by_name[name] for name in metadata["objects"]]
+    for obj in objects:
+        scene.collection.objects.link(obj)
+    metadata["load_time"] = time.time() - start_time
+    return objects, metadata
@@ -0,0 +1,366 @@
+# src/renderer/utils/symmetry.py
+"""Skip views that repeat another view of a symmetric model.
+
+Camera paths orbit the world Z axis. If a model maps onto itself when turned
+by 360/n degrees about that axis (C_n), or when reflected through a vertical
+plane, views that differ by such a turn show the same image, and views that
+differ by such a reflection show it mirrored left to right (with the roll
+negated). Only the views of one fundamental domain of azimuths are then
+rendered; every other view is written as an alias, a copy (or mirrored copy)
+of the frame it repeats.
+
+Symmetry is tested on the model's world-space vertices, labelled by material.
+Textures are not compared, so models whose textures break the symmetry (e.g.
+a label on a bottle) should not be rendered with aliasing. The lights must
+map onto themselves as well: lighting_symmetry() keeps only the part of the
+model's symmetry that the lighting shares.
+"""
+
+import math
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import bpy
+import numpy as np
+
+from renderer.camera.dedup import ViewIndex
+from renderer.camera.path import CameraPath
+from renderer.output import encode_png, write_file_atomic
+from renderer.utils.cache import link_or_copy
+from renderer.utils.capture import FrameCapture
+from renderer.utils.coordinates import SphericalCoordinate
+from renderer.utils.logger import logger
+from renderer.utils.manifest import RenderManifest
+
+# Highest rotation order tested; rounder models are treated as C_24
+MAX_ROTATION_ORDER = 24
+
+# Vertices sampled for the symmetry tests
+MAX_POINTS = 20000
+
+# Fraction of the vertices that must map onto another vertex
+MIN_MATCH_FRACTION = 0.99
+
+# Mirror planes tested, taken from the vertices farthest from the axis
+MAX_MIRROR_CANDIDATES = 64
+
+# Camera azimuths at which the lights are compared
+PROBE_AZIMUTHS = (0.0, 37.0, 123.0)
+
+# Angle in degrees below which two canonical views are the same view
+VIEW_TOLERANCE = 1e-3
+
+# World shader nodes that light the model unevenly from different directions
+DIRECTIONAL_WORLD_NODES = {'TEX_ENVIRONMENT', 'TEX_SKY'}
+
+@dataclass(frozen=True)
+class Symmetry:
+    """Symmetry about the world Z axis.
+
+    Attributes:
+        rotation_order: n of the C_n rotation symmetry (1: none)
+        mirror_azimuth: Azimuth in degrees of a vertical mirror plane, if any
+    """
+    rotation_order: int = 1
+    mirror_azimuth: Optional[float] = None
+
+    @property
+    def trivial(self) -> bool:
+        """Whether every view is distinct."""
+        return self.rotation_order == 1 and self.mirror_azimuth is None
+
+    def canonical(self, path: CameraPath) -> Tuple[CameraPath, np.ndarray]:
+        """Map views into the fundamental domain of azimuths.
+
+        Returns:
+            The equivalent views in the domain, and a mask of the views that
+            are mirror images of their equivalent (roll negated, image flipped)
+        """
+        wedge = 360.0 / self.rotation_order
+        base = self.mirror_azimuth or 0.0
+        azimuth = np.mod(path.azimuth - base, wedge)
+        mirrored = np.zeros(len(path), dtype=bool)
+        if self.mirror_azimuth is not None:
+            mirrored = azimuth > wedge / 2
+            azimuth = np.where(mirrored, wedge - azimuth, azimuth)
+        roll = np.where(mirrored, -path.roll, path.roll)
+        return CameraPath(path.radius, base + azimuth, path.elevation, roll), mirrored
+
+def rotate_azimuth(points: np.ndarray, degrees: float) -> np.ndarray:
+    """Turn (N, 3) points about the Z axis, increasing their azimuth."""
+    angle = math.radians(degrees)
+    cos, sin = math.cos(angle), math.sin(angle)
+    x, y, z = points.T
+    return np.stack([x * cos + y * sin, y * cos - x * sin, z], axis=1)
+
+def reflect_azimuth(points: np.ndarray, azimuth: float) -> np.ndarray:
+    """Reflect (N, 3) points through the vertical plane at an azimuth."""
+    angle = math.radians(azimuth)
+    normal = np.array([math.cos(angle), -math.sin(angle), 0.0])
+    return points - 2 * np.outer(points @ normal, normal)
+
+def _cell_keys(cells: np.ndarray, labels: np.ndarray, low: np.ndarray, shape: np.ndarray) -> np.ndarray:
+    """Pack (N, 3) grid cells and labels into one integer per point (-1: off the grid)."""
+    cells = cells - low
+    inside = np.all((cells >= 0) & (cells < shape), axis=1)
+    keys = ((cells[:, 0] * shape[1] + cells[:, 1]) * shape[2] + cells[:, 2]) * (labels.max() + 1) + labels
+    return np.where(inside, keys, -1)
+
+def match_fraction(
+    points: np.ndarray,
+    transformed: np.ndarray,
+    tolerance: float,
+    labels: Optional[np.ndarray] = None
+) -> float:
+    """Return the fraction of transformed points lying next to a point of the
+    same label.
+
+    Points are hashed into a grid of cells tolerance wide; a transformed point
+    matches if a point shares its cell or a neighbouring one (so within one to
+    3.5 tolerances).
+    """
+    if not len(points):
+        return 1.0
+    labels = np.zeros(len(points), dtype=np.int64) if labels is None else labels
+    cells = np.floor(points / tolerance).astype(np.int64)
+    low = cells.min(axis=0) - 1
+    shape = cells.max(axis=0) - low + 2
+    keys = np.unique(_cell_keys(cells, labels, low, shape))
+    moved = np.floor(transformed / tolerance).astype(np.int64)
+    matched = np.zeros(len(points), dtype=bool)
+    for offset in np.array(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1])).reshape(3, -1).T:
+        candidates = _cell_keys(moved + offset, labels, low, shape)
+        matched |= (candidates >= 0) & np.isin(candidates, keys)
+    return float(matched.mean())
+
+def detect_symmetry(
+    points: np.ndarray,
+    tolerance: float,
+    labels: Optional[np.ndarray] = None,
+    max_order: int = MAX_ROTATION_ORDER
+) -> Symmetry:
+    """Find the rotation and mirror symmetry of a point cloud about the Z axis.
+
+    Args:
+        points: (N, 3) points, e.g. a model's vertices
+        tolerance: Distance within which points match, as a fraction of the
+            largest distance of a point from the origin
+        labels: Integer label of each point; points only match points of the
+            same label
+        max_order: Highest rotation order tested
+
+    Returns:
+        Symmetry: The highest order n <= max_order for which turns by 360/n
+            degrees map the points onto themselves, and a mirror plane, if any
+    """
+    if len(points) > MAX_POINTS:
+        chosen = np.random.default_rng(0).choice(len(points), MAX_POINTS, replace=False)
+        points = points[chosen]
+        labels = None if labels is None else labels[chosen]
+    radius = np.linalg.norm(points, axis=1).max() if len(points) else 0.0
+    if radius == 0:
+        return Symmetry()
+    tolerance *= radius
+
+    def symmetric(transformed: np.ndarray) -> bool:
+        return match_fraction(points, transformed, tolerance, labels) >= MIN_MATCH_FRACTION
+
+    order = next(
+        (n for n in range(max_order, 1, -1) if symmetric(rotate_azimuth(points, 360.0 / n))), 1
+    )
+
+    # A mirror plane bisects the farthest point from the axis and its image,
+    # which is also among the farthest points
+    horizontal = np.hypot(points[:, 0], points[:, 1])
+    farthest = horizontal >= horizontal.max() - tolerance
+    azimuths = np.degrees(np.arctan2(points[farthest, 0], points[farthest, 1]))
+    first = np.degrees(np.arctan2(*points[np.argmax(horizontal), :2]))
+    # Mirror planes of a C_n symmetric model repeat every 180/n degrees
+    candidates = np.unique(np.round(np.mod((first + azimuths) / 2, 180.0 / order), 6))
+    for azimuth in candidates[:MAX_MIRROR_CANDIDATES]:
+        if symmetric(reflect_azimuth(points, azimuth)):
+            return Symmetry(order, float(azimuth))
+    return Symmetry(order)
+
+def _same_poses(first: np.ndarray, second: np.ndarray, tolerance: float) -> bool:
+    """Whether two (N, 6) sets of light locations and directions match in any order."""
+    if len(first) != len(second):
+        return False
+    if not len(first):
+        return True
+    distances = np.abs(first[:, None, :] - second[None, :, :]).max(axis=2)
+    return bool(np.all(distances.min(axis=1) <= tolerance))
+
+def _transform_poses(poses: np.ndarray, transform: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+    """Apply a linear transform to the locations and directions of (N, 6) poses."""
+    return transform(poses.reshape(-1, 3)).reshape(-1, 6)
+
+def lighting_symmetry(
+    symmetry: Symmetry,
+    light_poses: Callable[[float], np.ndarray],
+    tolerance: float = 1e-4
+) -> Symmetry:
+    """Return the part of a model's symmetry that the lighting shares.
+
+    Turning every view by 360/n degrees only repeats the images if the lights
+    for a view at azimuth a + 360/n, turned back by 360/n, are the lights for
+    the view at a; likewise for reflections. Lights that follow the camera
+    are handled by comparing them at several camera azimuths.
+
+    Args:
+        symmetry: Symmetry of the model
+        light_poses: Returns the (N, 6) world-space locations and unit
+            directions of the lights for a camera azimuth in degrees
+        tolerance: Largest difference between matching poses, relative to
+            the largest pose coordinate
+
+    Returns:
+        Symmetry: The highest divisor of the model's rotation order and a
+            mirror plane of the model that the lights share
+    """
+    scale = max(1.0, max(np.abs(light_poses(a)).max(initial=0.0) for a in PROBE_AZIMUTHS))
+
+    def preserved(other_azimuth: Callable[[float], float], transform: Callable) -> bool:
+        return all(
+            _same_poses(
+                light_poses(a),
+                _transform_poses(light_poses(other_azimuth(a)), transform),
+                tolerance * scale
+            )
+            for a in PROBE_AZIMUTHS
+        )
+
+    n = symmetry.rotation_order
+    order = next(
+        (
+            d for d in range(n, 1, -1)
+            if n % d == 0 and preserved(
+                lambda a, w=360.0 / d: a + w,
+                lambda p, w=360.0 / d: rotate_azimuth(p, -w)
+            )
+        ),
+        1
+    )
+    mirror = None
+    if symmetry.mirror_azimuth is not None:
+        for k in range(n):  # The model's mirror planes repeat every 180/n degrees
+            m = symmetry.mirror_azimuth + k * 180.0 / n
+            if preserved(lambda a, m=m: 2 * m - a, lambda p, m=m: reflect_azimuth(p, m)):
+                mirror = m
+                break
+    return Symmetry(order, mirror)
+
+def model_vertices(scene: bpy.types.Scene) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the world-space vertices of the scene's visible meshes and the
+    material of each, as an integer label shared across meshes."""
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    materials: Dict[str, int] = {}
+    points, labels = [], []
+    for obj in scene.objects:
+        if obj.type != 'MESH' or not obj.visible_get():
+            continue
+        evaluated = obj.evaluated_get(depsgraph)
+        mesh = evaluated.to_mesh()
+        try:
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+            mesh.vertices.foreach_get("co", coords)
+            loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", loop_vertices)
+            loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("loop_total", loop_totals)
+            face_materials = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("material_index", face_materials)
+        finally:
+            evaluated.to_mesh_clear()
+        slots = [
+            materials.setdefault(slot.material.name if slot.material else "", len(materials))
+            for slot in obj.material_slots
+        ] or [materials.setdefault("", len(materials))]
+        vertex_materials = np.zeros(len(coords) // 3, dtype=np.int64)
+        vertex_materials[loop_vertices] = np.repeat(face_materials, loop_totals)
+        labels.append(np.asarray(slots)[np.clip(vertex_materials, 0, len(slots) - 1)])
+        matrix = np.array(obj.matrix_world)
+        points.append(coords.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3])
+    if not points:
+        return np.empty((0, 3)), np.empty(0, dtype=np.int64)
+    return np.concatenate(points), np.concatenate(labels)
+
+def world_is_uniform(world: Optional[bpy.types.World]) -> bool:
+    """Whether the world lights the model equally from every azimuth."""
+    if world is None or world.node_tree is None:
+        return True
+    return not any(node.type in DIRECTIONAL_WORLD_NODES for node in world.node_tree.nodes)
+
+class SymmetryAliases:
+    """Finds the views of a path that repeat an earlier view by symmetry.
+
+    Chunks of the path must be added in order. The first view of each group
+    of equivalent views is rendered; the others are its aliases.
+
+    Args:
+        symmetry: Symmetry shared by the model and the lighting
+        tolerance: Angle in degrees within which canonical views are the same
+    """
+
+    def __init__(self, symmetry: Symmetry, tolerance: float = VIEW_TOLERANCE):
+        self.symmetry = symmetry
+        self._index = ViewIndex(max(tolerance, VIEW_TOLERANCE))
+        self._sources: List[Tuple[int, SphericalCoordinate, bool]] = []
+
+    def add(self, start: int, path: CameraPath) -> Dict[int, Tuple[int, SphericalCoordinate, bool]]:
+        """Add a chunk of the path whose first frame index is start.
+
+        Returns:
+            dict: For each alias in the chunk, its frame index mapped to the
+                frame index and position of the frame it repeats, and whether
+                it is that frame mirrored
+        """
+        canonical, mirrored = self.symmetry.canonical(path)
+        aliases = {}
+        for k, match in enumerate(self._index.match(canonical).tolist()):
+            if match < 0:
+                self._sources.append((start + k, path[k], bool(mirrored[k])))
+            else:
+                index, coord, source_mirrored = self._sources[match]
+                aliases[start + k] = (index, coord, bool(mirrored[k]) != source_mirrored)
+        return aliases
+
+def write_aliases(manifest: RenderManifest) -> int:
+    """Write the manifest's pending aliases as copies of the frames they repeat.
+
+    Unmirrored aliases are hard links (or copies) of their source; mirrored
+    ones are flipped left to right. Aliases whose source is not recorded as
+    complete (failed, or degraded by a time budget) are left pending.
+
+    Returns:
+        int: Number of aliases written
+    """
+    written = 0
+    capture = None
+    try:
+        for filename, entry in manifest.pending_aliases():
+            source = manifest.entry(entry["alias_of"])
+            if source is None or source["size"] is None:
+                continue
+            source_path = os.path.join(manifest.output_dir, entry["alias_of"])
+            target_path = os.path.join(manifest.output_dir, filename)
+            if not os.path.isfile(source_path):
+                continue
+            if entry["mirrored"]:
+                capture = capture or FrameCapture()
+                pixels = capture.read(source_path)
+                write_file_atomic(target_path, encode_png(np.ascontiguousarray(pixels[:, ::-1])))
+            else:
+                link_or_copy(source_path, target_path)
+            manifest.record(
+                entry["index"], SphericalCoordinate(**entry["coordinate"]), filename,
+                alias_of=entry["alias_of"], mirrored=entry["mirrored"]
+            )
+            written += 1
+    finally:
+        if capture is not None:
+            capture.close()
+    if written:
+        logger.info(f"Symmetry: wrote {written} frames as aliases of rendered frames")
+    return written
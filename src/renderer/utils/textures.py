@@ -0,0 +1,127 @@
+# src/renderer/utils/textures.py
+"""Downscale image textures to the detail the camera can resolve.
+
+A model that covers a few hundred pixels cannot show more texels than that,
+but Cycles loads every texture at full size into each worker's memory. Each
+image is reduced to the smallest power-of-two mip (the original size halved
+k times) that still has TEXEL_MARGIN texels per screen pixel across the
+model. Resized images are cached as PNG files keyed by the hash of the
+original's contents and the mip size, so later runs skip the resampling.
+
+The reduced image is packed into the .blend data, which keeps Blender from
+reloading the full-size original and keeps the render independent of cache
+evictions by other jobs.
+
+The before/after memory figures are estimates of the decoded pixel data
+from each image's size and channels, not measurements. Process memory
+cannot show the saving: reading an image's size already decodes it at full
+size, and the peak resident memory (peak_memory_mb) never decreases.
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+from typing import Optional, Tuple
+
+import bpy
+
+from renderer.utils.cache import RenderCache
+from renderer.utils.hashing import config_hash, file_checksum
+from renderer.utils.logger import logger
+
+# Texels per screen pixel across the model; UV layouts rarely spread a
+# texture evenly over the whole surface
+TEXEL_MARGIN = 2.0
+
+def mip_size(size: Tuple[int, int], needed: float) -> Tuple[int, int]:
+    """Return the smallest mip of size whose larger side is at least needed."""
+    width, height = size
+    while max(width, height) // 2 >= needed and min(width, height) >= 2:
+        width, height = width // 2, height // 2
+    return width, height
+
+def image_memory(image: bpy.types.Image) -> int:
+    """Return the estimated bytes of an image's decoded pixels, from its size."""
+    width, height = image.size
+    return width * height * image.channels * (4 if image.is_float else 1)
+
+def peak_memory_mb() -> Optional[float]:
+    """Return the peak resident memory of this process in megabytes, if known.
+
+    This is the high-water mark of the whole process so far (ru_maxrss), so
+    it includes full-size textures decoded before downscaling.
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+def _content_hash(image: bpy.types.Image) -> Optional[str]:
+    """Return the hash of an image's source data, if it can be read."""
+    if image.packed_file is not None:
+        return hashlib.sha256(image.packed_file.data).hexdigest()
+    path = bpy.path.abspath(image.filepath)
+    if os.path.isfile(path):
+        return file_checksum(path)
+    return None
+
+def _replace_pixels(image: bpy.types.Image, path: str) -> None:
+    """Load an image's pixels from path and pack them, keeping its settings."""
+    if image.packed_file is not None:
+        image.unpack(method='REMOVE')
+    image.filepath = path
+    image.reload()
+    image.pack()
+
+def downscale_images(needed: float, cache: Optional[RenderCache] = None) -> dict:
+    """Downscale every file-backed 8-bit image to the mip needed on screen.
+
+    Float images (HDR/EXR and 16-bit PNGs) are left alone, since the PNG cache
+    stores 8 bits per channel.
+
+    Args:
+        needed: Texels required along the larger side of an image
+        cache: Cache of resized images (None: resample every time)
+
+    Returns:
+        dict: Images downscaled and the estimated decoded texture memory
+        before/after in megabytes
+    """
+    memory_before = memory_after = 0
+    downscaled = 0
+    for image in list(bpy.data.images):
+        if image.type != 'IMAGE' or image.source != 'FILE' or not all(image.size):
+            continue  # Generated, render result or missing file
+        memory_before += image_memory(image)
+        size = mip_size(tuple(image.size), needed)
+        content_hash = None if image.is_float else _content_hash(image)
+        if content_hash is None or size == tuple(image.size):
+            memory_after += image_memory(image)
+            continue
+
+        key = config_hash("texture", content_hash, list(size))
+        path = cache.lookup(key) if cache is not None else None
+        if path is not None:
+            _replace_pixels(image, path)
+        else:
+            image.scale(*size)
+            image.pack()  # Encodes the resized pixels as PNG
+            if cache is not None:
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    temp_path = os.path.join(temp_dir, "texture.png")
+                    with open(temp_path, "wb") as file:
+                        file.write(image.packed_file.data)
+                    cache.store(key, temp_path)
+        logger.debug(f"Downscaled texture {image.name} to {size[0]}x{size[1]}")
+        memory_after += image_memory(image)
+        downscaled += 1
+
+    return {
+        'images_downscaled': downscaled,
+        'texture_memory_before_mb': memory_before / (1024 * 1024),
+        'texture_memory_after_mb': memory_after / (1024 * 1024),
+    }
@@ -0,0 +1,208 @@
+import math
+
+import numpy as np
+import pytest
+from mathutils import Euler, Vector
+
+from renderer.camera import CameraPath, DeduplicatedPathGenerator, ViewIndex, camera_registry
+from renderer.camera.paths.adaptive import refine_views
+from renderer.camera.paths.icosphere import icosphere_mesh
+from renderer.config.camera_config import CameraConfig, CameraPathType, SphereCoverage
+from renderer.utils.coordinates import SphericalCoordinate
+
+def _reference_matrix(coord: SphericalCoordinate) -> np.ndarray:
+    """World matrix from the per-frame mathutils code the batch poses replace."""
+    az, el, roll = map(math.radians, (coord.azimuth, coord.elevation, coord.roll))
+    location = Vector((
+        coord.radius * math.cos(el) * math.sin(az),
+        coord.radius * math.cos(el) * math.cos(az),
+        coord.radius * math.sin(el),
+    ))
+    euler = (-location.normalized()).to_track_quat('-Z', 'Y').to_euler('XYZ')
+    euler.rotate_axis('Z', roll)
+    matrix = euler.to_matrix().to_4x4()
+    matrix.translation = location
+    return np.array(matrix)
+
+def test_camera_path_sequence():
+    """Test that a CameraPath behaves like a list of SphericalCoordinate."""
+    coords = [SphericalCoordinate(2.0, 10.0, 20.0, 5.0), SphericalCoordinate(2.0, 30.0, -40.0, 0.0)]
+    path = CameraPath.from_coordinates(coords)
+    assert len(path) == 2
+    assert path == coords
+    assert path[1] == coords[1]
+    assert path[-1:] == coords[1:]
+    assert path[path.elevation > 0] == coords[:1]
+    assert CameraPath.concatenate([path, path]) == coords + coords
+    assert path.nbytes == 2 * 4 * 8
+
+def test_camera_path_poses():
+    """Test batch poses against mathutils, including views at and near the poles."""
+    rng = np.random.default_rng(0)
+    azimuth = np.concatenate([rng.uniform(0, 360, 200), [0, 45, 180, 270, 333] * 4])
+    elevation = np.concatenate([
+        rng.uniform(-90, 90, 200), [90] * 5, [-90] * 5, [89.99] * 5, [-89.999999] * 5
+    ])
+    roll = rng.uniform(-180, 180, len(azimuth))
+    path = CameraPath(3.0, azimuth, elevation, roll)
+
+    expected = np.array([_reference_matrix(coord) for coord in path])
+    np.testing.assert_allclose(path.matrices(), expected, atol=1e-5)
+
+    # The Euler angles describe the same rotations
+    for euler, matrix in zip(path.rotations(), expected):
+        np.testing.assert_allclose(Euler(euler, 'XYZ').to_matrix(), matrix[:3, :3], atol=1e-5)
+
+def test_generator_counts():
+    """Test view counts of each generator, including the closed-form phased spiral."""
+    full = CameraConfig(camera_density=35, angular_step=45.0)
+    half = CameraConfig(camera_density=35, angular_step=45.0, sphere_coverage=SphereCoverage.HALF)
+    expected = {
+        "cube": (6, 5),
+        "orbit": (35, 35),
+        "pole_rotation": (60, 30),
+        "spiral_phi": (35, 18),
+        "spiral_phased": (8 + 8 * 8, 8 + 4 * 8),
+    }
+    for name, (full_count, half_count) in expected.items():
+        generator = camera_registry.get_generator(name)
+        assert len(generator.generate_positions(full)) == full_count
+        assert len(generator.generate_positions(half)) == half_count
+        assert generator.count(full) == full_count
+
+def test_spiral_phased_values():
+    """Test the rings of the phased spiral."""
+    generator = camera_registry.get_generator("spiral_phased")
+    path = generator.generate_positions(
+        CameraConfig(angular_step=90.0, sphere_coverage=SphereCoverage.HALF)
+    )
+    assert path.azimuth.tolist() == [0, 90, 180, 270] * 3
+    assert path.elevation.tolist() == [85] * 4 + [83] * 4 + [38] * 4
+
+    # Rings of steps that do not divide 360 end when the azimuth is back at 0
+    path = generator.generate_positions(CameraConfig(angular_step=100.0))
+    assert len(path) == generator.count(CameraConfig(angular_step=100.0)) == 18 * 5
+    assert sorted(path.azimuth[:18].tolist()) == list(range(0, 360, 20))
+    assert generator.count(CameraConfig(angular_step=7.0)) == 18000
+    assert generator.count(CameraConfig(angular_step=13.0)) == 9720
+
+def test_generator_edge_cases():
+    """Test single-view and single-ring configurations."""
+    top = camera_registry.get_generator("spiral_phi").generate_positions(
+        CameraConfig(camera_density=1)
+    )
+    assert top == [SphericalCoordinate(1.0, 0.0, 90.0, 0.0)]
+
+    ring = camera_registry.get_generator("spiral_lin").generate_positions(
+        CameraConfig(angular_step=100.0, sphere_coverage=SphereCoverage.HALF)
+    )
+    assert set(ring.elevation.tolist()) == {70.0}
+
+def test_custom_path_file(tmp_path):
+    """Test reading custom views from .npy and raw files, whole and in chunks."""
+    views = np.column_stack([
+        np.full(10, 2.0), np.arange(10) * 36.0, np.linspace(-80, 80, 10), np.zeros(10)
+    ])
+    np.save(tmp_path / "views.npy", views)
+    views.astype("<f8").tofile(tmp_path / "views.bin")
+    np.save(tmp_path / "angles.npy", views[:, 1:3])
+
+    generator = camera_registry.get_generator("custom")
+    for name in ("views.npy", "views.bin"):
+        config = CameraConfig(camera_path_type=CameraPathType.CUSTOM, custom_path_file=str(tmp_path / name))
+        path = generator.generate_positions(config)
+        assert generator.count(config) == len(path) == 10
+        assert path == CameraPath(*views.T)
+        chunks = list(generator.iter_chunks(config, 4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert CameraPath.concatenate(chunks) == path
+
+    # Radius and roll default to the camera config
+    config = CameraConfig(
+        distance=3.0, roll=15.0, camera_path_type=CameraPathType.CUSTOM,
+        custom_path_file=str(tmp_path / "angles.npy")
+    )
+    path = generator.generate_positions(config)
+    assert set(path.radius.tolist()) == {3.0} and set(path.roll.tolist()) == {15.0}
+
+    (tmp_path / "bad.bin").write_bytes(b"\0" * 12)
+    config = CameraConfig(camera_path_type=CameraPathType.CUSTOM, custom_path_file=str(tmp_path / "bad.bin"))
+    with pytest.raises(ValueError):
+        generator.count(config)
+    with pytest.raises(ValueError):
+        CameraConfig(camera_path_type=CameraPathType.CUSTOM)
+
+def test_greedy_cover():
+    """Test the greedy set cover behind the coverage path."""
+    from renderer.camera.paths.coverage import greedy_cover
+
+    visibility = np.array([
+        [1, 1, 0, 0, 0, 0],
+        [0, 1, 1, 1, 0, 0],
+        [0, 0, 0, 0, 1, 0],
+        [1, 1, 1, 1, 0, 0],
+    ], dtype=bool)  # The last sample is seen by no view
+    assert greedy_cover(visibility, 1.0) == ([3, 2], 1.0)
+    assert greedy_cover(visibility, 0.5) == ([3], 0.8)
+    assert greedy_cover(np.zeros((2, 3), dtype=bool), 1.0) == ([], 0.0)
+
+def test_deduplicated_path():
+    """Test dropping near-duplicate views, whole and in chunks."""
+    index = ViewIndex(1.0)
+    path = CameraPath(2.0, [0.0, 0.5, 0.0, 3.0, 0.0], [0.0, 0.0, 0.5, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 5.0])
+    assert index.add(path).tolist() == [True, False, False, True, True]
+    assert index.add(path[:2]).tolist() == [False, False]
+
+    # Pole views differ mostly by in-plane rotation
+    config = CameraConfig(camera_path_type=CameraPathType.POLE_ROTATION)
+    pole = camera_registry.get_generator("pole_rotation")
+    assert DeduplicatedPathGenerator(pole, 1.0).count(config) == 60
+    generator = DeduplicatedPathGenerator(pole, 1.0, ignore_roll=True)
+    path = generator.generate_positions(config)
+    assert generator.count(config) == len(path) == 20
+    assert generator.stats['deduplication']['renders_saved'] == 40
+    assert CameraPath.concatenate(generator.iter_chunks(config, 7)) == path
+
+def test_icosphere_levels():
+    """Test that each icosphere level extends the path of the level before."""
+    icosphere = camera_registry.get_generator("icosphere")
+    paths = [icosphere.generate_positions(CameraConfig(icosphere_level=level)) for level in range(4)]
+    assert [len(path) for path in paths] == [12, 42, 162, 642]
+    assert [icosphere.count(CameraConfig(icosphere_level=level)) for level in range(4)] == [12, 42, 162, 642]
+    for coarse, fine in zip(paths, paths[1:]):
+        assert fine[:len(coarse)] == coarse
+
+    # Neighbouring level-2 views are evenly spaced (about 16 degrees apart)
+    directions = paths[2].locations()
+    cosines = directions @ directions.T
+    np.fill_diagonal(cosines, -1.0)
+    spacing = np.degrees(np.arccos(cosines.max(axis=1)))
+    assert 15.5 < spacing.min() and spacing.max() < 16.5
+
+    half_config = CameraConfig(icosphere_level=2, sphere_coverage=SphereCoverage.HALF)
+    half = icosphere.generate_positions(half_config)
+    assert len(half) == icosphere.count(half_config) and half.elevation.min() >= -1e-6
+    with pytest.raises(ValueError):
+        CameraConfig(icosphere_level=9)
+
+def test_refine_views():
+    """Test adding views between neighbours whose images differ."""
+    vertices, faces = icosphere_mesh(1)
+
+    def render(directions):
+        """Images that turn from black to white where x crosses 0.3."""
+        return [np.full((2, 2, 4), float(x > 0.3), dtype=np.float32) for x in directions[:, 0]]
+
+    directions, difference = refine_views(vertices, faces, render, 0.5, 80)
+    assert len(directions) == 80 and difference == 1.0
+    assert np.array_equal(directions[:42], vertices)
+    assert np.allclose(np.linalg.norm(directions, axis=1), 1.0)
+    # Added views close in on the edge of the white region
+    assert np.abs(directions[42:, 0] - 0.3).mean() < 0.5 * np.abs(vertices[:, 0] - 0.3).mean()
+
+    # Refinement stops at the shortest edge, or when no neighbours differ
+    directions, difference = refine_views(vertices, faces, render, 0.5, 10000, min_angle=4.0)
+    assert 42 < len(directions) < 10000 and difference == 1.0
+    uniform = lambda directions: [np.zeros((2, 2, 4), dtype=np.float32)] * len(directions)
+    directions, difference = refine_views(vertices, faces, uniform, 0.5, 80)
+    assert len(directions) == 42 and difference == 0.0
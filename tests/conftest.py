@@ -15,20 +15,12 @@ def test_model_path():
     return str(Path(__file__).parent / "test_data" / "test_model.glb")
 
 @pytest.fixture
-def output_dir():
-    """Provide permanent directory for render outputs"""
-    # Create a permanent directory in your tests folder
-    output_path = Path(__file__).parent / "test_output"
+def output_dir(tmp_path):
+    """Provide temporary directory for render outputs"""
+    output_path = tmp_path / "render_output"
     output_path.mkdir(exist_ok=True)
     return str(output_path)  # Convert to string for Blender compatibility
 
-#@pytest.fixture
-#def output_dir(tmp_path):
-#    """Provide temporary directory for render outputs"""
-#    output_path = tmp_path / "render_output"
-#    output_path.mkdir(exist_ok=True)
-#    return str(output_path)  # Convert to string for Blender compatibility
-
 @pytest.fixture
 def renderer():
     """Provide a ModelRenderer instance with default settings."""
@@ -0,0 +1,25 @@
+# tests/output/test_png.py
+import zlib
+
+import numpy as np
+import pytest
+
+from renderer.output.png import encode_png
+
+def test_encode_png_round_trip():
+    """Test that the encoded scanlines decode back to the original pixels."""
+    pixels = np.random.default_rng(0).integers(0, 256, (5, 7, 4), dtype=np.uint8)
+    data = encode_png(pixels)
+    assert data.startswith(b"\x89PNG\r\n\x1a\n")
+
+    idat = data.index(b"IDAT")
+    length = int.from_bytes(data[idat - 4:idat], "big")
+    raw = np.frombuffer(zlib.decompress(data[idat + 4:idat + 4 + length]), dtype=np.uint8)
+    rows = raw.reshape(5, 7 * 4 + 1)[:, 1:]
+    decoded = np.cumsum(rows, axis=0, dtype=np.uint8)  # Undo the 'Up' filter
+    assert np.array_equal(decoded.reshape(5, 7, 4), pixels)
+
+def test_encode_png_rejects_float():
+    """Test that non-uint8 arrays are rejected."""
+    with pytest.raises(ValueError):
+        encode_png(np.zeros((2, 2, 4), dtype=np.float32))
@@ -0,0 +1,51 @@
+# tests/output/test_tar_shards.py
+import json
+import os
+import tarfile
+
+from renderer.output.tar_shards import TarShardWriter, consolidate_shard_indexes
+
+def _read_index(output_dir):
+    with open(os.path.join(output_dir, "shards.json")) as file:
+        return json.load(file)
+
+def test_tar_shards_roll_over_and_index_offsets(tmp_path):
+    """Test that shards roll over at the size limit and the index locates members."""
+    writer = TarShardWriter(str(tmp_path), shard_size_bytes=8 * 1024)
+    images = [bytes([i]) * 3000 for i in range(5)]
+    for i, image in enumerate(images):
+        writer.add(f"frame_{i:03d}", i, image, {"index": i})
+    writer.close()
+
+    index = _read_index(tmp_path)
+    assert index['samples'] == 5
+    assert len(index['shards']) > 1
+    for shard in index['shards']:
+        path = os.path.join(tmp_path, shard['name'])
+        assert shard['size'] == os.path.getsize(path)
+        with tarfile.open(path) as tar:
+            assert tar.getnames() == [
+                f"{sample['key']}.{ext}" for sample in shard['samples'] for ext in ("png", "json")
+            ]
+        with open(path, "rb") as file:
+            for sample in shard['samples']:
+                png, sidecar = sample['members']
+                file.seek(png['offset'])
+                assert file.read(png['size']) == images[sample['index']]
+                file.seek(sidecar['offset'])
+                assert json.loads(file.read(sidecar['size'])) == {"index": sample['index']}
+
+def test_consolidate_worker_shard_indexes(tmp_path):
+    """Test that per-worker indexes are merged into shards.json."""
+    for worker in range(2):
+        writer = TarShardWriter(str(tmp_path), shard_size_bytes=1 << 20, worker=worker)
+        writer.add(f"frame_{worker:03d}", worker, b"png", {})
+        writer.close()
+    consolidate_shard_indexes(str(tmp_path))
+
+    index = _read_index(tmp_path)
+    assert index['samples'] == 2
+    assert [shard['name'] for shard in index['shards']] == [
+        "shard-w00-000000.tar", "shard-w01-000000.tar"
+    ]
+    assert not [f for f in os.listdir(tmp_path) if f.startswith("shards.worker-")]
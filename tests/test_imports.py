@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+def _run(code: str) -> str:
+    """Run code in a fresh interpreter that can import the package."""
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    return result.stdout.strip()
+
+def test_planning_imports_without_bpy():
+    """Test that configs, camera paths and utils import and plan without Blender."""
+    output = _run(
+        "import sys\n"
+        "import renderer, renderer.config, renderer.camera, renderer.utils\n"
+        "from renderer import CameraConfig, CameraPathType\n"
+        "from renderer.camera import camera_registry\n"
+        "from renderer.utils import cache, hashing, lod, manifest\n"
+        "config = CameraConfig(camera_path_type=CameraPathType.SPIRAL_PHI, camera_density=1000)\n"
+        "path = camera_registry.get_generator('spiral_phi').generate_positions(config)\n"
+        "path.matrices()\n"
+        "print(sorted(m for m in ('bpy', 'mathutils') if m in sys.modules))"
+    )
+    assert output == "[]"
+
+def test_model_renderer_lazy_import():
+    """Test that ModelRenderer is still available from the package root."""
+    output = _run(
+        "import sys, renderer\n"
+        "print('bpy' in sys.modules)\n"
+        "print(renderer.ModelRenderer.__name__, 'bpy' in sys.modules)"
+    )
+    assert output.splitlines() == ["False", "ModelRenderer True"]
+
+def test_root_logger_untouched():
+    """Test that importing the package leaves the root logger unconfigured."""
+    output = _run("import logging, renderer\nprint(len(logging.getLogger().handlers))")
+    assert output == "0"
@@ -0,0 +1,85 @@
+# tests/test_parallel.py
+import os
+from dataclasses import replace
+
+from renderer.config.camera_config import CameraConfig, CameraPathType
+from renderer.model_renderer import ModelRenderer
+from renderer.parallel import shard_frames, merge_shard_stats
+
+def test_shard_frames_cover_path():
+    """Test that shards are disjoint, complete and keep frame indices."""
+    frames = list(enumerate("abcdefg"))
+    shards = [shard_frames(frames, k, 3) for k in range(3)]
+    assert sorted(frame for shard in shards for frame in shard) == frames
+    assert shards[1] == [(1, "b"), (4, "e")]
+
+def test_merge_shard_stats():
+    """Test that per-shard stats are summed and ordered by shard."""
+    shard_stats = [
+        {'shard': 1, 'total_renders': 2, 'successful_renders': 2,
+         'skipped_renders': 0, 'failed_renders': 0, 'cache_hits': 0, 'cache_misses': 2,
+         'encode_time': 0.0, 'encode_wait_time': 0.0, 'import_time_saved': 0.0,
+         'engine': 'cycles'},
+        {'shard': 0, 'total_renders': 3, 'successful_renders': 1,
+         'skipped_renders': 1, 'failed_renders': 1, 'cache_hits': 1, 'cache_misses': 1,
+         'encode_time': 0.0, 'encode_wait_time': 0.0, 'import_time_saved': 0.0,
+         'engine': 'cycles'},
+    ]
+    stats = merge_shard_stats(shard_stats, "out", 1.5)
+    assert stats['total_renders'] == 5
+    assert stats['failed_renders'] == 1
+    assert stats['skipped_renders'] == 1
+    assert stats['workers'] == 2
+    assert stats['engine'] == 'cycles'
+    assert [s['shard'] for s in stats['shards']] == [0, 1]
+
+def test_render_with_workers(test_model_path, output_dir, configs):
+    """Test that a sharded render writes the same files as a serial render."""
+    configs["render_config"] = replace(configs["render_config"], samples=8, workers=2)
+    serial_dir = os.path.join(output_dir, "serial")
+    sharded_dir = os.path.join(output_dir, "sharded")
+
+    ModelRenderer(**{**configs, "render_config": replace(configs["render_config"], workers=1)}
+                  ).render(test_model_path, serial_dir)
+    renderer = ModelRenderer(**configs)
+    renderer.render(test_model_path, sharded_dir)
+
+    stats = renderer.get_render_stats()
+    assert stats['workers'] == 2
+    assert stats['successful_renders'] == stats['total_renders'] > 0
+    assert sorted(os.listdir(sharded_dir)) == sorted(os.listdir(serial_dir))
+
+def test_render_with_workers_autotune(test_model_path, output_dir, configs):
+    """Test that workers use the sampling settings autotuned once by the parent."""
+    configs["render_config"] = replace(
+        configs["render_config"], samples=32, autotune_samples=True, noise_target=0.5, workers=2
+    )
+    sharded_dir = os.path.join(output_dir, "sharded_autotune")
+    renderer = ModelRenderer(**configs)
+    renderer.render(test_model_path, sharded_dir)
+
+    stats = renderer.get_render_stats()
+    assert stats['successful_renders'] == stats['total_renders'] > 0
+    assert {s['samples'] for s in stats['shards']} == {stats['samples']}
+    assert all(s['autotune_time'] < stats['autotune_time'] for s in stats['shards'])
+    assert not os.path.exists(os.path.join(sharded_dir, "autotune.json"))
+
+def test_render_with_workers_adaptive_path(test_model_path, output_dir, configs):
+    """Test that an adaptive path is planned once by the parent and rendered as planned."""
+    configs["camera_config"] = CameraConfig(
+        distance=20, camera_path_type=CameraPathType.ADAPTIVE,
+        refine_level=0, refine_threshold=0.01, refine_budget=16
+    )
+    configs["render_config"] = replace(configs["render_config"], samples=4, workers=2)
+    sharded_dir = os.path.join(output_dir, "sharded_adaptive")
+    renderer = ModelRenderer(**configs)
+    renderer.render(test_model_path, sharded_dir)
+
+    stats = renderer.get_render_stats()
+    refinement = stats['refinement']
+    assert stats['successful_renders'] == stats['total_renders'] == (
+        refinement['coarse_views'] + refinement['added_views']
+    )
+    assert all(s['refinement'] == refinement for s in stats['shards'])
+    frames = [f for f in os.listdir(sharded_dir) if f.endswith(".png")]
+    assert len(frames) == stats['total_renders']
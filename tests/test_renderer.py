@@ -1,7 +1,28 @@
 # tests/test_renderer.py
-import pytest
+import json
 import os
+import shutil
+import tarfile
+import time
+
+import pytest
+
+import bpy
+import numpy as np
 from renderer.model_renderer import ModelRenderer
+from renderer.config.render_config import (
+    RenderConfig,
+    BorderMode,
+    OutputFormat,
+    RenderEngine,
+    RenderPass
+)
+from renderer.config.blend_config import BlendFileConfig
+from renderer.config.camera_config import CameraConfig, CameraPathType, SphereCoverage
+from renderer.config.lighting_config import LightingConfig, LightSetup
+from renderer.parallel import shard_frames
+from renderer.utils.bake import BAKE_UV_NAME, bake_procedural_materials
+from renderer.utils.coordinates import SphericalCoordinate
 
 def test_debug_path(test_model_path):
     """Test that the model path exists and is properly resolved"""
@@ -31,3 +52,559 @@ def test_invalid_model_path(renderer, output_dir):
     invalid_path = os.path.join(output_dir, "nonexistent_model.glb")
     with pytest.raises(RuntimeError, match="Model file not found"):
         renderer.render(invalid_path, output_dir)
+
+def test_render_batch(test_model_path, output_dir, configs):
+    """Test that a batch reuses one session and records per-model stats."""
+    renderer_with_configs = ModelRenderer(**configs)
+    batch_dir = os.path.join(output_dir, "batch")
+    missing_path = os.path.join(output_dir, "nonexistent_model.glb")
+    renderer_with_configs.render_batch(
+        [test_model_path, missing_path, test_model_path], batch_dir
+    )
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['total_models'] == 3
+    assert stats['failed_models'] == 1
+    assert "Model file not found" in stats['models'][1]['error']
+    for model_stats in (stats['models'][0], stats['models'][2]):
+        assert model_stats['successful_renders'] == model_stats['total_renders'] > 0
+        frames = [f for f in os.listdir(model_stats['output_directory']) if f.endswith(".png")]
+        assert len(frames) == model_stats['total_renders']
+
+def test_render_baked_animation(test_model_path, output_dir, configs):
+    """Test that an animation render writes the same filenames as a frame-by-frame render."""
+    configs["render_config"] = RenderConfig(resolution=64, samples=8, bake_animation=True)
+    configs["lighting_config"] = LightingConfig(num_lights=2, light_setup=LightSetup.RANDOM_DYNAMIC)
+    renderer_with_configs = ModelRenderer(**configs)
+    animation_dir = os.path.join(output_dir, "animation")
+    renderer_with_configs.render(test_model_path, animation_dir)
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['successful_renders'] == stats['total_renders'] > 0
+    positions = renderer_with_configs._generate_camera_positions()
+    expected = {renderer_with_configs._frame_filename(i, c) for i, c in enumerate(positions)}
+    assert expected <= set(os.listdir(animation_dir))
+
+def test_render_resume(test_model_path, output_dir, configs):
+    """Test that a resumed render only re-renders missing or partial frames."""
+    configs["render_config"] = RenderConfig(resolution=64, samples=8)
+    resume_dir = os.path.join(output_dir, "resume")
+    renderer_with_configs = ModelRenderer(**configs)
+    renderer_with_configs.render(test_model_path, resume_dir)
+    total = renderer_with_configs.get_render_stats()['total_renders']
+
+    frames = sorted(f for f in os.listdir(resume_dir) if f.endswith(".png"))
+    os.remove(os.path.join(resume_dir, frames[0]))
+    with open(os.path.join(resume_dir, frames[1]), "r+b") as partial_frame:
+        partial_frame.truncate(10)
+
+    renderer_with_configs.render(test_model_path, resume_dir, resume=True)
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['successful_renders'] == 2
+    assert stats['skipped_renders'] == total - 2
+    assert stats['failed_renders'] == 0
+
+def test_render_cache(test_model_path, output_dir, configs, tmp_path):
+    """Test that a second job with the same configs is served from the render cache."""
+    configs["render_config"] = RenderConfig(
+        resolution=64, samples=8, cache_dir=str(tmp_path / "cache")
+    )
+    renderer_with_configs = ModelRenderer(**configs)
+    renderer_with_configs.render(test_model_path, str(tmp_path / "first"))
+    first = renderer_with_configs.get_render_stats()
+    assert first['cache_misses'] == first['total_renders']
+
+    renderer_with_configs.render(test_model_path, str(tmp_path / "second"))
+    second = renderer_with_configs.get_render_stats()
+    assert second['cache_hits'] == second['successful_renders'] == second['total_renders']
+    assert sorted(os.listdir(tmp_path / "first")) == sorted(os.listdir(tmp_path / "second"))
+
+def test_render_iter(test_model_path, output_dir, configs):
+    """Test that in-memory frames match the PNG files written by render()."""
+    configs["render_config"] = RenderConfig(resolution=(64, 48), samples=8)
+    renderer_with_configs = ModelRenderer(**configs)
+    frames = list(renderer_with_configs.render_iter(test_model_path))
+    stats = renderer_with_configs.get_render_stats()
+    assert len(frames) == stats['successful_renders'] == stats['total_renders'] > 0
+
+    coord, pixels = frames[0]
+    assert pixels.shape == (48, 64, 4)
+    assert pixels.dtype == np.uint8
+
+    iter_dir = os.path.join(output_dir, "iter")
+    renderer_with_configs.render(test_model_path, iter_dir)
+    png_path = os.path.join(iter_dir, renderer_with_configs._frame_filename(0, coord))
+    image = bpy.data.images.load(png_path)
+    png_pixels = np.array(image.pixels[:]).reshape(48, 64, 4)[::-1]
+    assert np.abs(png_pixels * 255 - pixels).max() <= 1
+
+def test_render_async_encoding(test_model_path, output_dir, configs):
+    """Test that frames encoded off the render thread match Blender's PNGs."""
+    configs["render_config"] = RenderConfig(resolution=64, samples=8)
+    sync_dir = os.path.join(output_dir, "sync_encoding")
+    ModelRenderer(**configs).render(test_model_path, sync_dir)
+
+    configs["render_config"] = RenderConfig(resolution=64, samples=8, encode_workers=2)
+    renderer_with_configs = ModelRenderer(**configs)
+    async_dir = os.path.join(output_dir, "async_encoding")
+    renderer_with_configs.render(test_model_path, async_dir)
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['successful_renders'] == stats['total_renders'] > 0
+    assert stats['encode_time'] > 0
+
+    for filename in (f for f in os.listdir(sync_dir) if f.endswith(".png")):
+        images = [bpy.data.images.load(os.path.join(d, filename)) for d in (sync_dir, async_dir)]
+        pixels = [np.array(image.pixels[:]) for image in images]
+        assert np.abs(pixels[0] - pixels[1]).max() <= 1 / 255
+
+def test_render_tar_shards(test_model_path, output_dir, configs):
+    """Test that frames and sidecars are streamed into indexed tar shards."""
+    configs["render_config"] = RenderConfig(
+        resolution=64, samples=8, output_format=OutputFormat.TAR_SHARDS
+    )
+    renderer_with_configs = ModelRenderer(**configs)
+    tar_dir = os.path.join(output_dir, "tar_shards")
+    renderer_with_configs.render(test_model_path, tar_dir)
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['successful_renders'] == stats['total_renders'] > 0
+    assert not [f for f in os.listdir(tar_dir) if f.endswith(".png")]
+
+    with open(os.path.join(tar_dir, "shards.json")) as file:
+        index = json.load(file)
+    assert index['samples'] == stats['total_renders']
+    with tarfile.open(os.path.join(tar_dir, index['shards'][0]['name'])) as tar:
+        names = tar.getnames()
+        sidecar = json.load(tar.extractfile(names[1]))
+    assert names[0].startswith("render_000_") and names[0].endswith(".png")
+    assert names[1] == names[0].replace(".png", ".json")
+    assert sidecar['index'] == 0
+    assert sidecar['config']['render']['resolution'] == 64
+
+def test_render_passes(test_model_path, output_dir, configs):
+    """Test that one render per frame writes every requested pass."""
+    passes = [RenderPass.DEPTH, RenderPass.NORMAL, RenderPass.OBJECT_INDEX, RenderPass.ALPHA]
+    configs["render_config"] = RenderConfig(resolution=32, samples=4, passes=passes)
+    renderer_with_configs = ModelRenderer(**configs)
+    passes_dir = os.path.join(output_dir, "passes")
+    renderer_with_configs.render(test_model_path, passes_dir)
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['successful_renders'] == stats['total_renders'] > 0
+
+    frames = [f for f in os.listdir(passes_dir) if f.endswith(".png")]
+    assert len(frames) == stats['total_renders']
+    for frame in frames:
+        for render_pass in passes:
+            assert os.path.exists(os.path.join(
+                passes_dir, frame.replace(".png", f"_{render_pass.value}.exr")
+            ))
+
+    depth = bpy.data.images.load(os.path.join(passes_dir, frames[0].replace(".png", "_depth.exr")))
+    values = np.array(depth.pixels[:])
+    assert values.min() > 0  # Metric distances, not a [0, 1] display image
+    assert values.max() > 1
+
+def test_preview_engine_fallback(test_model_path, output_dir, configs, monkeypatch):
+    """Test that preview engines fall back to low-sample Cycles without a GPU context."""
+    monkeypatch.setattr("renderer.model_renderer.gpu_context_available", lambda: False)
+    configs["render_config"] = RenderConfig(resolution=32, engine=RenderEngine.WORKBENCH)
+    renderer_with_configs = ModelRenderer(**configs)
+    renderer_with_configs.render(test_model_path, os.path.join(output_dir, "preview"))
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['engine'] == "cycles"
+    assert stats['successful_renders'] == stats['total_renders'] > 0
+
+    # Fallback frames are keyed as the low-sample Cycles frames they are
+    fallback_hash = renderer_with_configs._frame_config_hash(test_model_path)
+    configs["render_config"] = RenderConfig(
+        resolution=32, engine=RenderEngine.CYCLES, samples=4, use_denoising=True
+    )
+    assert ModelRenderer(**configs)._frame_config_hash(test_model_path) == fallback_hash
+    monkeypatch.setattr("renderer.model_renderer.gpu_context_available", lambda: True)
+    assert renderer_with_configs._frame_config_hash(test_model_path) != fallback_hash
+
+def test_render_autotune_samples(test_model_path, output_dir, configs):
+    """Test that autotuning lowers samples within the target and caches the choice,
+    in the render cache directory if there is one and in memory otherwise."""
+    configs["render_config"] = RenderConfig(
+        resolution=32, samples=32, autotune_samples=True, noise_target=0.5
+    )
+    renderer_with_configs = ModelRenderer(**configs)
+    autotune_dir = os.path.join(output_dir, "autotune")
+    shutil.rmtree(autotune_dir, ignore_errors=True)  # Start without a cached choice
+    renderer_with_configs.render(test_model_path, autotune_dir)
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['samples'] == 8
+    assert stats['successful_renders'] == stats['total_renders'] > 0
+    assert not os.path.exists(os.path.join(autotune_dir, "autotune.json"))
+
+    renderer_with_configs.render(test_model_path, autotune_dir)
+    assert renderer_with_configs.get_render_stats()['samples'] == 8
+    assert renderer_with_configs.get_render_stats()['autotune_time'] < stats['autotune_time']
+
+    cache_dir = os.path.join(autotune_dir, "cache")
+    configs["render_config"] = RenderConfig(
+        resolution=32, samples=32, autotune_samples=True, noise_target=0.5, cache_dir=cache_dir
+    )
+    ModelRenderer(**configs).render(test_model_path, autotune_dir)
+    assert os.path.exists(os.path.join(cache_dir, "autotune.json"))
+    cached_renderer = ModelRenderer(**configs)
+    cached_renderer.render(test_model_path, autotune_dir)
+    assert cached_renderer.get_render_stats()['samples'] == 8
+    assert cached_renderer.get_render_stats()['autotune_time'] < stats['autotune_time']
+
+def test_render_time_budget(test_model_path, output_dir, configs):
+    """Test that an exhausted time budget degrades the frames after the probes."""
+    configs["render_config"] = RenderConfig(resolution=32, samples=64)
+    renderer_with_configs = ModelRenderer(**configs)
+    budget_dir = os.path.join(output_dir, "time_budget")
+    shutil.rmtree(budget_dir, ignore_errors=True)
+    renderer_with_configs.render(test_model_path, budget_dir, time_budget_s=0.01)
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['successful_renders'] == stats['total_renders'] > 2
+
+    plan = stats['time_budget']
+    assert plan['probe_frames'] == 2
+    assert plan['samples'] < 64
+    assert plan['resolution_percentage'] == 25
+
+    # Degraded frames are not recorded, so resuming renders them again
+    with open(os.path.join(budget_dir, "manifest.jsonl")) as file:
+        assert len(file.readlines()) == 1 + 2  # Version header and two frames
+
+def test_time_budget_preview_engines(monkeypatch):
+    """Test that the time budget lowers EEVEE's samples and only the resolution
+    of Workbench renders, leaving Cycles settings alone."""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    scene = bpy.context.scene
+    renderer = ModelRenderer(render_config=RenderConfig(resolution=32, samples=64))
+
+    def render_path(camera, frames, output_dir):
+        time.sleep(0.05 * len(frames))  # 50 ms per frame
+        return len(frames)
+
+    monkeypatch.setattr(renderer, "_render_path", render_path)
+    frames = [(i, SphericalCoordinate(20.0, 30.0 * i, 0.0, 0.0)) for i in range(12)]
+    for engine in (RenderEngine.EEVEE, RenderEngine.WORKBENCH):
+        scene.eevee.taa_render_samples, scene.cycles.samples = 64, 128
+        scene.render.resolution_percentage = 100
+        renderer._engine = engine
+        renderer._render_within_budget(None, frames, "unused", time.time() + 0.3)
+        assert renderer._budget_stats['time_budget']['degraded']
+        assert scene.cycles.samples == 128
+        if engine == RenderEngine.EEVEE:
+            assert scene.eevee.taa_render_samples < 64
+        else:
+            assert scene.eevee.taa_render_samples == 64
+            assert scene.render.resolution_percentage < 100
+    bpy.ops.wm.read_factory_settings(use_empty=True)  # Undo the degraded settings
+
+def test_render_border(test_model_path, output_dir, configs):
+    """Test that border renders crop to, or fill around, the projected model."""
+    configs["render_config"] = RenderConfig(resolution=64, samples=8)
+    full_dir = os.path.join(output_dir, "border_none")
+    ModelRenderer(**configs).render(test_model_path, full_dir)
+
+    for mode in (BorderMode.CROP, BorderMode.FULL_FRAME):
+        configs["render_config"] = RenderConfig(resolution=64, samples=8, border_mode=mode)
+        renderer_with_configs = ModelRenderer(**configs)
+        border_dir = os.path.join(output_dir, f"border_{mode.value}")
+        renderer_with_configs.render(test_model_path, border_dir)
+        stats = renderer_with_configs.get_render_stats()
+        assert stats['successful_renders'] == stats['total_renders'] > 0
+        assert stats['border_area'] < 0.5  # Model is small at distance 20
+
+        filename = next(f for f in os.listdir(full_dir) if f.endswith(".png"))
+        image = bpy.data.images.load(os.path.join(border_dir, filename))
+        if mode == BorderMode.CROP:
+            assert image.size[0] < 64 and image.size[1] < 64
+        else:
+            reference = bpy.data.images.load(os.path.join(full_dir, filename))
+            assert tuple(image.size) == (64, 64)
+            diff = np.abs(np.array(image.pixels[:]) - np.array(reference.pixels[:]))
+            assert np.mean(diff) < 0.02
+            # The filled corner matches the (noisy) background of the full render
+            corner = np.array(image.pixels[:]).reshape(64, 64, 4)[:8, :8]
+            reference_corner = np.array(reference.pixels[:]).reshape(64, 64, 4)[:8, :8]
+            assert np.allclose(
+                corner.mean(axis=(0, 1)), reference_corner.mean(axis=(0, 1)), atol=2 / 255
+            )
+
+def test_render_scene_cache(test_model_path, output_dir, configs):
+    """Test that a second render loads the prepared scene snapshot and matches the first."""
+    scene_cache_dir = os.path.join(output_dir, "scene_cache")
+    shutil.rmtree(scene_cache_dir, ignore_errors=True)
+    configs["render_config"] = RenderConfig(
+        resolution=64, samples=8, scene_cache_dir=scene_cache_dir
+    )
+    renders = []
+    for run in ("cold", "warm"):
+        renderer_with_configs = ModelRenderer(**configs)
+        run_dir = os.path.join(output_dir, f"scene_cache_{run}")
+        renderer_with_configs.render(test_model_path, run_dir)
+        renders.append((run_dir, renderer_with_configs.get_render_stats()))
+
+    (cold_dir, cold), (warm_dir, warm) = renders
+    assert not cold['scene_cache_hit'] and warm['scene_cache_hit']
+    assert cold['import_time_saved'] == 0.0 and warm['import_time_saved'] >= 0.0
+    assert warm['successful_renders'] == warm['total_renders'] > 0
+    filename = next(f for f in os.listdir(cold_dir) if f.endswith(".png"))
+    images = [bpy.data.images.load(os.path.join(d, filename)) for d in (cold_dir, warm_dir)]
+    diff = np.abs(np.array(images[0].pixels[:]) - np.array(images[1].pixels[:]))
+    assert np.mean(diff) < 0.01
+
+def test_render_lod_decimation(test_model_path, output_dir, configs):
+    """Test that sub-pixel detail is decimated and the frames still match."""
+    configs["render_config"] = RenderConfig(resolution=64, samples=8)
+    full_dir = os.path.join(output_dir, "lod_none")
+    ModelRenderer(**configs).render(test_model_path, full_dir)
+
+    configs["render_config"] = RenderConfig(
+        resolution=64, samples=8, lod_decimation=True, lod_max_error_px=2.0
+    )
+    renderer_with_configs = ModelRenderer(**configs)
+    lod_dir = os.path.join(output_dir, "lod")
+    renderer_with_configs.render(test_model_path, lod_dir)
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['successful_renders'] == stats['total_renders'] > 0
+    assert stats['lod']['triangles_after'] < stats['lod']['triangles_before']
+    assert stats['lod']['bvh_build_cost_saved'] > 0
+
+    filename = next(f for f in os.listdir(full_dir) if f.endswith(".png"))
+    images = [bpy.data.images.load(os.path.join(d, filename)) for d in (full_dir, lod_dir)]
+    diff = np.abs(np.array(images[0].pixels[:]) - np.array(images[1].pixels[:]))
+    assert np.mean(diff) < 0.02
+
+def test_render_downscale_textures(test_model_path, output_dir, configs):
+    """Test that textures shrink, are reused from the cache and frames still match."""
+    scene_cache_dir = os.path.join(output_dir, "texture_cache")
+    shutil.rmtree(scene_cache_dir, ignore_errors=True)
+    configs["render_config"] = RenderConfig(resolution=64, samples=8)
+    full_dir = os.path.join(output_dir, "textures_full")
+    ModelRenderer(**configs).render(test_model_path, full_dir)
+
+    configs["render_config"] = RenderConfig(
+        resolution=64, samples=8, downscale_textures=True, scene_cache_dir=scene_cache_dir
+    )
+    for run in ("cold", "warm"):
+        renderer_with_configs = ModelRenderer(**configs)
+        small_dir = os.path.join(output_dir, f"textures_{run}")
+        renderer_with_configs.render(test_model_path, small_dir)
+        stats = renderer_with_configs.get_render_stats()
+        assert stats['successful_renders'] == stats['total_renders'] > 0
+        textures = stats['textures']
+        assert textures['images_downscaled'] > 0
+        assert textures['texture_memory_after_mb'] < textures['texture_memory_before_mb']
+        assert textures['cache_hits'] == (textures['images_downscaled'] if run == "warm" else 0)
+
+    filename = next(f for f in os.listdir(full_dir) if f.endswith(".png"))
+    images = [bpy.data.images.load(os.path.join(d, filename)) for d in (full_dir, small_dir)]
+    diff = np.abs(np.array(images[0].pixels[:]) - np.array(images[1].pixels[:]))
+    assert np.mean(diff) < 0.02
+
+def test_render_bake_materials(output_dir, configs):
+    """Test that procedural materials are baked once, cached and look the same."""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.ops.mesh.primitive_uv_sphere_add(radius=2.0)
+    material = bpy.data.materials.new("Procedural")
+    if material.node_tree is None:
+        material.use_nodes = True
+    noise = material.node_tree.nodes.new('ShaderNodeTexNoise')
+    material.node_tree.links.new(
+        noise.outputs["Color"], material.node_tree.nodes["Principled BSDF"].inputs["Base Color"]
+    )
+    bpy.context.active_object.data.materials.append(material)
+    blend_path = os.path.join(output_dir, "procedural.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=blend_path)
+
+    scene_cache_dir = os.path.join(output_dir, "bake_cache")
+    shutil.rmtree(scene_cache_dir, ignore_errors=True)
+    configs["render_config"] = RenderConfig(resolution=64, samples=8, scene_cache_dir=scene_cache_dir)
+    procedural_dir = os.path.join(output_dir, "bake_none")
+    ModelRenderer(**configs).render(blend_path, procedural_dir)
+
+    configs["blend_config"] = BlendFileConfig(bake_materials=True, bake_resolution=256)
+    for run in ("cold", "warm"):
+        renderer_with_configs = ModelRenderer(**configs)
+        baked_dir = os.path.join(output_dir, f"bake_{run}")
+        renderer_with_configs.render(blend_path, baked_dir)
+        stats = renderer_with_configs.get_render_stats()
+        assert stats['successful_renders'] == stats['total_renders'] > 0
+        assert stats['bake']['materials_baked'] == 1
+        assert stats['bake']['cache_hits'] == (1 if run == "warm" else 0)
+
+    filename = next(f for f in os.listdir(procedural_dir) if f.endswith(".png"))
+    images = [bpy.data.images.load(os.path.join(d, filename)) for d in (procedural_dir, baked_dir)]
+    diff = np.abs(np.array(images[0].pixels[:]) - np.array(images[1].pixels[:]))
+    assert np.mean(diff) < 0.02
+
+    configs["blend_config"] = BlendFileConfig(
+        bake_materials=True, bake_resolution=64, bake_type="COMBINED"
+    )
+    renderer_with_configs = ModelRenderer(**configs)
+    renderer_with_configs.render(blend_path, os.path.join(output_dir, "bake_combined"))
+    assert renderer_with_configs.get_render_stats()['bake']['meshes_baked'] >= 1
+
+    # A failed bake leaves neither its UV layer nor its image behind
+    bpy.ops.wm.open_mainfile(filepath=blend_path)
+    sphere = next(obj for obj in bpy.context.scene.objects if obj.type == 'MESH')
+    sphere.hide_set(True)  # Hidden objects cannot be baked
+    assert bake_procedural_materials(bpy.context.scene, "DIFFUSE", 64)['meshes_baked'] == 0
+    assert BAKE_UV_NAME not in sphere.data.uv_layers
+    assert not any(image.name.endswith("_baked") for image in bpy.data.images)
+
+def test_render_chunked_custom_path(test_model_path, output_dir, configs):
+    """Test rendering views from a memory-mapped file in chunks, with resume."""
+    views = np.array([[0.0, 0.0], [90.0, 10.0], [180.0, 20.0], [270.0, 30.0], [45.0, 60.0]])
+    path_file = os.path.join(output_dir, "custom_views.npy")
+    np.save(path_file, views)
+    configs["camera_config"] = CameraConfig(
+        distance=20, camera_path_type=CameraPathType.CUSTOM, custom_path_file=path_file
+    )
+    configs["render_config"] = RenderConfig(resolution=32, samples=4, path_chunk_size=2)
+    custom_dir = os.path.join(output_dir, "custom_path")
+    shutil.rmtree(custom_dir, ignore_errors=True)
+    renderer_with_configs = ModelRenderer(**configs)
+    renderer_with_configs.render(test_model_path, custom_dir)
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['successful_renders'] == stats['total_renders'] == len(views)
+
+    positions = renderer_with_configs._generate_camera_positions()
+    expected = {renderer_with_configs._frame_filename(i, c) for i, c in enumerate(positions)}
+    assert expected == {f for f in os.listdir(custom_dir) if f.endswith(".png")}
+
+    renderer_with_configs.render(test_model_path, custom_dir, resume=True)
+    assert renderer_with_configs.get_render_stats()['skipped_renders'] == len(views)
+
+    # Each worker's shard is the same whether the path comes in chunks or not
+    renderer_with_configs._shard = (1, 3)
+    chunked = [
+        frame for start, chunk in renderer_with_configs._iter_camera_chunks()
+        for frame in renderer_with_configs._select_frames(chunk, start)
+    ]
+    assert chunked == shard_frames(list(enumerate(positions)), 1, 3)
+
+def test_render_lod_custom_path_radius(test_model_path, output_dir, configs):
+    """Test that LOD detail, and the frame hash, follow the closest view of a
+    custom path, not the configured distance."""
+    configs["render_config"] = RenderConfig(resolution=32, samples=4, lod_decimation=True)
+    densities, hashes = [], []
+    for closest in (20.0, 10.0):
+        path_file = os.path.join(output_dir, f"lod_views_{closest:.0f}.npy")
+        np.save(path_file, np.array([[20.0, 0.0, 0.0, 0.0], [closest, 90.0, 0.0, 0.0]]))
+        configs["camera_config"] = CameraConfig(
+            distance=20, camera_path_type=CameraPathType.CUSTOM, custom_path_file=path_file
+        )
+        renderer_with_configs = ModelRenderer(**configs)
+        renderer_with_configs.render(test_model_path, os.path.join(output_dir, "lod_custom"))
+        densities.append(renderer_with_configs.get_render_stats()['lod']['pixels_per_unit'])
+        hashes.append(renderer_with_configs._frame_config_hash(test_model_path))
+    assert densities[1] > 2 * densities[0]  # Closer than half the distance to the surface
+    assert hashes[0] != hashes[1]  # Frames of different detail never match
+
+def test_render_coverage_path(test_model_path, output_dir, configs):
+    """Test rendering the fewest views that cover the model's surface."""
+    configs["camera_config"] = CameraConfig(
+        distance=20, camera_path_type=CameraPathType.COVERAGE,
+        coverage_candidates=64, coverage_samples=256
+    )
+    configs["render_config"] = RenderConfig(resolution=32, samples=4)
+    coverage_dir = os.path.join(output_dir, "coverage_path")
+    shutil.rmtree(coverage_dir, ignore_errors=True)
+    renderer_with_configs = ModelRenderer(**configs)
+    renderer_with_configs.render(test_model_path, coverage_dir)
+    stats = renderer_with_configs.get_render_stats()
+    coverage = stats['coverage']
+    assert coverage['coverage'] >= coverage['coverage_target']
+    assert 0 < coverage['selected_views'] < coverage['candidate_views'] == 64
+    assert stats['successful_renders'] == stats['total_renders'] == coverage['selected_views']
+
+def test_render_deduplicated_path(test_model_path, output_dir, configs):
+    """Test skipping near-duplicate views of a path."""
+    configs["camera_config"] = CameraConfig(
+        distance=20, camera_path_type=CameraPathType.POLE_ROTATION,
+        sphere_coverage=SphereCoverage.HALF, dedup_tolerance=5.0, dedup_ignore_roll=True
+    )
+    configs["render_config"] = RenderConfig(resolution=32, samples=4)
+    dedup_dir = os.path.join(output_dir, "deduplicated_path")
+    shutil.rmtree(dedup_dir, ignore_errors=True)
+    renderer_with_configs = ModelRenderer(**configs)
+    renderer_with_configs.render(test_model_path, dedup_dir)
+    stats = renderer_with_configs.get_render_stats()
+    dedup = stats['deduplication']
+    assert dedup['input_views'] == 30 and dedup['renders_saved'] == 30 - dedup['kept_views']
+    assert stats['successful_renders'] == stats['total_renders'] == dedup['kept_views'] < 30
+
+def test_render_symmetry_aliasing(output_dir, configs):
+    """Test writing the views of a mirror-symmetric model as aliases."""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    corners = [(0, 2), (1, 0), (0, -1), (-1, 0)]  # A kite, mirrored across x = 0
+    mesh = bpy.data.meshes.new("Kite")
+    mesh.from_pydata(
+        [(x, y, z) for z in (-1, 1) for x, y in corners], [],
+        [(0, 1, 2, 3), (7, 6, 5, 4), (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0)]
+    )
+    bpy.context.scene.collection.objects.link(bpy.data.objects.new("Kite", mesh))
+    blend_path = os.path.join(output_dir, "kite.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=blend_path)
+
+    configs["camera_config"] = CameraConfig(
+        distance=8, camera_path_type=CameraPathType.ORBIT, camera_density=8
+    )
+    images = {}
+    for aliasing in (False, True):
+        configs["render_config"] = RenderConfig(
+            resolution=32, samples=8, symmetry_aliasing=aliasing
+        )
+        symmetry_dir = os.path.join(output_dir, f"symmetry_{aliasing}")
+        shutil.rmtree(symmetry_dir, ignore_errors=True)
+        renderer_with_configs = ModelRenderer(**configs)
+        renderer_with_configs.render(blend_path, symmetry_dir)
+        stats = renderer_with_configs.get_render_stats()
+        assert stats['successful_renders'] == stats['total_renders'] == 8
+        images[aliasing] = {
+            f: np.array(bpy.data.images.load(os.path.join(symmetry_dir, f)).pixels[:])
+            for f in os.listdir(symmetry_dir) if f.endswith(".png")
+        }
+
+    # Views 5-7 (azimuth 225-315) are mirror images of views 3-1
+    assert stats['symmetry']['mirror_azimuth'] == 0.0
+    assert stats['symmetry']['aliased_renders'] == 3
+    assert images[True].keys() == images[False].keys()
+    for filename, pixels in images[True].items():
+        assert np.abs(pixels - images[False][filename]).mean() < 0.01
+
+    renderer_with_configs.render(blend_path, symmetry_dir, resume=True)
+    assert renderer_with_configs.get_render_stats()['skipped_renders'] == 8
+
+def test_render_icosphere_refinement(test_model_path, output_dir, configs):
+    """Test that raising the icosphere level only renders the new views."""
+    configs["render_config"] = RenderConfig(resolution=32, samples=4)
+    icosphere_dir = os.path.join(output_dir, "icosphere")
+    shutil.rmtree(icosphere_dir, ignore_errors=True)
+    for level, resume in ((0, False), (1, True)):
+        configs["camera_config"] = CameraConfig(
+            distance=20, camera_path_type=CameraPathType.ICOSPHERE, icosphere_level=level
+        )
+        renderer_with_configs = ModelRenderer(**configs)
+        renderer_with_configs.render(test_model_path, icosphere_dir, resume=resume)
+    stats = renderer_with_configs.get_render_stats()
+    assert stats['total_renders'] == 42 and stats['skipped_renders'] == 12
+    assert stats['successful_renders'] == 30
+    assert len([f for f in os.listdir(icosphere_dir) if f.endswith(".png")]) == 42
+
+def test_render_adaptive_path(test_model_path, output_dir, configs):
+    """Test refining a coarse path where neighbouring probe images differ."""
+    configs["camera_config"] = CameraConfig(
+        distance=20, camera_path_type=CameraPathType.ADAPTIVE,
+        refine_level=0, refine_threshold=0.01, refine_budget=20
+    )
+    configs["render_config"] = RenderConfig(resolution=64, samples=4)
+    adaptive_dir = os.path.join(output_dir, "adaptive_path")
+    shutil.rmtree(adaptive_dir, ignore_errors=True)
+    renderer_with_configs = ModelRenderer(**configs)
+    renderer_with_configs.render(test_model_path, adaptive_dir)
+    stats = renderer_with_configs.get_render_stats()
+    refinement = stats['refinement']
+    assert refinement['coarse_views'] == 12 and 0 < refinement['added_views'] <= 8
+    assert stats['successful_renders'] == stats['total_renders'] == 12 + refinement['added_views']
+    # Frames are rendered at full resolution after the low-resolution probes
+    filename = next(f for f in os.listdir(adaptive_dir) if f.endswith(".png"))
+    assert tuple(bpy.data.images.load(os.path.join(adaptive_dir, filename)).size) == (64, 64)
@@ -0,0 +1,44 @@
+# tests/utils/test_autotune.py
+import numpy as np
+
+from renderer.utils.autotune import (
+    AutotuneCache,
+    SampleAutotuner,
+    SampleSettings,
+    probe_indices,
+    sample_ladder,
+)
+
+def test_sample_ladder_ends_at_reference():
+    """Test that the ladder doubles samples, loosens thresholds and ends at the reference."""
+    ladder = sample_ladder(128)
+    assert [s.samples for s in ladder] == [8, 16, 32, 64, 128]
+    assert ladder[-1].adaptive_threshold == 0.01
+    thresholds = [s.adaptive_threshold for s in ladder]
+    assert thresholds == sorted(thresholds, reverse=True)
+    assert sample_ladder(4) == [SampleSettings(4, 0.01)]
+
+def test_probe_indices_spread_along_path():
+    """Test that probe views are distinct and spread over the path."""
+    assert probe_indices(12, 3) == [0, 4, 8]
+    assert probe_indices(2, 5) == [0, 1]
+    assert probe_indices(0, 3) == []
+
+def test_autotuner_picks_cheapest_settings_meeting_target():
+    """Test that the first ladder step within the noise target is chosen."""
+    reference = np.full((4, 4, 4), 0.5, dtype=np.float32)
+
+    def render(settings):
+        noise = 0.2 / np.sqrt(settings.samples) if settings.samples < 128 else 0.0
+        return [reference + noise]
+
+    tuner = SampleAutotuner(128, noise_target=0.03)
+    assert tuner.tune(render).samples == 64
+    assert set(tuner.errors) == {8, 16, 32, 64}
+    assert SampleAutotuner(128, noise_target=1e-6).tune(render).samples == 128
+
+def test_autotune_cache_round_trip(tmp_path):
+    """Test that chosen settings persist across cache instances."""
+    AutotuneCache(str(tmp_path)).put("key", SampleSettings(32, 0.02))
+    assert AutotuneCache(str(tmp_path)).get("key") == SampleSettings(32, 0.02)
+    assert AutotuneCache(str(tmp_path)).get("other") is None
@@ -0,0 +1,42 @@
+# tests/utils/test_border.py
+import numpy as np
+
+from renderer.utils.border import (
+    border_region,
+    fill_outside_region,
+    region_area,
+    region_pixels,
+    union_region,
+)
+
+def test_border_region_pads_and_clamps():
+    """Test that the region is padded, clamped to the frame and skipped when useless."""
+    view = np.array([[0.4, 0.45, 5.0], [0.6, 0.55, 5.0]])
+    assert np.allclose(border_region(view, 0.05), (0.35, 0.4, 0.65, 0.6))
+    assert np.allclose(
+        border_region(np.array([[0.0, 0.0, 5.0], [0.2, 0.2, 5.0]]), 0.1), (0.0, 0.0, 0.3, 0.3)
+    )
+    assert border_region(np.array([[0.05, 0.05, 5.0], [0.95, 0.95, 5.0]]), 0.0) is None
+    assert border_region(np.array([[0.4, 0.4, 5.0], [0.6, 0.6, -1.0]]), 0.0) is None
+
+def test_union_and_area():
+    """Test that regions combine and that a missing region means the whole frame."""
+    assert union_region([(0.1, 0.2, 0.3, 0.4), (0.2, 0.1, 0.5, 0.3)]) == (0.1, 0.1, 0.5, 0.4)
+    assert union_region([(0.1, 0.2, 0.3, 0.4), None]) is None
+    assert region_area(None) == 1.0
+    assert np.isclose(region_area((0.0, 0.0, 0.5, 0.5)), 0.25)
+
+def test_fill_outside_region_uses_background():
+    """Test that pixels outside the region take the background value, even
+    where the model touches the region's corner."""
+    region = (0.25, 0.5, 0.75, 1.0)  # Top half, middle columns
+    left, top, right, bottom = region_pixels(region, 8, 8)
+    assert (left, top, right, bottom) == (2, 0, 6, 4)
+
+    pixels = np.zeros((8, 8, 4), dtype=np.uint8)
+    pixels[top:bottom, left:right] = 200
+    pixels[2, 3] = 17  # Model
+    pixels[top, left] = 90  # Model reaching the region's corner
+    fill_outside_region(pixels, region, (200, 200, 200, 255))
+    assert np.all(pixels[6] == (200, 200, 200, 255)) and np.all(pixels[:, 0] == (200, 200, 200, 255))
+    assert np.all(pixels[2, 3] == 17) and np.all(pixels[top, left] == 90)
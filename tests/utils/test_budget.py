@@ -0,0 +1,27 @@
+# tests/utils/test_budget.py
+from renderer.utils.budget import plan_budget
+
+def test_plan_keeps_settings_within_budget():
+    """Test that a path that already fits the budget is left unchanged."""
+    plan = plan_budget(100.0, 10, 1.0, samples=128, use_denoising=False)
+    assert (plan.samples, plan.resolution_percentage, plan.use_denoising) == (128, 100, False)
+    assert not plan.degraded
+
+def test_plan_lowers_samples_before_resolution():
+    """Test that samples absorb a moderate overrun and resolution a large one."""
+    plan = plan_budget(9.0 / 0.9 * 0.5, 9, 1.0, samples=128, use_denoising=False)
+    assert plan.samples == 64
+    assert plan.resolution_percentage == 100
+    assert plan.use_denoising and plan.degraded
+    assert plan.time_limit == 0.5
+
+    plan = plan_budget(1.0, 100, 1.0, samples=128, use_denoising=True)
+    assert plan.samples == 4
+    assert plan.resolution_percentage < 100
+
+def test_plan_respects_floors():
+    """Test that an exhausted budget bottoms out at the minimum settings."""
+    plan = plan_budget(-5.0, 10, 1.0, samples=128, use_denoising=True)
+    assert plan.samples == 4
+    assert plan.resolution_percentage == 25
+    assert plan.degraded and plan.time_limit == 0
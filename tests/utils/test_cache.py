@@ -0,0 +1,51 @@
+# tests/utils/test_cache.py
+import os
+
+from renderer.utils.cache import RenderCache
+from renderer.utils.coordinates import SphericalCoordinate
+
+def _write_frame(path, size):
+    with open(path, "wb") as file:
+        file.write(b"x" * size)
+
+def test_cache_hit_and_miss(tmp_path):
+    """Test that stored frames are fetched on a hit and counted."""
+    cache = RenderCache(str(tmp_path / "cache"), max_size_bytes=1024)
+    key = RenderCache.frame_key("hash", SphericalCoordinate(5.0, 90.0, 0.0))
+    assert key != RenderCache.frame_key("hash", SphericalCoordinate(5.0, 45.0, 0.0))
+
+    assert not cache.fetch(key, str(tmp_path / "out.png"))
+    _write_frame(tmp_path / "frame.png", 10)
+    cache.store(key, str(tmp_path / "frame.png"))
+    assert cache.fetch(key, str(tmp_path / "out.png"))
+    assert (tmp_path / "out.png").read_bytes() == b"x" * 10
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test that the oldest frames are evicted once the size limit is exceeded."""
+    cache = RenderCache(str(tmp_path / "cache"), max_size_bytes=250)
+    keys = [RenderCache.frame_key("hash", SphericalCoordinate(1.0, az, 0.0)) for az in range(3)]
+    for n, key in enumerate(keys):
+        frame = tmp_path / f"frame_{n}.png"
+        _write_frame(frame, 100)
+        cache.store(key, str(frame))
+        os.utime(cache._path(key), (n, n))  # Deterministic access order
+
+    cache.evict()
+    assert not os.path.exists(cache._path(keys[0]))
+    assert os.path.exists(cache._path(keys[2]))
+
+def test_cache_lookup_with_suffix(tmp_path):
+    """Test that entries with another suffix are looked up in place and evicted."""
+    cache = RenderCache(str(tmp_path / "cache"), max_size_bytes=150, suffix=".blend")
+    assert cache.lookup("ab12") is None
+    _write_frame(tmp_path / "scene.blend", 100)
+    cache.store("ab12", str(tmp_path / "scene.blend"))
+    assert cache.lookup("ab12") == cache._path("ab12")
+    assert cache._path("ab12").endswith("ab12.blend")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    _write_frame(tmp_path / "other.blend", 100)
+    os.utime(cache._path("ab12"), (0, 0))
+    cache.store("cd34", str(tmp_path / "other.blend"))
+    assert cache.lookup("ab12") is None
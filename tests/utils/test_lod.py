@@ -0,0 +1,35 @@
+import math
+
+import numpy as np
+
+from renderer.utils.lod import (
+    MIN_LOD_TRIANGLES,
+    bvh_build_cost,
+    lod_ratio,
+    pixels_per_unit,
+    surface_area,
+)
+
+def test_pixels_per_unit():
+    """Test the projected size of a world unit for a 90 degree field of view."""
+    assert math.isclose(pixels_per_unit(10.0, math.radians(90.0), 200), 10.0)
+    assert pixels_per_unit(0.0, math.radians(90.0), 200) == math.inf
+
+def test_surface_area():
+    """Test the area of a unit square split into two triangles."""
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=np.float64)
+    assert math.isclose(surface_area(vertices, np.array([[0, 1, 2], [0, 2, 3]])), 1.0)
+
+def test_lod_ratio():
+    """Test that only meshes much denser than the visible detail are decimated."""
+    # 1 unit^2 at 10 px/unit tiles into ~231 one-pixel triangles
+    assert math.isclose(lod_ratio(100000, 1.0, 10.0, 1.0), 100 / 0.433 / 100000, rel_tol=1e-2)
+    assert lod_ratio(240, 1.0, 10.0, 1.0) == 1.0  # Not worth decimating
+    assert lod_ratio(100000, 1.0, math.inf, 1.0) == 1.0  # Camera inside the model
+    assert lod_ratio(100000, 1e-6, 10.0, 1.0) == MIN_LOD_TRIANGLES / 100000
+    assert lod_ratio(100000, 1.0, 10.0, 2.0) < lod_ratio(100000, 1.0, 10.0, 1.0)
+
+def test_bvh_build_cost():
+    """Test that the BVH cost grows faster than the triangle count."""
+    assert bvh_build_cost(1) == 0.0
+    assert bvh_build_cost(2000) > 2 * bvh_build_cost(1000)
@@ -0,0 +1,111 @@
+# tests/utils/test_manifest.py
+import json
+import os
+
+from renderer.config import RenderConfig, LightingConfig
+from renderer.utils.coordinates import SphericalCoordinate
+from renderer.utils.hashing import config_hash
+from renderer.utils.manifest import RenderManifest, MANIFEST_FILENAME
+
+def _write_frame(directory, filename, content=b"frame"):
+    with open(os.path.join(directory, filename), "wb") as file:
+        file.write(content)
+
+def test_config_hash_ignores_runtime_fields():
+    """Test that execution-only settings do not change the config hash."""
+    base = config_hash(RenderConfig(resolution=64), LightingConfig())
+    assert base == config_hash(RenderConfig(resolution=64, workers=4), LightingConfig())
+    assert base != config_hash(RenderConfig(resolution=128), LightingConfig())
+
+def test_manifest_round_trip(tmp_path):
+    """Test that recorded frames are complete after reloading the manifest."""
+    coord = SphericalCoordinate(5.0, 90.0, 10.0)
+    _write_frame(tmp_path, "frame.png")
+    manifest = RenderManifest(str(tmp_path), "hash")
+    manifest.record(0, coord, "frame.png")
+    manifest.flush()
+
+    with open(tmp_path / MANIFEST_FILENAME) as file:
+        assert json.loads(file.readlines()[1])["size"] == 5
+
+    reloaded = RenderManifest(str(tmp_path), "hash")
+    assert reloaded.is_complete("frame.png", coord)
+    assert not reloaded.is_complete("frame.png", SphericalCoordinate(5.0, 91.0, 10.0))
+    assert not RenderManifest(str(tmp_path), "other").is_complete("frame.png", coord)
+
+    _write_frame(tmp_path, "frame.png", b"fra")  # Partially written frame
+    assert not reloaded.is_complete("frame.png", coord)
+
+    # Same-size corruption is only caught by verifying checksums
+    _write_frame(tmp_path, "frame.png", b"fraME")
+    assert reloaded.is_complete("frame.png", coord)
+    assert not RenderManifest(str(tmp_path), "hash", verify_checksums=True).is_complete("frame.png", coord)
+
+def test_manifest_journal(tmp_path):
+    """Test that flushes append lines, and that a cut-off line is ignored."""
+    manifest = RenderManifest(str(tmp_path), "hash")
+    for i in range(3):
+        _write_frame(tmp_path, f"frame_{i}.png")
+        manifest.record(i, SphericalCoordinate(1.0, i, 0.0), f"frame_{i}.png")
+        manifest.flush()
+    manifest.record(0, SphericalCoordinate(1.0, 0.0, 0.0), "frame_0.png")  # Rendered again
+    manifest.flush()
+    with open(tmp_path / MANIFEST_FILENAME) as file:
+        lines = file.readlines()
+    assert len(lines) == 5 and json.loads(lines[0]) == {"version": 2}
+
+    with open(tmp_path / MANIFEST_FILENAME, "a") as file:
+        file.write('{"index": 3, "coord')  # Crash while appending
+    reloaded = RenderManifest(str(tmp_path), "hash")
+    assert len(reloaded) == 3 and "frame_0.png" in reloaded
+    assert len(RenderManifest(str(tmp_path), "other")) == 0
+
+    # Compaction leaves one line per frame
+    reloaded.consolidate()
+    with open(tmp_path / MANIFEST_FILENAME) as file:
+        assert len(file.readlines()) == 4
+
+def test_manifest_reads_legacy_json(tmp_path):
+    """Test resuming from, and then replacing, a manifest.json of version 1."""
+    coord = SphericalCoordinate(5.0, 90.0, 10.0)
+    _write_frame(tmp_path, "frame.png")
+    entry = {
+        "index": 0, "coordinate": {"radius": 5.0, "azimuth": 90.0, "elevation": 10.0, "roll": 0.0},
+        "path": "frame.png", "size": 5, "checksum": None, "config_hash": "hash",
+    }
+    with open(tmp_path / "manifest.json", "w") as file:
+        json.dump({"version": 1, "frames": {"frame.png": entry}}, file)
+    manifest = RenderManifest(str(tmp_path), "hash")
+    assert manifest.is_complete("frame.png", coord)
+    manifest.flush()
+    assert sorted(os.listdir(tmp_path)) == ["frame.png", MANIFEST_FILENAME]
+    assert RenderManifest(str(tmp_path), "hash").is_complete("frame.png", coord)
+
+def test_manifest_consolidates_shards(tmp_path):
+    """Test that shard manifests are merged into the main manifest."""
+    for shard in range(2):
+        _write_frame(tmp_path, f"frame_{shard}.png")
+        manifest = RenderManifest(str(tmp_path), "hash", shard=shard)
+        manifest.record(shard, SphericalCoordinate(1.0, shard, 0.0), f"frame_{shard}.png")
+        manifest.flush()
+
+    RenderManifest(str(tmp_path), "hash").consolidate()
+    assert sorted(os.listdir(tmp_path)) == ["frame_0.png", "frame_1.png", MANIFEST_FILENAME]
+    assert len(RenderManifest(str(tmp_path), "hash")) == 2
+
+def test_manifest_pending_aliases(tmp_path):
+    """Test that aliases are incomplete until their copy is recorded."""
+    coord = SphericalCoordinate(5.0, 270.0, 0.0)
+    manifest = RenderManifest(str(tmp_path), "hash")
+    manifest.record_alias(1, coord, "alias.png", "frame.png", mirrored=True)
+    manifest.flush()
+
+    reloaded = RenderManifest(str(tmp_path), "hash")
+    assert [name for name, _ in reloaded.pending_aliases()] == ["alias.png"]
+    _write_frame(tmp_path, "alias.png")
+    assert not reloaded.is_complete("alias.png", coord)
+
+    reloaded.record(1, coord, "alias.png", alias_of="frame.png", mirrored=True)
+    assert reloaded.pending_aliases() == []
+    assert reloaded.is_complete("alias.png", coord)
+    assert reloaded.entry("alias.png")["alias_of"] == "frame.png"
@@ -0,0 +1,73 @@
+import numpy as np
+
+from renderer.camera import CameraPath
+from renderer.utils.symmetry import (
+    Symmetry,
+    SymmetryAliases,
+    detect_symmetry,
+    lighting_symmetry,
+    rotate_azimuth
+)
+
+def _prism(corners):
+    """Vertices of a vertical prism over (x, y) corners."""
+    corners = np.asarray(corners, dtype=np.float64)
+    return np.concatenate([np.column_stack([corners, np.full(len(corners), z)]) for z in (-1.0, 1.0)])
+
+def test_detect_symmetry():
+    """Test finding rotation orders and mirror planes of vertex clouds."""
+    square = detect_symmetry(_prism([(1, 1), (1, -1), (-1, -1), (-1, 1)]), 0.005)
+    assert square.rotation_order == 4 and square.mirror_azimuth is not None
+
+    kite = detect_symmetry(_prism([(0, 2), (1, 0), (0, -1), (-1, 0)]), 0.005)
+    assert kite == Symmetry(1, 0.0)
+
+    points = np.random.default_rng(1).normal(size=(200, 3))
+    assert detect_symmetry(points, 0.005).trivial
+
+    # Materials must map onto the same materials
+    hexagon = _prism([(np.sin(a), np.cos(a)) for a in np.radians(np.arange(0, 360, 60))])
+    assert detect_symmetry(hexagon, 0.005).rotation_order == 6
+    labels = np.tile([0, 1, 0, 1, 0, 1], 2)
+    assert detect_symmetry(hexagon, 0.005, labels).rotation_order == 3
+
+def test_canonical_views_and_aliases():
+    """Test mapping views into the fundamental domain and finding aliases."""
+    orbit = CameraPath(10.0, np.arange(8) * 45.0, 0.0, 5.0)
+    canonical, mirrored = Symmetry(1, 0.0).canonical(orbit)
+    assert canonical.azimuth.tolist() == [0, 45, 90, 135, 180, 135, 90, 45]
+    assert mirrored.tolist() == [False] * 5 + [True] * 3
+    assert canonical.roll.tolist() == [5.0] * 5 + [-5.0] * 3
+
+    aliases = SymmetryAliases(Symmetry(4))
+    first = aliases.add(0, orbit[:4])
+    second = aliases.add(4, orbit[4:])
+    assert first == {2: (0, orbit[0], False), 3: (1, orbit[1], False)}
+    assert sorted(second) == [4, 5, 6, 7] and second[7] == (1, orbit[1], False)
+
+    # Mirror images of views with roll are views with the opposite roll
+    assert SymmetryAliases(Symmetry(1, 0.0)).add(0, orbit) == {}
+    orbit.roll[:] = 0.0
+    assert SymmetryAliases(Symmetry(1, 0.0)).add(0, orbit) == {
+        5: (3, orbit[3], True), 6: (2, orbit[2], True), 7: (1, orbit[1], True)
+    }
+
+def test_lighting_symmetry():
+    """Test keeping only the symmetry that the lights share."""
+    square = Symmetry(4, 0.0)
+    overhead = np.array([[0.0, 0.0, 5.0, 0.0, 0.0, -1.0]])
+    assert lighting_symmetry(square, lambda azimuth: overhead) == square
+
+    one_side = np.array([[5.0, 0.0, 3.0, -1.0, 0.0, 0.0]])
+    assert lighting_symmetry(square, lambda azimuth: one_side) == Symmetry(1, 90.0)
+
+    opposite = np.concatenate([one_side, -one_side * [1, 1, -1, 1, 1, -1]])
+    assert lighting_symmetry(square, lambda azimuth: opposite) == Symmetry(2, 0.0)
+
+    def following(azimuth):
+        """A light that stays to the camera's right."""
+        return np.concatenate(
+            [rotate_azimuth(one_side[:, :3], azimuth), rotate_azimuth(one_side[:, 3:], azimuth)],
+            axis=1
+        )
+    assert lighting_symmetry(square, following) == Symmetry(4)
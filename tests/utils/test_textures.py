@@ -0,0 +1,12 @@
+from renderer.utils.textures import mip_size, peak_memory_mb
+
+def test_mip_size():
+    """Test that images are halved while the larger side stays above the need."""
+    assert mip_size((4096, 4096), 300) == (512, 512)
+    assert mip_size((4096, 1024), 2048) == (2048, 512)
+    assert mip_size((1024, 1024), 2000) == (1024, 1024)
+    assert mip_size((8, 2), 0.5) == (4, 1)
+
+def test_peak_memory_mb():
+    """Test that the peak resident memory is reported on this platform."""
+    assert peak_memory_mb() > 0